@@ -0,0 +1,202 @@
+import math
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+import config
+import metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows 没有 fcntl，只能在进程内限流
+    fcntl = None
+
+# 过载时的处理方式
+POLICY_REJECT = 'reject'
+POLICY_DEGRADE = 'degrade'
+
+
+class AdmissionRejected(Exception):
+    """模型调用未获准入：排队已满或排队超时"""
+
+    def __init__(self, message, reason, retry_after):
+        super().__init__(message)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _LocalSlots:
+    """进程内的名额计数（单进程部署或不支持文件锁的平台）"""
+
+    poll_interval = None
+
+    def __init__(self, count):
+        self.count = count
+        self._held = 0
+
+    def try_acquire(self):
+        if self._held >= self.count:
+            return None
+        self._held += 1
+        return self._held
+
+    def release(self, token):
+        self._held -= 1
+
+
+class _FileSlots:
+    """跨进程共享的名额：目录下的 count 个锁文件，持有某个文件的排他锁即占用一个名额
+
+    同一台机器上所有工作进程（以及共用该目录的其他实例）共享名额，与工作进程数无关；
+    持有名额的进程退出或被杀掉时，操作系统自动释放文件锁，名额不会泄漏。
+    """
+
+    # 其他进程释放名额时不会通知本进程，排队的调用按此间隔（秒）重试
+    poll_interval = 0.05
+
+    def __init__(self, count, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.count = count
+        self._paths = [os.path.join(directory, f'slot-{i}.lock') for i in range(count)]
+
+    def try_acquire(self):
+        """尝试占用任一空闲名额，返回持有锁的文件描述符；全部被占用时返回 None"""
+        for path in self._paths:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                continue
+            return fd
+        return None
+
+    def release(self, token):
+        os.close(token)
+
+
+class AdmissionLimiter:
+    """模型调用的准入控制：限制同时在途的调用数，超出的调用在有界队列中排队
+
+    - 在途调用数达到 max_concurrent 时新调用排队；给定 slot_dir 时名额由目录下的文件锁实现，
+      限额对共用该目录的所有进程生效，否则只在本进程内生效
+    - 排队（本进程内）达到 max_queue 时立即拒绝（queue_full），排队超过 queue_timeout 秒也拒绝（timeout）
+    - 名额空出时由排队的调用竞争获得，不保证先到先得
+    - 拒绝时根据最近调用的平均耗时估算建议的重试等待时间
+    """
+
+    def __init__(self, max_concurrent=4, max_queue=16, queue_timeout=30, slot_dir=None):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        if slot_dir and fcntl is not None:
+            self._slots = _FileSlots(self.max_concurrent, slot_dir)
+        else:
+            self._slots = _LocalSlots(self.max_concurrent)
+        self._cond = threading.Condition()
+        # 本进程持有的名额；名额之间没有区别，归还时任取一个
+        self._held = []
+        self._waiting = 0
+        # 调用耗时的指数移动平均（秒），用于估算 Retry-After
+        self._avg_hold = None
+        if self.shared:
+            os.register_at_fork(after_in_child=self._forget_held)
+
+    def _forget_held(self):
+        """fork 出的子进程（如批量渲染进程）关闭继承的锁文件，否则父进程归还后名额仍被占用"""
+        for token in self._held:
+            self._slots.release(token)
+        self._held = []
+
+    @property
+    def shared(self):
+        """名额是否跨进程共享"""
+        return isinstance(self._slots, _FileSlots)
+
+    def _reject(self, reason, message):
+        metrics.LLM_ADMISSION_REJECTED.inc(reason=reason)
+        return AdmissionRejected(message, reason, self._retry_after())
+
+    def _retry_after(self):
+        if self._avg_hold is None:
+            return 1
+        return max(1, math.ceil(self._avg_hold * (self._waiting + 1) / self.max_concurrent))
+
+    def acquire(self):
+        """
+        获取一个调用名额，返回排队等待的秒数
+
+        :raises AdmissionRejected: 排队已满或等待超时
+        """
+        start = time.perf_counter()
+        with self._cond:
+            token = self._slots.try_acquire()
+            if token is None:
+                if self._waiting >= self.max_queue:
+                    raise self._reject('queue_full', f"模型调用排队已满（在途 {len(self._held)}，排队 {self._waiting}）")
+                deadline = start + self.queue_timeout
+                self._waiting += 1
+                try:
+                    while token is None:
+                        remaining = deadline - time.perf_counter()
+                        if remaining <= 0:
+                            raise self._reject('timeout', f"模型调用排队超过 {self.queue_timeout:g} 秒")
+                        interval = self._slots.poll_interval
+                        self._cond.wait(remaining if interval is None else min(remaining, interval))
+                        token = self._slots.try_acquire()
+                finally:
+                    self._waiting -= 1
+            self._held.append(token)
+        waited = time.perf_counter() - start
+        metrics.LLM_QUEUE_WAIT_SECONDS.observe(waited)
+        return waited
+
+    def release(self, held=None):
+        """归还名额；held 为本次调用占用名额的秒数"""
+        with self._cond:
+            self._slots.release(self._held.pop())
+            if held is not None:
+                self._avg_hold = held if self._avg_hold is None else 0.8 * self._avg_hold + 0.2 * held
+            self._cond.notify()
+
+    @contextmanager
+    def slot(self):
+        """占用一个调用名额的上下文"""
+        self.acquire()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release(time.perf_counter() - start)
+
+    def stats(self):
+        """在途与排队数只统计本进程；max_concurrent 在 shared 为 True 时是所有进程共享的限额"""
+        with self._cond:
+            return {
+                'max_concurrent': self.max_concurrent,
+                'max_queue': self.max_queue,
+                'shared': self.shared,
+                'in_flight': len(self._held),
+                'queued': self._waiting
+            }
+
+
+_limiter_lock = threading.Lock()
+_limiter = None
+
+
+def get_admission_limiter():
+    """获取模型调用准入控制（名额默认通过临时目录下的文件锁在本机所有进程间共享）"""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = AdmissionLimiter(
+                    max_concurrent=config.LLM_MAX_CONCURRENCY,
+                    max_queue=config.LLM_MAX_QUEUE,
+                    queue_timeout=config.LLM_QUEUE_TIMEOUT,
+                    slot_dir=config.LLM_SLOT_DIR or os.path.join(tempfile.gettempdir(), 'meeting-llm-slots')
+                )
+    return _limiter
@@ -1,82 +1,207 @@
-from flask import Flask, request, send_file, jsonify
+from flask import Blueprint, Flask, Response, g, request, send_file, jsonify, stream_with_context, url_for
 from flask_cors import CORS
-import subprocess
-import re
-import os
+import io
+import json
+import logging
+import math
 import time
-from word_generator import WordMeetingGenerator
+import config
+import metrics
+from metrics import stage_timer, timed_call
+from word_generator import create_document_generator
+import regex_patterns as rp
+from regex_patterns import RegexHelper
+from topic_index import build_topic_index
+from keyword_matcher import get_meeting_type_matcher
+from meeting_classifier import get_meeting_classifier
+from ollama_client import get_ollama_client, OllamaTimeout
+from llm_cache import get_llm_cache
+from doc_cache import document_cache_key, get_document_cache
+from document_store import persist_document
+from batch import stream_batch_zip
+from chunked_extraction import extract_chunked, stream_chunked
+from speculation import race_extraction
+from admission import POLICY_REJECT, AdmissionRejected, get_admission_limiter
+from roster import KIND_PERSON, get_roster
+from linear_scan import field_patterns, preparation_patterns, strip_preamble
+from parse_limits import InputTooLarge, ParseDeadline, ParseLimitExceeded, ParseTimeout, check_input_size
+from live_session import LiveSession, SessionOffsetMismatch, SessionTooLarge, get_session_store
+from jobs import JOB_DONE, JOB_FAILED, JobQueueFull, get_job_queue
+from result_store import BASIC_FIELDS, empty_meeting_info, normalize_meeting_info, get_extraction_store
+from warmup import get_warmup_state, start_ollama_warmup, warm_up_local
 
-app = Flask(__name__)
-CORS(app)
+logging.basicConfig(
+    level=getattr(logging, config.LOG_LEVEL.upper(), logging.INFO),
+    format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+)
+logger = logging.getLogger(__name__)
 
-class RegexHelper:
-    """正则表达式辅助类"""
-    @staticmethod
-    def safe_search(pattern, text, flags=0):
-        try:
-            return re.search(pattern, text, flags)
-        except re.error as e:
-            print(f"正则表达式错误: {pattern}, {e}")
-            return None
-    
-    @staticmethod
-    def safe_sub(pattern, repl, text, flags=0):
-        try:
-            return re.sub(pattern, repl, text, flags)
-        except re.error as e:
-            print(f"正则表达式替换错误: {e}")
-            return text
-    
-    @staticmethod
-    def safe_split(pattern, text, maxsplit=0, flags=0):
-        try:
-            return re.split(pattern, text, maxsplit=maxsplit, flags=flags)
-        except re.error as e:
-            print(f"正则表达式分割错误: {e}")
-            return [text]
-    
-    @staticmethod
-    def safe_findall(pattern, text, flags=0):
-        try:
-            return re.findall(pattern, text, flags=flags)
-        except re.error as e:
-            print(f"正则表达式查找错误: {e}")
-            return []
+bp = Blueprint('meeting', __name__)
+
+DOCX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+# 竞速模式下模型状态对应的提取路径（metrics.EXTRACTIONS 的 path 标签）
+RACE_EXTRACTION_PATHS = {'done': 'llm', 'pending': 'llm_pending', 'busy': 'llm_busy',
+                         'rejected': 'llm_rejected', 'failed': 'llm_failed'}
+
+@bp.before_app_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
 
-def call_ollama(prompt, model="llama3"):
-    """调用本地 Ollama 模型"""
+@bp.after_app_request
+def _record_request_metrics(response):
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    started = g.get('request_started')
+    if started is not None:
+        metrics.REQUEST_SECONDS.observe(time.perf_counter() - started, endpoint=endpoint)
+    metrics.REQUESTS.inc(endpoint=endpoint, method=request.method, status=response.status_code)
+    return response
+
+@bp.errorhandler(ParseLimitExceeded)
+def _parse_limit_exceeded(e):
+    # 文本过长返回 413；解析超时说明文本过于复杂，重试也无济于事，返回 422
+    return jsonify({"error": str(e)}), 413 if isinstance(e, InputTooLarge) else 422
+
+@metrics.REGISTRY.register_collector
+def _collect_runtime_metrics():
+    """导出时读取缓存与任务队列的现有统计"""
+    families = []
+    cache = get_llm_cache()
+    if cache is not None:
+        stats = cache.stats()
+        families.append(('meeting_llm_cache_lookups_total', 'counter', 'LLM 响应缓存查询次数（按结果）', [
+            ({'result': 'memory_hit'}, stats['memory_hits']),
+            ({'result': 'disk_hit'}, stats['disk_hits']),
+            ({'result': 'miss'}, stats['misses'])
+        ]))
+        families.append(('meeting_llm_cache_entries', 'gauge', 'LLM 响应缓存内存层条目数',
+                         [({}, stats['memory_entries'])]))
+    doc_cache = get_document_cache()
+    if doc_cache is not None:
+        stats = doc_cache.stats()
+        families.append(('meeting_document_cache_lookups_total', 'counter', '文档缓存查询次数（按结果）', [
+            ({'result': 'memory_hit'}, stats['memory_hits']),
+            ({'result': 'disk_hit'}, stats['disk_hits']),
+            ({'result': 'miss'}, stats['misses'])
+        ]))
+        families.append(('meeting_document_cache_bytes', 'gauge', '文档缓存内存层占用字节数',
+                         [({}, stats['memory_bytes'])]))
+    admission = get_admission_limiter().stats()
+    families.append(('meeting_llm_in_flight', 'gauge', '在途的模型调用数', [({}, admission['in_flight'])]))
+    families.append(('meeting_llm_queued', 'gauge', '等待准入的模型调用数', [({}, admission['queued'])]))
+    job_stats = get_job_queue().stats()
+    families.append(('meeting_job_queue_depth', 'gauge', '排队中的异步任务数',
+                     [({}, job_stats['queue_depth'])]))
+    families.append(('meeting_jobs', 'gauge', '保留中的异步任务数（按状态）',
+                     [({'status': status}, count) for status, count in sorted(job_stats['jobs'].items())]))
+    return families
+
+def call_ollama(prompt, model=None):
+    """调用本地 Ollama 模型（HTTP API 或命令行，见 config.OLLAMA_BACKEND）"""
+    model = model or config.OLLAMA_MODEL
+    cache = get_llm_cache()
+    if cache is not None:
+        cached = cache.get(prompt, model)
+        if cached is not None:
+            metrics.OLLAMA_CALLS.inc(outcome='cache_hit')
+            return cached
+    limiter = get_admission_limiter()
     try:
-        result = subprocess.run(
-            ["ollama", "run", model],
-            input=prompt.encode("utf-8"),
-            capture_output=True,
-            timeout=120
-        )
-        output = result.stdout.decode("utf-8", errors="ignore")
+        # 未获准入时抛出 AdmissionRejected，由调用方按 LLM_OVERLOAD_POLICY 处理
+        limiter.acquire()
+    except AdmissionRejected:
+        metrics.OLLAMA_CALLS.inc(outcome='rejected')
+        raise
+    start = time.perf_counter()
+    try:
+        with stage_timer('ollama'):
+            output = get_ollama_client().generate(prompt, model)
+        metrics.OLLAMA_CALLS.inc(outcome='ok')
         if output:
-            output = RegexHelper.safe_sub(r'^.*?---', '', output, re.DOTALL)
-        return output.strip() if output else ""
-    except subprocess.TimeoutExpired:
+            output = strip_preamble(output)
+        output = output.strip() if output else ""
+        # 只缓存成功的响应，超时和错误不缓存
+        if output and cache is not None:
+            cache.set(prompt, model, output)
+        return output
+    except OllamaTimeout:
+        metrics.OLLAMA_CALLS.inc(outcome='timeout')
+        logger.warning("调用Ollama超时")
         return "模型响应超时，请检查 Ollama 是否正常运行。"
     except Exception as e:
-        print(f"调用Ollama详细错误: {e}")
+        metrics.OLLAMA_CALLS.inc(outcome='error')
+        logger.error("调用Ollama详细错误: %s", e)
         return f"调用 Ollama 出错：{str(e)}"
+    finally:
+        limiter.release(time.perf_counter() - start)
+
+def stream_ollama(prompt, model=None):
+    """
+    流式调用 Ollama，逐个产出模型生成的文本片段
+    
+    生成器的返回值是清理后的完整输出（与 call_ollama 一致）；命中缓存时一次产出全部内容。
+    """
+    model = model or config.OLLAMA_MODEL
+    cache = get_llm_cache()
+    if cache is not None:
+        cached = cache.get(prompt, model)
+        if cached is not None:
+            metrics.OLLAMA_CALLS.inc(outcome='cache_hit')
+            yield cached
+            return cached
+    
+    limiter = get_admission_limiter()
+    try:
+        limiter.acquire()
+    except AdmissionRejected:
+        metrics.OLLAMA_CALLS.inc(outcome='rejected')
+        raise
+    pieces = []
+    start = time.perf_counter()
+    try:
+        for piece in get_ollama_client().generate_stream(prompt, model):
+            pieces.append(piece)
+            yield piece
+    except OllamaTimeout:
+        metrics.OLLAMA_CALLS.inc(outcome='timeout')
+        raise
+    except Exception:
+        metrics.OLLAMA_CALLS.inc(outcome='error')
+        raise
+    finally:
+        # 客户端断开（生成器被关闭）时同样归还名额
+        limiter.release(time.perf_counter() - start)
+    metrics.STAGE_SECONDS.observe(time.perf_counter() - start, stage='ollama_stream')
+    metrics.OLLAMA_CALLS.inc(outcome='ok')
+    output = strip_preamble(''.join(pieces)).strip()
+    if output and cache is not None:
+        cache.set(prompt, model, output)
+    return output
 
 def detect_meeting_type(text):
     """检测会议类型"""
-    keywords = {
-        '技术会议': ['技术', '开发', '编程', '代码', 'API', '架构', '数据库', '测试', 'bug', '部署', '性能', '优化'],
-        '商务会议': ['商务', '合作', '谈判', '客户', '市场', '销售', '营销', '推广', '策略', '预算', '财务'],
-        '项目会议': ['项目', '进度', '里程碑', '任务', '分工', '责任', '延期', '风险', '协调', '资源'],
-        '团队会议': ['团队', '部门', '周会', '例会', '分享', '讨论', '交流', '培训', '总结', '回顾']
-    }
-    
-    keyword_count = {
-        meeting_type: sum(keyword in text for keyword in kw_list)
-        for meeting_type, kw_list in keywords.items()
-    }
+    return detect_meeting_types([text])[0]
+
+def detect_meeting_types(texts):
+    """
+    批量检测会议类型
     
-    max_count = max(keyword_count.values())
+    配置了分类模型（MEETING_TYPE_MODEL）时整批文本一次矩阵运算完成分类，
+    置信度低于 MEETING_TYPE_MIN_CONFIDENCE 的文本以及未配置模型时使用关键词规则。
+    """
+    classifier = get_meeting_classifier()
+    if classifier is not None:
+        labels = classifier.predict(texts, config.MEETING_TYPE_MIN_CONFIDENCE)
+    else:
+        labels = [None] * len(texts)
+    matcher = get_meeting_type_matcher()
+    return [label or keyword_meeting_type(matcher.count_categories(text))
+            for text, label in zip(texts, labels)]
+
+def keyword_meeting_type(keyword_count):
+    """关键词规则：命中关键词最多的类别（至少命中 2 个），否则为通用会议"""
+    # 词典见 dictionaries/*.json；词典较大时用自动机一次扫描统计所有类别的命中数
+    max_count = max(keyword_count.values(), default=0)
     if max_count > 1:
         return max(keyword_count.items(), key=lambda x: x[1])[0]
     return '通用会议'
@@ -91,207 +216,187 @@ def extract_field(text, patterns):
 
 def extract_attendees(text):
     """提取参会人员"""
-    patterns = [
-        r'参会(?:人员)?[：:]\s*([^。\n\r]+?)(?:。|会议)',
-        r'参会的有([^。\n\r]+?)(?:。|会议)',
-        r'参加(?:人员)?包括([^。\n\r]+?)(?:。|会议)',
-        r'出席(?:人员)?[：:]\s*([^。\n\r]+?)(?:。|会议)'
-    ]
-    
-    attendees_text = extract_field(text, patterns)
+    attendees_text = extract_field(text, field_patterns()['attendees'])
+    if not attendees_text:
+        # 没有 "参会人员：" 之类的表述时，以通讯录中被提到的人员作为参会人员
+        roster = get_roster()
+        if roster is not None:
+            return attendees_from_people(roster.people(text))
+    return clean_attendees(attendees_text)
+
+def attendees_from_people(people):
+    return '，'.join(people) if people else '未指定'
+
+def clean_attendees(attendees_text):
+    """把参会人员字段的原文整理为去重的人员名单（配置了通讯录时统一为通讯录中的名称）"""
     if not attendees_text:
         return '未指定'
+    roster = get_roster()
     
-    # 清理和分割人员名单
-    attendees = []
-    for person in RegexHelper.safe_split(r'[，,、]', attendees_text):
+    # 清理和分割人员名单；按名称去重（通讯录中的同一人只出现一次），任一处写了部门时显示部门前缀
+    attendees = {}
+    for person in RegexHelper.safe_split(rp.ATTENDEE_SPLIT, attendees_text):
         person = person.strip()
         # 过滤无关文本
         if person and not any(x in person for x in ['等', '会议主要', '大概', '开', '小时']):
             # 保留部门信息
-            person = RegexHelper.safe_sub(r'还有新来的', '', person)
-            person = RegexHelper.safe_sub(r'还有', '', person)
-            person = RegexHelper.safe_sub(r'以及', '', person)
+            for noise in rp.ATTENDEE_NOISE:
+                person = RegexHelper.safe_sub(noise, '', person)
             person = person.strip()
-            if person:
-                attendees.append(person)
+            if person and roster is not None:
+                for name, prefix in roster.normalize_attendee(person):
+                    if not attendees.get(name):
+                        attendees[name] = prefix
+            elif person:
+                attendees.setdefault(person, '')
     
-    return '，'.join(list(dict.fromkeys(attendees))) if attendees else '未指定'
+    return '，'.join(prefix + name for name, prefix in attendees.items()) if attendees else '未指定'
 
-def extract_topics(text, meeting_type):
+def extract_topics(text, meeting_type, topic_index=None):
     """提取会议议题"""
-    topics = []
+    if topic_index is None:
+        topic_index = build_topic_index(text)
     
-    # 尝试匹配中文数字格式
-    chinese_nums = ['一', '二', '三', '四', '五', '六', '七', '八', '九', '十']
-    for i, num in enumerate(chinese_nums, 1):
-        patterns = [
-            rf'{num}[是、.]\s*(.+?)[，,；；。。\n\r]',
-            rf'{num}[是、.]\s*(.+?)$'
-        ]
-        
-        topic_text = extract_field(text, patterns)
+    topics = []
+    for i in range(len(topic_index)):
+        topic_text = topic_index.topic_text(i)
         if topic_text:
             topics.append({
                 'topic': topic_text,
                 'leader': '未指定',
-                'preparation': '无'
+                'preparation': '无',
+                '_segment': i
             })
     
     return topics
 
-def extract_leader_for_topic(text, topic, index):
+def _topic_segment(text, topic, index, topic_index):
+    """取议题对应的文本片段（从当前议题到下一个议题或句号）"""
+    if topic_index is None:
+        topic_index = build_topic_index(text)
+    segment = topic.get('_segment', index)
+    if segment < len(topic_index):
+        return topic_index.segment_text(segment)
+    return text
+
+def extract_leader_for_topic(text, topic, index, topic_index=None):
     """为议题提取负责人"""
-    chinese_nums = ['一', '二', '三', '四', '五', '六', '七', '八', '九', '十']
-    num = chinese_nums[index] if index < len(chinese_nums) else str(index+1)
-    
-    # 提取议题相关的文本片段（从当前议题到下一个议题或句号）
-    topic_pattern = rf'{num}是[^。；;]+?(?=[二三四五六七八九十]是|。|；|$)'
-    topic_match = RegexHelper.safe_search(topic_pattern, text)
-    topic_segment = topic_match.group(0) if topic_match else text
-    
-    patterns = [
-        # 匹配 "XX你准备" 或 "XX负责"
-        r'([^，,。；;\n\r]{2,4})(?:你|您)(?:准备|负责|牵头)',
-        # 匹配 "XX负责这块"
-        r'([^，,。；;\n\r]{2,4})负责(?:这块|该议题)',
-        # 匹配 "由XX负责"
-        r'由([^，,。；;\n\r]{2,4})负责'
-    ]
-    
-    leader = extract_field(topic_segment, patterns)
+    return leader_from_segment(_topic_segment(text, topic, index, topic_index))
+
+def leader_from_segment(topic_segment):
+    """在议题片段中查找负责人（配置了通讯录时优先取紧跟 "负责 / 准备" 等词的已知人员）"""
+    roster = get_roster()
+    if roster is not None:
+        for match in roster.find(topic_segment):
+            if match.kind == KIND_PERSON and rp.LEADER_CUE.match(topic_segment, match.end):
+                return match.name
+    
+    leader = extract_field(topic_segment, rp.LEADER_PATTERNS)
     if leader:
         # 清理负责人名称
-        leader = RegexHelper.safe_sub(r'[你您]|负责|牵头|主讲|汇报|^由|特别是.*|，.*', '', leader).strip()
+        leader = RegexHelper.safe_sub(rp.LEADER_CLEANUP, '', leader).strip()
         return leader if leader else '未指定'
     return '未指定'
 
-def extract_preparation_for_topic(text, topic, index):
+def extract_preparation_for_topic(text, topic, index, topic_index=None):
     """为议题提取会前准备"""
     leader = topic.get("leader", "")
     if leader and leader != '未指定':
-        # 提取议题相关的文本片段
-        chinese_nums = ['一', '二', '三', '四', '五', '六', '七', '八', '九', '十']
-        num = chinese_nums[index] if index < len(chinese_nums) else str(index+1)
-        topic_pattern = rf'{num}是[^。；;]+?(?=[二三四五六七八九十]是|。|；|$)'
-        topic_match = RegexHelper.safe_search(topic_pattern, text)
-        topic_segment = topic_match.group(0) if topic_match else text
-        
-        patterns = [
-            rf'{re.escape(leader)}[你您]?准备下?([^，,。；;\n\r]+?)(?:[，,。；;]|$)',
-            rf'{re.escape(leader)}[你您]?需准备([^，,。；;\n\r]+?)(?:[，,。；;]|$)'
-        ]
-        
-        preparation = extract_field(topic_segment, patterns)
+        return preparation_from_segment(_topic_segment(text, topic, index, topic_index), leader)
+    return '无'
+
+def preparation_from_segment(topic_segment, leader):
+    """在议题片段中查找负责人的会前准备"""
+    if leader and leader != '未指定':
+        preparation = extract_field(topic_segment, preparation_patterns(leader))
+        roster = get_roster()
+        if not preparation and roster is not None:
+            # 负责人是按通讯录规范化的名称时，原文中可能用的是别名
+            for match in roster.find(topic_segment):
+                alias = topic_segment[match.start:match.end]
+                if match.name == leader and alias != leader:
+                    preparation = extract_field(topic_segment, preparation_patterns(alias))
+                    if preparation:
+                        break
         if preparation:
             # 清理准备事项
-            preparation = RegexHelper.safe_sub(r'；.*|二是.*|三是.*', '', preparation)
-            preparation = RegexHelper.safe_sub(r'[，,；;.。]$', '', preparation)
+            preparation = RegexHelper.safe_sub(rp.PREPARATION_CLEANUP, '', preparation)
+            preparation = RegexHelper.safe_sub(rp.PREPARATION_TRAILING_PUNCT, '', preparation)
             return preparation.strip() if preparation.strip() else '无'
     return '无'
 
-def parse_meeting_info(meeting_text):
-    """解析会议信息"""
+def parse_meeting_info(meeting_text, meeting_type=None):
+    """
+    解析会议信息
+    
+    :param meeting_type: 已知的会议类型（如批量请求已经整批分类），为空时检测
+    :raises ParseTimeout: 超过 config.PARSE_TIME_LIMIT
+    """
     if not meeting_text or not isinstance(meeting_text, str):
-        print("无效的会议文本")
-        return {
-            'theme': '未指定',
-            'host': '未指定',
-            'location': '未指定',
-            'attendees': '未指定',
-            'duration': '未指定',
-            'topics': [],
-            'meeting_type': '通用会议'
-        }
+        logger.debug("无效的会议文本")
+        return empty_meeting_info()
+    
+    with stage_timer('parse'):
+        return _parse_meeting_info(meeting_text, meeting_type)
+
+def _parse_meeting_info(meeting_text, meeting_type=None):
+    logger.debug("解析文本: %r", meeting_text[:100])
+    deadline = ParseDeadline(config.PARSE_TIME_LIMIT)
+    patterns = field_patterns()
     
-    print("解析文本:", repr(meeting_text[:100]))
+    def step(stage, func, *args):
+        result = timed_call(stage, func, *args)
+        deadline.check(stage)
+        return result
     
     # 检测会议类型
-    meeting_type = detect_meeting_type(meeting_text)
-    print(f"检测到会议类型: {meeting_type}")
-    
-    # 提取基本信息
-    host_patterns = [
-        r'主持人[：:]\s*(.+?)[\n\r]',
-        r'主持人[：:]\s*(.+)',
-        r'由([^，,。\n\r]+)主持'
-    ]
-    
-    location_patterns = [
-        r'(?:在|于)\s*([^，,。\n\r]+?)\s*(?:召开|举行|开)',
-        r'会议地点[：:]\s*(.+?)[\n\r]',
-        r'会议地点[：:]\s*(.+)'
-    ]
-    
-    duration_patterns = [
-        r'会议大概开([^，,。\n\r]+)',
-        r'会议时长[：:]\s*(.+?)[\n\r]',
-        r'会议时长[：:]\s*(.+)',
-        r'大约([^，,。\n\r]+)小时'
-    ]
-    
-    theme_patterns = [
-        r'会议主题[：:]\s*(.+?)[\n\r]',
-        r'会议主题[：:]\s*(.+)',
-        r'讨论([^，,。\n\r]+)',
-        r'关于([^，,。\n\r]+)的会议'
-    ]
+    if meeting_type is None:
+        meeting_type = step('detect_meeting_type', detect_meeting_type, meeting_text)
+    logger.debug("检测到会议类型: %s", meeting_type)
     
     meeting_info = {
-        'theme': extract_field(meeting_text, theme_patterns) or '未指定',
-        'host': extract_field(meeting_text, host_patterns) or '未指定',
-        'location': extract_field(meeting_text, location_patterns) or '未指定',
-        'attendees': extract_attendees(meeting_text),
-        'duration': extract_field(meeting_text, duration_patterns) or '未指定',
+        'theme': step('extract_theme', extract_field, meeting_text, patterns['theme']) or '未指定',
+        'host': step('extract_host', extract_field, meeting_text, patterns['host']) or '未指定',
+        'location': step('extract_location', extract_field, meeting_text, patterns['location']) or '未指定',
+        'attendees': step('extract_attendees', extract_attendees, meeting_text),
+        'duration': step('extract_duration', extract_field, meeting_text, patterns['duration']) or '未指定',
         'meeting_type': meeting_type,
         'topics': []
     }
     
-    # 提取议题
-    topics = extract_topics(meeting_text, meeting_type)
+    # 提取议题（一次扫描建立分段索引）
+    with stage_timer('extract_topics'):
+        topic_index = build_topic_index(meeting_text)
+        topics = extract_topics(meeting_text, meeting_type, topic_index)
+    deadline.check('extract_topics')
     
-    # 为每个议题提取负责人和准备事项
-    for i, topic in enumerate(topics):
-        topic['leader'] = extract_leader_for_topic(meeting_text, topic, i)
-        topic['preparation'] = extract_preparation_for_topic(meeting_text, topic, i)
-        print(f"议题{i+1}: {topic['topic']}, 负责人: {topic['leader']}")
+    # 为每个议题提取负责人和准备事项（只查找各自的片段）
+    with stage_timer('topic_details'):
+        for i, topic in enumerate(topics):
+            deadline.check('topic_details')
+            topic['leader'] = extract_leader_for_topic(meeting_text, topic, i, topic_index)
+            topic['preparation'] = extract_preparation_for_topic(meeting_text, topic, i, topic_index)
+            del topic['_segment']
+            logger.debug("议题%d: %s, 负责人: %s", i + 1, topic['topic'], topic['leader'])
     
-    meeting_info['topics'] = topics[:10]  # 限制最多10个议题
+    meeting_info['topics'] = topics
     
     # 如果没有明确主题，使用第一个议题
     if meeting_info['theme'] == '未指定' and topics:
         meeting_info['theme'] = topics[0]['topic'][:50]
     
-    print(f"最终会议信息: {meeting_info}")
+    logger.debug("最终会议信息: %s", meeting_info)
     return meeting_info
 
-@app.route("/extract", methods=["POST"])
-def extract_meeting_info():
-    """提取会议信息的API端点"""
-    data = request.json
-    text = data.get("text", "")
-    if not text:
-        return jsonify({"error": "请提供会议文本内容"}), 400
-    
-    print("=== 尝试直接解析输入文本 ===")
-    direct_parsed_info = parse_meeting_info(text)
-    
-    # 检查解析质量
-    filled_fields = sum(1 for field in ['theme', 'host', 'location', 'attendees', 'duration'] 
-                       if direct_parsed_info[field] != '未指定')
-    
-    if filled_fields >= 3 or len(direct_parsed_info['topics']) > 0:
-        print("直接解析结果质量较好")
-        return jsonify({
-            "success": True,
-            "data": direct_parsed_info,
-            "raw_text": text
-        })
-    
-    # 使用Ollama作为后备
-    print("直接解析结果不理想，尝试使用Ollama")
-    try:
-        prompt = f"""请从以下会议内容中提取关键信息，按以下格式输出：
+def is_direct_parse_sufficient(meeting_info):
+    """直接解析结果质量是否足够（无需调用 Ollama）"""
+    filled_fields = sum(1 for field in BASIC_FIELDS
+                       if meeting_info[field] != '未指定')
+    return filled_fields >= 3 or len(meeting_info['topics']) > 0
+
+def build_extraction_prompt(text):
+    """构造 Ollama 信息提取提示词"""
+    return f"""请从以下会议内容中提取关键信息，按以下格式输出：
 会议主题：
 主持人：
 会议地点：
@@ -304,71 +409,549 @@ def extract_meeting_info():
 会议内容：
 {text}
 """
-        result = call_ollama(prompt)
-        ollama_parsed_info = parse_meeting_info(result)
-        
-        # 合并结果
-        final_info = direct_parsed_info.copy()
-        for field in ['theme', 'host', 'location', 'attendees', 'duration']:
-            if ollama_parsed_info[field] != '未指定':
-                final_info[field] = ollama_parsed_info[field]
-        
-        if len(ollama_parsed_info['topics']) > 0:
-            final_info['topics'] = ollama_parsed_info['topics']
-        
-        return jsonify({
-            "success": True,
-            "data": final_info,
-            "raw_text": result
-        })
+
+def merge_meeting_info(direct_parsed_info, ollama_parsed_info):
+    """用 Ollama 解析出的字段覆盖直接解析结果"""
+    final_info = direct_parsed_info.copy()
+    for field in BASIC_FIELDS:
+        if ollama_parsed_info[field] != '未指定':
+            final_info[field] = ollama_parsed_info[field]
+    
+    if len(ollama_parsed_info['topics']) > 0:
+        final_info['topics'] = ollama_parsed_info['topics']
+    return final_info
+
+def needs_chunking(text):
+    """文本是否超过单个提示词的长度上限（需要分块提取）"""
+    return 0 < config.LLM_CHUNK_MAX_CHARS < len(text)
+
+def stream_chunked_ollama(text):
+    """
+    长文本分块后并发调用 Ollama（同时在途的请求数见 config.LLM_CHUNK_CONCURRENCY）
+    
+    每完成一块产出 (块序号, 块数, 模型输出)；返回值为 (合并后的会议信息, 原始文本)
+    """
+    logger.info("文本较长（%d 字），分块提取", len(text))
+    return stream_chunked(text, call_ollama, parse_meeting_info, build_extraction_prompt,
+                          config.LLM_CHUNK_MAX_CHARS, config.LLM_CHUNK_CONCURRENCY)
+
+def extract_chunked_with_ollama(text):
+    """分块提取，等待所有块完成，返回 (会议信息, 原始文本)"""
+    logger.info("文本较长（%d 字），分块提取", len(text))
+    return extract_chunked(text, call_ollama, parse_meeting_info, build_extraction_prompt,
+                           config.LLM_CHUNK_MAX_CHARS, config.LLM_CHUNK_CONCURRENCY)
+
+def extract_with_ollama(text):
+    """
+    调用 Ollama 提取（长文本分块提取）
+    
+    :return: (模型结果解析出的会议信息, 模型输出)
+    """
+    if needs_chunking(text):
+        return extract_chunked_with_ollama(text)
+    result = call_ollama(build_extraction_prompt(text))
+    return parse_meeting_info(result), result
+
+def extract_with_fallback(text, progress=None):
+    """
+    直接解析，质量不足时使用 Ollama 作为后备
+    
+    模型调用未获准入时，按 config.LLM_OVERLOAD_POLICY 抛出 AdmissionRejected（reject）
+    或返回直接解析结果（degrade，并以 degraded 阶段通知 progress）。
+    
+    :param progress: 可选回调，进入各阶段（parse / llm / degraded）时调用
+    :return: (会议信息, 原始文本或模型输出)
+    """
+    if progress:
+        progress('parse')
+    logger.debug("尝试直接解析输入文本")
+    direct_parsed_info = parse_meeting_info(text)
+    
+    if is_direct_parse_sufficient(direct_parsed_info):
+        logger.debug("直接解析结果质量较好")
+        metrics.EXTRACTIONS.inc(path='direct')
+        return direct_parsed_info, text
+    
+    # 使用Ollama作为后备
+    logger.debug("直接解析结果不理想，尝试使用Ollama")
+    if progress:
+        progress('llm')
+    try:
+        ollama_parsed_info, result = extract_with_ollama(text)
+        metrics.EXTRACTIONS.inc(path='llm')
+        return merge_meeting_info(direct_parsed_info, ollama_parsed_info), result
+    except AdmissionRejected as e:
+        metrics.EXTRACTIONS.inc(path='llm_rejected')
+        if config.LLM_OVERLOAD_POLICY == POLICY_REJECT:
+            raise
+        logger.warning("模型调用过载，返回直接解析结果: %s", e)
+        if progress:
+            progress('degraded')
+        return direct_parsed_info, text
     except Exception as e:
-        print(f"使用Ollama提取失败: {str(e)}")
-        return jsonify({
-            "success": True,
-            "data": direct_parsed_info,
-            "raw_text": text
-        })
+        logger.warning("使用Ollama提取失败: %s", e)
+        metrics.EXTRACTIONS.inc(path='llm_failed')
+        return direct_parsed_info, text
 
-@app.route("/generate", methods=["POST"])
-def generate_meeting_doc():
-    """生成会议纪要 Word 文件"""
+@bp.route("/extract", methods=["POST"])
+def extract_meeting_info():
+    """提取会议信息的API端点"""
     data = request.json
     text = data.get("text", "")
     if not text:
         return jsonify({"error": "请提供会议文本内容"}), 400
-
-    print("=== 开始生成文档 ===")
-    meeting_info = parse_meeting_info(text)
+    check_input_size(text)
     
-    # 确保输出文件夹存在
-    output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
-    os.makedirs(output_dir, exist_ok=True)
+    budget = data.get("latency_budget", config.EXTRACT_LATENCY_BUDGET)
+    if isinstance(budget, bool) or not isinstance(budget, (int, float)) or budget < 0:
+        return jsonify({"error": "latency_budget 必须是非负秒数"}), 400
+    
+    race = None
+    stages = []
+    if budget > 0:
+        # 延迟预算模式：直接解析与模型提取竞速，截止时返回可用的最好结果
+        meeting_info, raw_text, race = race_extraction(
+            text, parse_meeting_info, is_direct_parse_sufficient, extract_with_ollama,
+            merge_meeting_info, min(budget, config.OLLAMA_READ_TIMEOUT), config.SPECULATION_ENABLED
+        )
+        logger.debug("竞速结果: %s, 模型状态: %s", race['winner'], race['llm_status'])
+        metrics.EXTRACTIONS.inc(path=RACE_EXTRACTION_PATHS.get(race['llm_status'], 'direct'))
+    else:
+        try:
+            meeting_info, raw_text = extract_with_fallback(text, progress=stages.append)
+        except AdmissionRejected as e:
+            response = jsonify({"error": f"服务繁忙，请稍后重试（{e}）"})
+            response.headers["Retry-After"] = str(e.retry_after)
+            return response, 429
+    
+    # 保存结果，/generate 可凭提取 ID 直接渲染
+    extraction_id = get_extraction_store().save(meeting_info)
+    payload = {
+        "success": True,
+        "data": meeting_info,
+        "raw_text": raw_text,
+        "extraction_id": extraction_id
+    }
+    if race is not None:
+        payload["race"] = race
+    if 'degraded' in stages:
+        payload["degraded"] = True
+    response = jsonify(payload)
+    response.set_etag(extraction_id)
+    return response
 
-    filename = f"meeting_{int(time.time())}.docx"
-    file_path = os.path.join(output_dir, filename)
+def _sse(event, payload):
+    """格式化一条 Server-Sent Events 消息"""
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+def _relay_events(source, to_event):
+    """把生成器产出的每一项转换为 SSE 消息转发出去，返回该生成器的返回值"""
+    while True:
+        try:
+            item = next(source)
+        except StopIteration as done:
+            return done.value
+        yield to_event(item)
+
+@bp.route("/extract/stream", methods=["POST"])
+def extract_meeting_info_stream():
+    """
+    流式提取会议信息（Server-Sent Events）
     
-    try:
-        generator = WordMeetingGenerator()
-        file_path = generator.create_meeting_document(meeting_info, file_path)
-        print(f"✅ 会议纪要已保存: {file_path}")
+    先推送直接解析结果（direct），需要 Ollama 后备时逐段推送模型输出（token），
+    最后推送合并后的结果（final），字段与 /extract 的响应一致。
+    """
+    data = request.json or {}
+    text = data.get("text", "")
+    if not text:
+        return jsonify({"error": "请提供会议文本内容"}), 400
+    check_input_size(text)
+    
+    def events():
+        try:
+            direct_parsed_info = parse_meeting_info(text)
+        except ParseTimeout as e:
+            yield _sse("error", {"error": str(e)})
+            return
+        sufficient = is_direct_parse_sufficient(direct_parsed_info)
+        yield _sse("direct", {"data": direct_parsed_info, "sufficient": sufficient})
         
-        if not os.path.exists(file_path):
-            return jsonify({"error": "文档生成失败"}), 500
+        meeting_info, raw_text = direct_parsed_info, text
+        degraded = False
+        if not sufficient:
+            logger.debug("直接解析结果不理想，流式调用Ollama")
+            try:
+                if needs_chunking(text):
+                    # 长文本分块提取，每完成一块推送该块的模型输出
+                    ollama_parsed_info, result = yield from _relay_events(
+                        stream_chunked_ollama(text),
+                        lambda item: _sse("token", {"text": item[2] + "\n\n", "chunk": item[0], "chunks": item[1]})
+                    )
+                else:
+                    result = yield from _relay_events(
+                        stream_ollama(build_extraction_prompt(text)),
+                        lambda token: _sse("token", {"text": token})
+                    )
+                    ollama_parsed_info = parse_meeting_info(result)
+                meeting_info = merge_meeting_info(direct_parsed_info, ollama_parsed_info)
+                raw_text = result
+                metrics.EXTRACTIONS.inc(path='llm')
+            except AdmissionRejected as e:
+                # 直接解析结果已经推送，过载时无论 LLM_OVERLOAD_POLICY 如何都以它作为最终结果
+                logger.warning("模型调用过载，返回直接解析结果: %s", e)
+                metrics.EXTRACTIONS.inc(path='llm_rejected')
+                degraded = True
+                yield _sse("error", {"error": f"服务繁忙（{e}）", "retry_after": e.retry_after})
+            except Exception as e:
+                logger.warning("流式调用Ollama失败: %s", e)
+                metrics.EXTRACTIONS.inc(path='llm_failed')
+                yield _sse("error", {"error": f"调用 Ollama 出错：{e}"})
+        else:
+            metrics.EXTRACTIONS.inc(path='direct')
+        
+        extraction_id = get_extraction_store().save(meeting_info)
+        final = {
+            "success": True,
+            "data": meeting_info,
+            "raw_text": raw_text,
+            "extraction_id": extraction_id
+        }
+        if degraded:
+            final["degraded"] = True
+        yield _sse("final", final)
+    
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
+def resolve_meeting_info(data):
+    """
+    确定 /generate 要渲染的会议信息
+    
+    优先级：meeting_info（结构化 JSON）> extraction_id（/extract 结果）> text（重新解析）
+    
+    :return: (会议信息, 错误响应)
+    """
+    if data.get("meeting_info") is not None:
+        try:
+            return normalize_meeting_info(data["meeting_info"]), None
+        except ValueError as e:
+            return None, (jsonify({"error": str(e)}), 400)
+    
+    extraction_id = data.get("extraction_id") or request.headers.get("If-Match")
+    if extraction_id:
+        meeting_info = get_extraction_store().get(extraction_id)
+        if meeting_info is not None:
+            logger.debug("复用提取结果: %s", extraction_id)
+            return meeting_info, None
+        logger.debug("提取结果不存在或已过期: %s", extraction_id)
+    
+    text = data.get("text", "")
+    if not text:
+        if extraction_id:
+            return None, (jsonify({"error": "提取结果已过期，请重新提交会议文本"}), 404)
+        return None, (jsonify({"error": "请提供会议文本内容"}), 400)
+    check_input_size(text)
+    return parse_meeting_info(text), None
+
+def document_key(meeting_info):
+    """渲染结果的缓存键（同时作为 /generate 的 ETag）"""
+    return document_cache_key(meeting_info, config.DOCUMENT_RENDERER, config.DOCX_TEMPLATE_PATH or None)
+
+def render_document(meeting_info, cache_key=None):
+    """
+    在内存中渲染会议纪要，按配置另存到输出目录，返回文档字节
+    
+    启用文档缓存时，相同内容的会议信息直接返回缓存的文档；只有实际渲染时才另存到输出目录。
+    :param cache_key: 已算好的 document_key(meeting_info)，省去重复计算
+    """
+    cache = get_document_cache()
+    if cache is not None:
+        cache_key = cache_key or document_key(meeting_info)
+        data = cache.get(cache_key)
+        if data is not None:
+            return data
+    
+    buffer = io.BytesIO()
+    with stage_timer('render'):
+        generator = create_document_generator(config.DOCUMENT_RENDERER, config.DOCX_TEMPLATE_PATH or None)
+        generator.create_meeting_document(meeting_info, buffer)
+    data = buffer.getvalue()
+    metrics.DOCUMENTS.inc(renderer=config.DOCUMENT_RENDERER)
+    if cache is not None:
+        cache.set(cache_key, data)
+    
+    if config.DOCUMENT_PERSIST:
+        file_path = timed_call('persist', persist_document, data)
+        logger.info("会议纪要已保存: %s", file_path)
+    return data
+
+@bp.route("/generate", methods=["POST"])
+def generate_meeting_doc():
+    """生成会议纪要 Word 文件（ETag 为内容地址，客户端带 If-None-Match 时可返回 304）"""
+    data = request.json or {}
+    
+    logger.debug("开始生成文档")
+    meeting_info, error_response = resolve_meeting_info(data)
+    if error_response is not None:
+        return error_response
+    
+    try:
+        etag = document_key(meeting_info)
+        # 客户端已有同一份文档：不渲染，直接返回 304
+        if request.if_none_match.contains(etag):
+            return Response(status=304, headers={"ETag": f'"{etag}"'})
+        # 在内存中渲染并直接返回，不写输出目录
         return send_file(
-            file_path, 
+            io.BytesIO(render_document(meeting_info, etag)), 
             as_attachment=True, 
-            mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            download_name=f"meeting_{int(time.time())}.docx"
+            mimetype=DOCX_MIMETYPE,
+            download_name=f"meeting_{int(time.time())}.docx",
+            etag=etag
         )
     except Exception as e:
-        print(f"❌ 文档生成异常: {str(e)}")
+        logger.exception("文档生成异常: %s", e)
         return jsonify({"error": f"文档生成失败: {str(e)}"}), 500
 
-@app.route("/health", methods=["GET"])
+@bp.route("/batch/generate", methods=["POST"])
+def batch_generate_docs():
+    """批量生成会议纪要，按完成顺序以 ZIP 流式返回（含 manifest.json）"""
+    data = request.json
+    items = data.get("items") if isinstance(data, dict) else data
+    if not isinstance(items, list) or not items:
+        return jsonify({"error": "请提供 items 列表（会议文本或 meeting_info 对象）"}), 400
+    if len(items) > config.BATCH_MAX_ITEMS:
+        return jsonify({"error": f"单次最多生成 {config.BATCH_MAX_ITEMS} 份会议纪要"}), 413
+    
+    logger.info("开始批量生成 %d 份文档", len(items))
+    return Response(
+        stream_with_context(stream_batch_zip(items)),
+        mimetype='application/zip',
+        headers={"Content-Disposition": f"attachment; filename=meetings_{int(time.time())}.zip"}
+    )
+
+def _run_extract_job(job, text):
+    """后台任务：直接解析 + Ollama 后备，结果存入提取结果存储"""
+    meeting_info, raw_text = extract_with_fallback(text, progress=job.set_stage)
+    job.result = {
+        "data": meeting_info,
+        "raw_text": raw_text,
+        "extraction_id": get_extraction_store().save(meeting_info)
+    }
+
+def _run_generate_job(job, meeting_info=None, text=None):
+    """后台任务：（需要时）解析文本，然后渲染文档"""
+    if meeting_info is None:
+        job.set_stage('parse')
+        meeting_info = parse_meeting_info(text)
+    job.set_stage('render')
+    job.document = render_document(meeting_info)
+    job.result = {"theme": meeting_info.get('theme', '未指定'), "size": len(job.document)}
+
+def _job_response(job):
+    info = job.to_dict()
+    if job.kind == 'generate' and job.status == JOB_DONE:
+        info["document_url"] = url_for("meeting.get_job_document", job_id=job.id)
+    return info
+
+@bp.route("/jobs", methods=["POST"])
+def submit_job():
+    """提交异步任务（extract / generate），立即返回任务 ID"""
+    data = request.json or {}
+    kind = data.get("type", "extract")
+    text = data.get("text", "")
+    if isinstance(text, str):
+        check_input_size(text)
+    
+    if kind == 'extract':
+        if not text:
+            return jsonify({"error": "请提供会议文本内容"}), 400
+        target = lambda job: _run_extract_job(job, text)
+    elif kind == 'generate':
+        if data.get("meeting_info") is not None or data.get("extraction_id") or request.headers.get("If-Match"):
+            # 结构化结果或提取 ID 在请求线程内校验，后台只负责渲染
+            meeting_info, error_response = resolve_meeting_info(data)
+            if error_response is not None:
+                return error_response
+            target = lambda job: _run_generate_job(job, meeting_info=meeting_info)
+        elif text:
+            target = lambda job: _run_generate_job(job, text=text)
+        else:
+            return jsonify({"error": "请提供会议文本内容"}), 400
+    else:
+        return jsonify({"error": f"未知的任务类型: {kind}"}), 400
+    
+    try:
+        job = get_job_queue().submit(kind, target)
+    except JobQueueFull as e:
+        response = jsonify({"error": f"服务繁忙，请稍后重试（{e}）"})
+        response.headers["Retry-After"] = "5"
+        return response, 429
+    
+    response = jsonify(_job_response(job))
+    response.headers["Location"] = url_for("meeting.get_job", job_id=job.id)
+    return response, 202
+
+@bp.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    """查询任务状态；?wait=秒 时长轮询，任务结束或超时后返回"""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        return jsonify({"error": "任务不存在或已过期"}), 404
+    
+    try:
+        wait = float(request.args.get("wait", 0))
+    except ValueError:
+        return jsonify({"error": "wait 必须是秒数"}), 400
+    if not math.isfinite(wait):
+        return jsonify({"error": "wait 必须是秒数"}), 400
+    wait = min(max(wait, 0), config.JOB_MAX_WAIT)
+    if wait:
+        job.wait(wait)
+    return jsonify(_job_response(job))
+
+@bp.route("/jobs/<job_id>/document", methods=["GET"])
+def get_job_document(job_id):
+    """下载生成任务的文档"""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        return jsonify({"error": "任务不存在或已过期"}), 404
+    if job.kind != 'generate':
+        return jsonify({"error": "该任务不生成文档"}), 400
+    if job.status == JOB_FAILED:
+        return jsonify({"error": f"文档生成失败: {job.error}"}), 500
+    if job.status != JOB_DONE:
+        return jsonify(_job_response(job)), 409
+    
+    return send_file(
+        io.BytesIO(job.document),
+        as_attachment=True,
+        mimetype=DOCX_MIMETYPE,
+        download_name=f"meeting_{int(job.finished_at)}.docx"
+    )
+
+def _append_to_session(session, text, offset=None):
+    """在会话锁内追加文本；出错时返回错误响应"""
+    if not isinstance(text, str):
+        return jsonify({"error": "text 必须是字符串"}), 400
+    if offset is not None and (isinstance(offset, bool) or not isinstance(offset, int)):
+        return jsonify({"error": "offset 必须是整数"}), 400
+    with session.lock:
+        try:
+            with stage_timer('live_append'):
+                session.append(text, offset)
+        except SessionOffsetMismatch as e:
+            return jsonify({"error": str(e), "length": e.expected}), 409
+        except SessionTooLarge as e:
+            return jsonify({"error": str(e)}), 413
+        return None
+
+@bp.route("/sessions", methods=["POST"])
+def create_live_session():
+    """创建实时转写会话，可带初始文本"""
+    data = request.json or {}
+    session = LiveSession(clean_attendees, leader_from_segment, preparation_from_segment, keyword_meeting_type)
+    error_response = _append_to_session(session, data.get("text", ""))
+    if error_response is not None:
+        return error_response
+    get_session_store().add(session)
+    
+    response = jsonify(session.to_dict())
+    response.headers["Location"] = url_for("meeting.get_live_session", session_id=session.id)
+    return response, 201
+
+@bp.route("/sessions/<session_id>/append", methods=["POST"])
+def append_live_session(session_id):
+    """追加转写文本，只解析新增部分，返回当前的会议信息"""
+    store = get_session_store()
+    session = store.get(session_id)
+    if session is None:
+        return jsonify({"error": "会话不存在或已过期"}), 404
+    
+    data = request.json or {}
+    error_response = _append_to_session(session, data.get("text", ""), data.get("offset"))
+    if error_response is not None:
+        return error_response
+    store.touch(session)
+    return jsonify(session.to_dict())
+
+@bp.route("/sessions/<session_id>", methods=["GET"])
+def get_live_session(session_id):
+    """查询会话当前的会议信息"""
+    session = get_session_store().get(session_id)
+    if session is None:
+        return jsonify({"error": "会话不存在或已过期"}), 404
+    return jsonify(session.to_dict())
+
+@bp.route("/sessions/<session_id>", methods=["DELETE"])
+def close_live_session(session_id):
+    """结束会话，保存最终结果并返回提取 ID（可用于 /generate）"""
+    session = get_session_store().remove(session_id)
+    if session is None:
+        return jsonify({"error": "会话不存在或已过期"}), 404
+    with session.lock:
+        info = session.to_dict()
+    info["extraction_id"] = get_extraction_store().save(session.meeting_info)
+    response = jsonify(info)
+    response.set_etag(info["extraction_id"])
+    return response
+
+@bp.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    """Prometheus 文本格式的指标"""
+    return Response(metrics.render_metrics(), content_type=metrics.CONTENT_TYPE)
+
+@bp.route("/health", methods=["GET"])
 def health_check():
     """健康检查端点"""
-    return jsonify({"status": "healthy", "message": "服务运行正常"})
+    health = {"status": "healthy", "message": "服务运行正常"}
+    cache = get_llm_cache()
+    if cache is not None:
+        health["llm_cache"] = cache.stats()
+    doc_cache = get_document_cache()
+    if doc_cache is not None:
+        health["document_cache"] = doc_cache.stats()
+    health["jobs"] = get_job_queue().stats()
+    health["llm_admission"] = get_admission_limiter().stats()
+    health["warmup"] = get_warmup_state().to_dict()
+    return jsonify(health)
+
+@bp.route("/health/live", methods=["GET"])
+def liveness_check():
+    """存活检查：进程能响应请求即可"""
+    return jsonify({"status": "alive"})
+
+@bp.route("/health/ready", methods=["GET"])
+def readiness_check():
+    """就绪检查：预热完成前返回 503，负载均衡器据此决定是否转发流量"""
+    warmup = get_warmup_state().to_dict()
+    if not warmup["ready"]:
+        return jsonify({"status": "warming_up", "warmup": warmup}), 503
+    return jsonify({"status": "ready", "warmup": warmup})
+
+def create_app(warm_up=None, warm_ollama=True):
+    """
+    创建 Flask 应用
+    
+    :param warm_up: 是否在返回前预热（正则、关键词自动机、文档模板），默认取 config.WARMUP_ENABLED
+    :param warm_ollama: 是否在后台预热 Ollama 连接与模型；preload 模式下由工作进程在 fork 之后自行预热
+    """
+    flask_app = Flask(__name__)
+    CORS(flask_app)
+    flask_app.register_blueprint(bp)
+    
+    if warm_up is None:
+        warm_up = config.WARMUP_ENABLED
+    state = get_warmup_state()
+    state.enabled = warm_up
+    if warm_up:
+        warm_up_local(parse_meeting_info)
+        if warm_ollama and config.WARMUP_OLLAMA:
+            start_ollama_warmup()
+    return flask_app
 
 if __name__ == "__main__":
-    app.run(port=5000, debug=True)
+    # 开发服务器；生产环境使用 python serve.py（gunicorn + preload）
+    create_app().run(port=5000, debug=True)
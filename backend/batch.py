@@ -0,0 +1,196 @@
+import io
+import json
+import logging
+import multiprocessing
+import re
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import config
+from parse_limits import check_input_size
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+def _safe_filename(name, index):
+    name = _UNSAFE_FILENAME_CHARS.sub('_', str(name or '')).strip('._')[:40]
+    return f"{index + 1:03d}_{name or 'meeting'}.docx"
+
+
+def render_batch_item(index, item, renderer, template_path):
+    """
+    在工作进程中解析并渲染一项（必须是模块级函数，才能被进程池序列化调用）
+
+    :return: (index, 文档字节, 会议主题)
+    """
+    from result_store import normalize_meeting_info
+    from word_generator import create_document_generator
+
+    if item.get('meeting_info') is not None:
+        meeting_info = normalize_meeting_info(item['meeting_info'])
+    else:
+        from app import parse_meeting_info
+        meeting_info = parse_meeting_info(item['text'], item.get('meeting_type'))
+
+    buffer = io.BytesIO()
+    create_document_generator(renderer, template_path).create_meeting_document(meeting_info, buffer)
+    return index, buffer.getvalue(), meeting_info.get('theme', '未指定')
+
+
+def normalize_batch_item(item):
+    """
+    规范化批量请求中的一项：字符串视为会议文本，对象需包含 text 或 meeting_info
+
+    :raises ValueError: 格式不合法或文本过长
+    """
+    if isinstance(item, str):
+        item = {'text': item}
+    if not isinstance(item, dict):
+        raise ValueError("每一项必须是会议文本或包含 text / meeting_info 的对象")
+    if item.get('meeting_info') is None and not (isinstance(item.get('text'), str) and item['text'].strip()):
+        raise ValueError("缺少会议文本（text）或会议信息（meeting_info）")
+    if item.get('meeting_info') is None:
+        check_input_size(item['text'])
+    return item
+
+
+def classify_batch_items(pending):
+    """
+    配置了会议类型分类模型时，在主进程中对所有文本项一次批量分类，结果随项传给工作进程
+
+    :param pending: [(序号, 规范化后的项)]
+    :return: 同样结构的列表；文本项带上 meeting_type
+    """
+    from meeting_classifier import get_meeting_classifier
+    text_items = [(index, item) for index, item in pending if item.get('meeting_info') is None]
+    if not text_items or get_meeting_classifier() is None:
+        return pending
+
+    from app import detect_meeting_types
+    meeting_types = dict(zip(
+        (index for index, _ in text_items),
+        detect_meeting_types([item['text'] for _, item in text_items])
+    ))
+    return [(index, dict(item, meeting_type=meeting_types[index]) if index in meeting_types else item)
+            for index, item in pending]
+
+
+_pool_lock = threading.Lock()
+_pool = None
+
+
+def get_process_pool():
+    """获取共享的渲染进程池（首次使用时创建）"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            context = multiprocessing.get_context(config.BATCH_START_METHOD)
+            _pool = ProcessPoolExecutor(max_workers=config.BATCH_WORKERS or None, mp_context=context)
+        return _pool
+
+
+def _reset_process_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+class _ZipStream:
+    """只追加的写入目标：zipfile 写入的字节暂存于此，由生成器逐块取走"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_batch_zip(items, renderer=None, template_path=None):
+    """
+    并行渲染多份会议记录，按完成顺序以 ZIP 流式输出
+
+    单项失败不会中断整个批次，结果汇总在 ZIP 末尾的 manifest.json 中。
+
+    :param items: 会议文本或 {text / meeting_info, name} 对象的列表
+    :return: 逐块产出 ZIP 字节的生成器
+    """
+    renderer = renderer or config.DOCUMENT_RENDERER
+    template_path = template_path or config.DOCX_TEMPLATE_PATH or None
+    started = time.perf_counter()
+    manifest = [None] * len(items)
+    stream = _ZipStream()
+
+    with zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED) as archive:
+        futures = {}
+        submitted_at = {}
+        pending = []
+        for index, raw_item in enumerate(items):
+            entry = {'index': index, 'name': raw_item.get('name') if isinstance(raw_item, dict) else None}
+            manifest[index] = entry
+            try:
+                pending.append((index, normalize_batch_item(raw_item)))
+            except ValueError as e:
+                entry.update(status='error', error=str(e))
+        pending = classify_batch_items(pending)
+
+        for index, item in pending:
+            entry = manifest[index]
+            try:
+                future = get_process_pool().submit(render_batch_item, index, item, renderer, template_path)
+            except BrokenProcessPool as e:
+                _reset_process_pool()
+                entry.update(status='error', error=f"渲染进程池不可用: {e}")
+                continue
+            futures[future] = index
+            submitted_at[index] = time.perf_counter()
+
+        try:
+            for future in as_completed(futures):
+                index = futures[future]
+                entry = manifest[index]
+                entry['duration_ms'] = round((time.perf_counter() - submitted_at[index]) * 1000, 1)
+                try:
+                    _, data, theme = future.result()
+                except BrokenProcessPool as e:
+                    _reset_process_pool()
+                    entry.update(status='error', error=f"渲染进程异常退出: {e}")
+                    continue
+                except Exception as e:
+                    logger.warning("批量生成第%d项失败: %s", index + 1, e)
+                    entry.update(status='error', error=str(e))
+                    continue
+
+                filename = _safe_filename(entry['name'] or theme, index)
+                archive.writestr(filename, data)
+                entry.update(status='ok', filename=filename, theme=theme, size=len(data))
+                yield stream.drain()
+        finally:
+            # 客户端中途断开时取消尚未开始的任务
+            for future in futures:
+                future.cancel()
+
+        summary = {
+            'total': len(items),
+            'succeeded': sum(1 for entry in manifest if entry.get('status') == 'ok'),
+            'failed': sum(1 for entry in manifest if entry.get('status') == 'error'),
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+            'items': manifest
+        }
+        archive.writestr('manifest.json', json.dumps(summary, ensure_ascii=False, indent=2))
+    yield stream.drain()
@@ -0,0 +1,83 @@
+"""长文本提取基准：分块并发提取 vs 整段单次提取
+
+使用回显模式的 Ollama 桩服务（模型只能"看到"上下文窗口内的文本，推理耗时随长度增加），
+在合成的长会议记录上比较耗时与议题、参会人员的召回率::
+
+    cd backend
+    python -m benchmarks.bench_chunked [--topics 5 20 40] [--context 4000] [--concurrency 1 2 4]
+"""
+import argparse
+import time
+
+import config
+from benchmarks.corpus import generate_transcript
+from benchmarks.harness import quiet
+from benchmarks.ollama_stub import start_stub_server
+from chunked_extraction import extract_chunked
+from ollama_client import OllamaHTTPClient, OllamaError
+
+
+def _recall(expected, found):
+    if not expected:
+        return 1.0
+    return sum(1 for item in expected if item in found) / len(expected)
+
+
+def _score(meeting_info, topics, attendees):
+    found_topics = {topic['topic'] for topic in meeting_info['topics']}
+    return _recall(topics, found_topics), _recall(attendees, meeting_info['attendees'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--topics', type=int, nargs='+', default=[5, 20, 40])
+    parser.add_argument('--context', type=int, default=4000, help='模拟的上下文窗口（字符）')
+    parser.add_argument('--chunk-chars', type=int, default=config.LLM_CHUNK_MAX_CHARS or 3000,
+                        help='分块长度（默认取 LLM_CHUNK_MAX_CHARS，未启用时取接近 --context 的 3000）')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--latency', type=float, default=0.2, help='每次调用的固定耗时（秒）')
+    parser.add_argument('--per-char', type=float, default=0.0002, help='每个提示词字符的耗时（秒）')
+    parser.add_argument('--timeout', type=float, default=config.OLLAMA_READ_TIMEOUT)
+    args = parser.parse_args()
+
+    server = start_stub_server(latency=args.latency, response_text=None,
+                               per_char_latency=args.per_char, context_chars=args.context)
+    client = OllamaHTTPClient(host=f"http://127.0.0.1:{server.server_address[1]}",
+                              read_timeout=args.timeout, pool_size=max(args.concurrency))
+
+    with quiet():
+        from app import build_extraction_prompt, parse_meeting_info
+
+    def llm(prompt):
+        try:
+            return client.generate(prompt)
+        except OllamaError:
+            return ''
+
+    print(f"{'topics':>6}{'chars':>8}{'mode':>14}{'seconds':>10}{'topic recall':>14}{'attendee recall':>17}")
+    for topic_count in args.topics:
+        transcript = generate_transcript(topic_count, filler_sentences=6, style='structured')
+        text = transcript['text']
+        topics = [topic['topic'] for topic in transcript['topics']]
+        attendees = transcript['attendees']
+        rows = []
+        with quiet():
+            start = time.perf_counter()
+            info = parse_meeting_info(llm(build_extraction_prompt(text)))
+            rows.append(('single', time.perf_counter() - start, info))
+            for concurrency in args.concurrency:
+                start = time.perf_counter()
+                info, _ = extract_chunked(text, llm, parse_meeting_info, build_extraction_prompt,
+                                          args.chunk_chars, concurrency)
+                rows.append((f'chunked x{concurrency}', time.perf_counter() - start, info))
+        for mode, seconds, info in rows:
+            topic_recall, attendee_recall = _score(info, topics, attendees)
+            print(f"{topic_count:>6}{len(text):>8}{mode:>14}{seconds:>10.2f}"
+                  f"{topic_recall:>14.0%}{attendee_recall:>17.0%}")
+
+    client.close()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""会议类型检测基准：关键词规则 vs n-gram 分类器的准确率与吞吐量（需要 numpy）
+
+在合成的标注语料上评估（benchmarks.corpus.labeled_transcripts）：一半议题含词典关键词，
+一半换了说法（PARAPHRASED_SUBJECTS）。训练集与测试集使用不同的随机种子。用法::
+
+    cd backend
+    python -m benchmarks.bench_classifier [--train 800] [--test 400] [--model meeting_types.npz]
+    python -m benchmarks.bench_classifier --write-corpus labeled.jsonl   # 导出训练语料
+
+不指定 ``--model`` 时在训练集上现场训练。``--check`` 先校验实时会话按片段累加的 n-gram 计数
+与对全文统计的结果一致。合成语料的措辞有限，准确率只用于对比两种方法；
+实际效果取决于用来训练的标注语料。
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import config
+from benchmarks.corpus import labeled_transcripts
+from benchmarks.harness import quiet
+from keyword_matcher import get_meeting_type_matcher
+
+with quiet():
+    import app
+    from live_session import LiveSession
+
+try:
+    from meeting_classifier import MeetingTypeClassifier, np, train_classifier
+except ImportError:
+    np = None
+
+
+def keyword_rule(texts):
+    matcher = get_meeting_type_matcher()
+    return [app.keyword_meeting_type(matcher.count_categories(text)) for text in texts]
+
+
+def combined(classifier, texts):
+    """与 app.detect_meeting_types 相同：置信度不足时退回关键词规则"""
+    labels = classifier.predict(texts, config.MEETING_TYPE_MIN_CONFIDENCE)
+    fallback = keyword_rule(texts)
+    return [label or keyword for label, keyword in zip(labels, fallback)]
+
+
+def check_live_counts(classifier, texts, seed=0):
+    """实时会话按随机长度的片段追加后，累加的 n-gram 计数应与对全文统计的结果相同"""
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'model.npz')
+        classifier.save(path)
+        model_path, config.MEETING_TYPE_MODEL = config.MEETING_TYPE_MODEL, path
+        try:
+            for text in texts:
+                session = LiveSession(app.clean_attendees, app.leader_from_segment, app.preparation_from_segment,
+                                      app.keyword_meeting_type)
+                pos = 0
+                while pos < len(text):
+                    end = pos + rng.choice([1, 2, 3, 5, 40])
+                    session.append(text[pos:end])
+                    pos = end
+                    if not np.array_equal(session._ngram_counts, classifier.ngram_counts(text[:pos])):
+                        return False
+        finally:
+            config.MEETING_TYPE_MODEL = model_path
+    return True
+
+
+def accuracy(predicted, expected):
+    return sum(p == e for p, e in zip(predicted, expected)) / len(expected) if expected else 0.0
+
+
+def throughput(func, texts, min_time):
+    """每秒处理的文本数"""
+    count = 0
+    start = time.perf_counter()
+    while count == 0 or time.perf_counter() - start < min_time:
+        func(texts)
+        count += len(texts)
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--train', type=int, default=800, help='训练集样本数')
+    parser.add_argument('--test', type=int, default=400, help='测试集样本数')
+    parser.add_argument('--model', help='已训练的模型文件（默认在训练集上现场训练）')
+    parser.add_argument('--write-corpus', help='把训练集写为 JSONL 标注语料后退出')
+    parser.add_argument('--min-time', type=float, default=1.0, help='吞吐量每项至少累计运行的秒数')
+    parser.add_argument('--check', action='store_true', help='校验实时会话的增量 n-gram 计数与全文一致')
+    args = parser.parse_args()
+
+    train_set = labeled_transcripts(args.train, seed=1)
+    if args.write_corpus:
+        with open(args.write_corpus, 'w', encoding='utf-8') as f:
+            for text, label, _ in train_set:
+                f.write(json.dumps({'text': text, 'label': label}, ensure_ascii=False) + '\n')
+        print(f"已写入 {args.write_corpus}：{len(train_set)} 条样本")
+        return 0
+    if np is None:
+        sys.exit("会议类型分类器需要 numpy（pip install numpy）")
+
+    if args.model:
+        classifier = MeetingTypeClassifier.load(args.model)
+        print(f"模型: {args.model}")
+    else:
+        start = time.perf_counter()
+        classifier = train_classifier([text for text, _, _ in train_set], [label for _, label, _ in train_set])
+        print(f"训练: {len(train_set)} 条样本，{time.perf_counter() - start:.2f} s")
+
+    test_set = labeled_transcripts(args.test, seed=2)
+    if args.check:
+        if not check_live_counts(classifier, [text for text, _, _ in test_set[:20]]):
+            print("❌ 实时会话的增量 n-gram 计数与全文不一致")
+            sys.exit(1)
+        print("✅ 实时会话的增量 n-gram 计数与全文一致")
+
+    subsets = {
+        'keyword terms': [item for item in test_set if not item[2]],
+        'paraphrased': [item for item in test_set if item[2]],
+        'all': test_set,
+    }
+    methods = {
+        'keyword rule': keyword_rule,
+        'classifier': classifier.predict,
+        'classifier+fallback': lambda texts: combined(classifier, texts),
+    }
+    print(f"\n{'accuracy':<22}" + ''.join(f"{name:>16}" for name in subsets))
+    for method, func in methods.items():
+        row = f"{method:<22}"
+        for items in subsets.values():
+            texts = [text for text, _, _ in items]
+            row += f"{accuracy(func(texts), [label for _, label, _ in items]):>16.1%}"
+        print(row)
+
+    texts = [text for text, _, _ in test_set]
+    average_chars = sum(map(len, texts)) / len(texts)
+    print(f"\n{'throughput (texts/s)':<22}{'':>16}   平均 {average_chars:.0f} 字符")
+    rows = {
+        'keyword rule': lambda batch: keyword_rule(batch),
+        'app.detect_meeting_type': lambda batch: [app.detect_meeting_type(text) for text in batch],
+        'classifier one by one': lambda batch: [classifier.predict([text]) for text in batch],
+        'classifier batch': classifier.predict,
+    }
+    for name, func in rows.items():
+        print(f"{name:<22}{throughput(func, texts, args.min_time):>16.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""端到端基准：通过 Flask 测试客户端请求 /extract 与 /generate
+
+合成语料都能被直接解析，不会调用 Ollama。/generate 默认关闭文档缓存测量实际渲染，
+另外单独测量命中文档缓存与带 If-None-Match 返回 304 的耗时。用法::
+
+    cd backend
+    python -m benchmarks.bench_e2e [--sizes paragraph page long huge]
+"""
+import argparse
+
+import config
+from benchmarks.corpus import SIZES, corpus
+from benchmarks.harness import measure, print_results, quiet
+
+with quiet():
+    import app
+
+
+def _post(client, path, payload, headers=None, status=200):
+    response = client.post(path, json=payload, headers=headers)
+    if response.status_code != status:
+        raise RuntimeError(f"{path} 返回 {response.status_code}: {response.data[:200]!r}")
+    return response
+
+
+def run(sizes=('paragraph', 'page', 'long', 'huge'), min_time=0.2):
+    """返回 {"接口[规模/写法]": 毫秒}"""
+    client = app.create_app(warm_ollama=False).test_client()
+    results = {}
+    cache_enabled = config.DOCUMENT_CACHE_ENABLED
+    config.DOCUMENT_CACHE_ENABLED = False
+    with quiet():
+        for size, transcript in corpus(sizes):
+            text = transcript['text']
+            suffix = f"[{size}/{transcript['style']}]"
+            results[f'POST /extract{suffix}'] = measure(
+                lambda: _post(client, '/extract', {'text': text}), min_time
+            )
+            results[f'POST /generate text{suffix}'] = measure(
+                lambda: _post(client, '/generate', {'text': text}), min_time
+            )
+            extraction_id = _post(client, '/extract', {'text': text}).json['extraction_id']
+            results[f'POST /generate extraction_id{suffix}'] = measure(
+                lambda: _post(client, '/generate', {'extraction_id': extraction_id}), min_time
+            )
+
+            config.DOCUMENT_CACHE_ENABLED = True
+            etag = _post(client, '/generate', {'extraction_id': extraction_id}).headers['ETag']
+            results[f'POST /generate cached{suffix}'] = measure(
+                lambda: _post(client, '/generate', {'extraction_id': extraction_id}), min_time
+            )
+            results[f'POST /generate 304{suffix}'] = measure(
+                lambda: _post(client, '/generate', {'extraction_id': extraction_id},
+                              headers={'If-None-Match': etag}, status=304), min_time
+            )
+            config.DOCUMENT_CACHE_ENABLED = False
+    config.DOCUMENT_CACHE_ENABLED = cache_enabled
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=['paragraph', 'page', 'long', 'huge'])
+    parser.add_argument('--min-time', type=float, default=0.2, help='每项至少累计运行的秒数')
+    args = parser.parse_args()
+    print_results(run(args.sizes, args.min_time))
+
+
+if __name__ == '__main__':
+    main()
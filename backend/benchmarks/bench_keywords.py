@@ -0,0 +1,78 @@
+"""会议类型关键词匹配基准：逐词 ``in`` 扫描 vs Aho-Corasick 自动机
+
+用法::
+
+    cd backend
+    python -m benchmarks.bench_keywords [--sizes 45 150 1000 5000] [--text-chars 20000]
+
+``matcher ms`` 为 KeywordAutomaton 的默认行为（关键词少于 AUTOMATON_MIN_KEYWORDS 时逐词查找）；
+最后一行为 get_meeting_type_matcher() 命中缓存时每次调用的开销。
+"""
+import argparse
+import random
+import time
+
+from benchmarks.corpus import transcript_of_size
+from keyword_matcher import AUTOMATON_MIN_KEYWORDS, KeywordAutomaton, get_meeting_type_matcher
+
+CJK_START = 0x4E00
+
+
+def _synthetic_dictionary(size, seed=7):
+    rng = random.Random(seed)
+    builtin = get_meeting_type_matcher()
+    categories = {category: [] for category in builtin.categories}
+    for keyword_id, keyword in enumerate(builtin.keywords):
+        categories[builtin.categories[builtin.keyword_categories[keyword_id][0]]].append(keyword)
+    names = list(categories)
+    for i in range(max(size - len(builtin.keywords), 0)):
+        word = ''.join(chr(CJK_START + rng.randrange(3000)) for _ in range(rng.randint(2, 4)))
+        categories[names[i % len(names)]].append(word)
+    return categories
+
+
+def _transcript_text(chars):
+    """约 chars 个字符的合成会议记录（与实际转写文本的字符分布相近）"""
+    return transcript_of_size(chars)['text']
+
+
+def _timeit(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[45, 150, 300, 1000, 5000])
+    parser.add_argument('--text-chars', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    text = _transcript_text(args.text_chars)
+    print(f"自动机阈值: {AUTOMATON_MIN_KEYWORDS} 个关键词")
+    print(f"{'keywords':>10}{'in-scan ms':>14}{'automaton ms':>16}{'matcher ms':>14}{'build ms':>12}")
+    for size in args.sizes:
+        categories = _synthetic_dictionary(size)
+        start = time.perf_counter()
+        automaton = KeywordAutomaton(categories, min_keywords=0)
+        build = time.perf_counter() - start
+        matcher = KeywordAutomaton(categories)
+
+        def legacy():
+            return {c: sum(k in text for k in kws) for c, kws in categories.items()}
+
+        assert legacy() == automaton.count_categories(text) == matcher.count_categories(text)
+        legacy_time = _timeit(legacy, args.repeat)
+        automaton_time = _timeit(lambda: automaton.count_categories(text), args.repeat)
+        matcher_time = _timeit(lambda: matcher.count_categories(text), args.repeat)
+        print(f"{len(automaton.keywords):>10}{legacy_time * 1e3:>14.2f}"
+              f"{automaton_time * 1e3:>16.2f}{matcher_time * 1e3:>14.2f}{build * 1e3:>12.1f}")
+
+    lookup_time = _timeit(get_meeting_type_matcher, 10000)
+    print(f"\nget_meeting_type_matcher(): {lookup_time * 1e6:.2f} µs/调用")
+
+
+if __name__ == '__main__':
+    main()
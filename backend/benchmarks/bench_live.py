@@ -0,0 +1,56 @@
+"""实时转写基准：会话增量解析 vs 每次追加后重新解析全文
+
+模拟转写结果按固定长度的片段陆续到达，比较两种方式的总耗时、最后一次追加的耗时，
+并核对增量结果与全文解析一致::
+
+    cd backend
+    python -m benchmarks.bench_live [--chars 3000 30000] [--chunk 80]
+"""
+import argparse
+import time
+
+from benchmarks.corpus import transcript_of_size
+from benchmarks.harness import quiet
+
+with quiet():
+    import app
+    from live_session import LiveSession
+
+
+def _feed(text, chunk, step):
+    """依次把片段交给 step，返回 (总秒数, 最后一次的毫秒数)"""
+    last = 0.0
+    start = time.perf_counter()
+    for pos in range(0, len(text), chunk):
+        step_start = time.perf_counter()
+        step(pos + chunk)
+        last = time.perf_counter() - step_start
+    return time.perf_counter() - start, last * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chars', type=int, nargs='+', default=[3000, 30000])
+    parser.add_argument('--chunk', type=int, default=80, help='每次追加的字符数')
+    parser.add_argument('--styles', nargs='+', default=['structured', 'narrative'])
+    args = parser.parse_args()
+
+    print(f"{'chars':>8}{'style':>12}{'appends':>9}{'mode':>13}{'total s':>10}{'last ms':>10}{'match':>7}")
+    for chars in args.chars:
+        for style in args.styles:
+            text = transcript_of_size(chars, style=style)['text']
+            appends = -(-len(text) // args.chunk)
+            with quiet():
+                expected = app.parse_meeting_info(text)
+                session = LiveSession(app.clean_attendees, app.leader_from_segment, app.preparation_from_segment,
+                                      app.keyword_meeting_type)
+                offsets = iter(range(0, len(text), args.chunk))
+                live = _feed(text, args.chunk, lambda end: session.append(text[next(offsets):end]))
+                reparse = _feed(text, args.chunk, lambda end: app.parse_meeting_info(text[:end]))
+            match = 'yes' if session.meeting_info == expected else 'NO'
+            for mode, (total, last) in (('session', live), ('reparse', reparse)):
+                print(f"{len(text):>8}{style:>12}{appends:>9}{mode:>13}{total:>10.3f}{last:>10.3f}{match:>7}")
+
+
+if __name__ == '__main__':
+    main()
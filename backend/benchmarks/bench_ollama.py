@@ -0,0 +1,77 @@
+"""Ollama 客户端基准：连接池 HTTP vs 每次新建连接 vs ``ollama run`` 子进程
+
+使用本地桩服务（benchmarks.ollama_stub），无需真实模型::
+
+    cd backend
+    python -m benchmarks.bench_ollama [--requests 200] [--concurrency 8] [--latency 0.005]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.ollama_stub import start_stub_server
+from ollama_client import OllamaHTTPClient, OllamaSubprocessClient
+
+PROMPT = "请从以下会议内容中提取关键信息：下周三下午三点在三楼开会。"
+
+
+def _measure(call, requests, concurrency):
+    latencies = []
+
+    def one(_):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(requests)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'p50': statistics.median(latencies),
+        'p95': latencies[int(len(latencies) * 0.95) - 1],
+        'rps': requests / elapsed
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--latency', type=float, default=0.005, help='桩服务模拟的推理耗时（秒）')
+    args = parser.parse_args()
+
+    server = start_stub_server(latency=args.latency)
+    host = f"http://127.0.0.1:{server.server_address[1]}"
+
+    pooled = OllamaHTTPClient(host=host, pool_size=args.concurrency)
+
+    def fresh_connection():
+        client = OllamaHTTPClient(host=host, pool_size=1)
+        client.generate(PROMPT)
+        client.close()
+
+    # 命令行桩的模拟推理耗时与 HTTP 桩一致
+    os.environ['OLLAMA_STUB_LATENCY'] = str(args.latency)
+    cli = OllamaSubprocessClient(command=f"{sys.executable} -m benchmarks.ollama_stub")
+
+    modes = [
+        ('http pooled', lambda: pooled.generate(PROMPT), args.requests),
+        ('http new connection', fresh_connection, args.requests),
+        ('subprocess', lambda: cli.generate(PROMPT), max(args.requests // 10, args.concurrency)),
+    ]
+    print(f"{'mode':<22}{'p50 ms':>10}{'p95 ms':>10}{'req/s':>10}")
+    for name, call, requests in modes:
+        result = _measure(call, requests, args.concurrency)
+        print(f"{name:<22}{result['p50'] * 1e3:>10.2f}{result['p95'] * 1e3:>10.2f}{result['rps']:>10.1f}")
+
+    pooled.close()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
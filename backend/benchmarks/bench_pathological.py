@@ -0,0 +1,77 @@
+"""病态输入基准：线性扫描器（PARSE_MODE=linear）与回溯正则（regex）的耗时随长度的增长
+
+每种病态输入按长度倍增，比较直接解析的耗时；linear 模式下每千字耗时应基本不变::
+
+    cd backend
+    python -m benchmarks.bench_pathological [--chars 4000 16000 64000] [--regex-chars 500 1000]
+    python -m benchmarks.bench_pathological --check   # linear 模式每千字耗时增长超过 3 倍时退出码为 1
+
+model_output_no_separator 测量的是去掉模型输出前缀（strip_preamble），不是直接解析。
+regex 模式在 location_whitespace 上的耗时随长度立方增长，默认只测很短的输入。
+"""
+import argparse
+import re
+import sys
+
+import config
+from benchmarks.corpus import PATHOLOGICAL, pathological_input
+from benchmarks.harness import measure, quiet
+from linear_scan import MODE_LINEAR, MODE_REGEX, strip_preamble
+from regex_patterns import RegexHelper
+
+with quiet():
+    import app
+
+
+def _parse(mode, text, min_time):
+    config.PARSE_MODE = mode
+    return measure(lambda: app.parse_meeting_info(text), min_time, min_repeat=1)
+
+
+def _strip(mode, text, min_time):
+    if mode == MODE_LINEAR:
+        return measure(lambda: strip_preamble(text), min_time, min_repeat=1)
+    return measure(lambda: RegexHelper.safe_sub(r'^.*?---', '', text, re.DOTALL), min_time, min_repeat=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chars', type=int, nargs='+', default=[4000, 16000, 64000])
+    parser.add_argument('--regex-chars', type=int, nargs='*', default=[500, 1000],
+                        help='regex 模式测量的长度（为空则不测）')
+    parser.add_argument('--cases', nargs='+', default=list(PATHOLOGICAL), choices=list(PATHOLOGICAL))
+    parser.add_argument('--min-time', type=float, default=0.1)
+    parser.add_argument('--check', action='store_true', help='检查 linear 模式每千字耗时是否有界')
+    args = parser.parse_args()
+
+    # 只比较扫描耗时，不受单次解析的时间上限影响
+    config.PARSE_TIME_LIMIT = 0
+    original_mode = config.PARSE_MODE
+    unbounded = []
+    print(f"{'case':<28}{'mode':>8}{'chars':>9}{'ms':>11}{'ms/1k chars':>13}")
+    try:
+        for case in args.cases:
+            run = _strip if case == 'model_output_no_separator' else _parse
+            for mode, sizes in ((MODE_REGEX, args.regex_chars), (MODE_LINEAR, args.chars)):
+                per_k = []
+                for chars in sizes:
+                    text = pathological_input(case, chars)
+                    with quiet():
+                        ms = run(mode, text, args.min_time)
+                    per_k.append(ms * 1000 / len(text))
+                    print(f"{case:<28}{mode:>8}{len(text):>9}{ms:>11.2f}{per_k[-1]:>13.3f}")
+                if mode == MODE_LINEAR and len(per_k) > 1 and per_k[-1] > 3 * per_k[0]:
+                    unbounded.append(case)
+    finally:
+        config.PARSE_MODE = original_mode
+
+    if args.check:
+        if unbounded:
+            print(f"linear 模式耗时随长度超线性增长: {', '.join(unbounded)}")
+            return 1
+        print("linear 模式在所有病态输入上耗时与长度成正比")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
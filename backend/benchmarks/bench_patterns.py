@@ -0,0 +1,107 @@
+"""直接解析微基准：当前实现与改动前的原始实现（benchmarks/legacy_parse.py）的单次解析耗时
+
+用法::
+
+    cd backend
+    python -m benchmarks.bench_patterns [--repeat 2000]
+    python -m benchmarks.bench_patterns --check   # 议题提取回归输入不符合预期时退出码为 1
+
+基线是原始 app.py 的解析函数原样拷贝（逐次以字符串模式调用 re、print 调试输出），
+当前实现分别以 linear（默认）与 regex 两种 PARSE_MODE 测量；当前实现另含阶段耗时指标与解析时间上限检查。
+"""
+import argparse
+import contextlib
+import io
+import sys
+import time
+
+import config
+import linear_scan
+from benchmarks import legacy_parse
+from benchmarks.harness import quiet
+
+with quiet():
+    from app import parse_meeting_info
+
+SAMPLE_TEXT = (
+    "下周三下午三点，我想在公司三楼的大会议室开个会，参会的有市场部的李明、张娜，"
+    "技术部的王磊，还有新来的实习生赵晓雨。会议主要说三件事，一是讨论下季度的产品"
+    "推广方案，特别是线上广告投放的预算分配，李明你准备下相关数据；二是同步下新版"
+    "APP的研发进度，王磊负责这块；三是安排下月底的团建活动，张娜你牵头，大家看看"
+    "想去近郊的民宿还是去爬山，赵晓雨可以多听听大家的意见。对了，会议大概开两个"
+    "小时，记得提前把会议资料发到群里。"
+)
+
+# 议题提取的回归输入与预期议题（两种 PARSE_MODE 下都应一致）
+TOPIC_CASES = [
+    ("议题一是预算，议题二是招聘", ['预算', '招聘']),
+    ("会议有两个议题：第一、预算；第二、招聘。", ['预算', '招聘']),
+    ("事项1.预算，事项2.招聘", ['预算', '招聘']),
+    ("参会的有张三、李四。", []),
+]
+
+
+def check_topics():
+    """返回不符合预期的 (模式, 输入, 实际议题) 列表"""
+    failures = []
+    mode = config.PARSE_MODE
+    try:
+        for parse_mode in (linear_scan.MODE_LINEAR, linear_scan.MODE_REGEX):
+            config.PARSE_MODE = parse_mode
+            for text, expected in TOPIC_CASES:
+                topics = [topic['topic'] for topic in parse_meeting_info(text)['topics']]
+                if topics != expected:
+                    failures.append((parse_mode, text, topics))
+    finally:
+        config.PARSE_MODE = mode
+    return failures
+
+
+def _run(parse, repeat):
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink):
+        parse(SAMPLE_TEXT)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            parse(SAMPLE_TEXT)
+            sink.seek(0)
+            sink.truncate()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=2000)
+    parser.add_argument('--check', action='store_true', help='校验议题提取的回归输入')
+    args = parser.parse_args()
+
+    if args.check:
+        failures = check_topics()
+        for parse_mode, text, topics in failures:
+            print(f"❌ [{parse_mode}] {text!r} -> {topics}")
+        if failures:
+            sys.exit(1)
+        print(f"✅ {len(TOPIC_CASES)} 个议题回归输入符合预期")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = legacy_parse.parse_meeting_info(SAMPLE_TEXT)
+    if parse_meeting_info(SAMPLE_TEXT) != expected:
+        print("⚠️ 当前解析结果与基线实现不一致")
+
+    results = {'baseline (original app.py)': _run(legacy_parse.parse_meeting_info, args.repeat)}
+    mode = config.PARSE_MODE
+    try:
+        for parse_mode in (linear_scan.MODE_LINEAR, linear_scan.MODE_REGEX):
+            config.PARSE_MODE = parse_mode
+            results[f'current ({parse_mode})'] = _run(parse_meeting_info, args.repeat)
+    finally:
+        config.PARSE_MODE = mode
+
+    base = results['baseline (original app.py)']
+    print(f"{'mode':<30}{'us/parse':>12}{'ratio':>10}")
+    for name, seconds in results.items():
+        print(f"{name:<30}{seconds * 1e6:>12.1f}{seconds / base:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""文档渲染基准：各渲染器在不同议题数下每秒生成的文档数
+
+用法::
+
+    cd backend
+    python -m benchmarks.bench_render [--topics 1 10 100] [--seconds 2] [--check [--template custom.docx]]
+
+``--check`` 先校验 ooxml 渲染器与 template 渲染器输出的各部件（含 word/document.xml）逐字节一致，
+不一致时列出部件名并以退出码 1 结束。ooxml 渲染器按 template 的输出逐字拼接 XML，
+修改 ooxml_renderer.py 或 word_generator.py 后必须运行；``--template`` 指定自定义基础模板
+（默认取 DOCX_TEMPLATE_PATH，留空为内置模板）。
+"""
+import argparse
+import io
+import sys
+import time
+import zipfile
+
+import config
+from word_generator import create_document_generator
+
+RENDERERS = ['classic', 'template', 'ooxml']
+
+
+def sample_meeting_info(topic_count):
+    """构造指定议题数的会议信息"""
+    return {
+        'theme': '季度产品推广方案评审',
+        'host': '李明',
+        'location': '公司三楼大会议室',
+        'attendees': '市场部的李明，张娜，技术部的王磊，实习生赵晓雨',
+        'duration': '两个小时',
+        'meeting_type': '商务会议',
+        'topics': [
+            {
+                'topic': f'讨论第{i + 1}项工作的推进计划与预算分配',
+                'leader': ['李明', '张娜', '王磊'][i % 3],
+                'preparation': '相关数据' if i % 2 == 0 else '无'
+            }
+            for i in range(topic_count)
+        ]
+    }
+
+
+def render_parts(renderer, meeting_info, template_path=None):
+    """渲染文档并返回 {部件名: 字节}"""
+    buffer = io.BytesIO()
+    create_document_generator(renderer, template_path).create_meeting_document(meeting_info, buffer)
+    with zipfile.ZipFile(buffer) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+def check_parity(meeting_info, renderer='ooxml', reference='template', template_path=None):
+    """比较两个渲染器的输出，返回不一致的部件名列表"""
+    expected = render_parts(reference, meeting_info, template_path)
+    actual = render_parts(renderer, meeting_info, template_path)
+    names = sorted(set(expected) | set(actual))
+    return [name for name in names if expected.get(name) != actual.get(name)]
+
+
+def docs_per_second(renderer, meeting_info, seconds):
+    generator = create_document_generator(renderer)
+    # 预热：模板构建、模块导入等一次性开销不计入
+    generator.create_meeting_document(meeting_info, io.BytesIO())
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        generator.create_meeting_document(meeting_info, io.BytesIO())
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--topics', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--renderers', nargs='+', default=RENDERERS)
+    parser.add_argument('--seconds', type=float, default=2.0)
+    parser.add_argument('--check', action='store_true', help='校验 ooxml 与 template 输出一致')
+    parser.add_argument('--template', default=config.DOCX_TEMPLATE_PATH or None,
+                        help='校验时使用的自定义基础模板（.docx）')
+    args = parser.parse_args()
+
+    if args.check:
+        edge_case = sample_meeting_info(3)
+        edge_case.update({'theme': ' 前后空格 ', 'host': 'A&B <C>', 'duration': '一\t二\n三'})
+        edge_case['preparation_items'] = '会议资料'
+        empty_topic = {'attendees': '', 'topics': [{'topic': ''}]}
+        cases = [sample_meeting_info(n) for n in [0] + args.topics] + [edge_case, empty_topic, {}]
+        for meeting_info in cases:
+            mismatched = check_parity(meeting_info, template_path=args.template)
+            if mismatched:
+                print(f"❌ 输出不一致（{len(meeting_info.get('topics', []))} 个议题）: {mismatched}")
+                sys.exit(1)
+        print(f"✅ ooxml 与 template 输出一致（{len(cases)} 份文档，模板：{args.template or '内置'}）")
+
+    header = f"{'topics':>8}" + ''.join(f"{name + ' doc/s':>18}" for name in args.renderers)
+    print(header)
+    for topic_count in args.topics:
+        meeting_info = sample_meeting_info(topic_count)
+        row = f"{topic_count:>8}"
+        for renderer in args.renderers:
+            row += f"{docs_per_second(renderer, meeting_info, args.seconds):>18.1f}"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""解析与渲染各阶段基准：在合成语料上分别测量每个阶段的耗时
+
+用法::
+
+    cd backend
+    python -m benchmarks.bench_stages [--sizes paragraph page long huge]
+"""
+import argparse
+import io
+
+from benchmarks.corpus import SIZES, corpus
+from benchmarks.harness import measure, print_results, quiet
+
+with quiet():
+    import app
+    from linear_scan import field_patterns
+    from topic_index import build_topic_index
+    from word_generator import create_document_generator
+
+# 单独计时的字段（参会人员另有清理步骤，见 extract_attendees）
+FIELDS = ['theme', 'host', 'location', 'duration']
+RENDERERS = ['classic', 'template', 'ooxml']
+
+
+def _topic_details(text, topic_index):
+    topics = app.extract_topics(text, None, topic_index)
+    for i, topic in enumerate(topics):
+        topic['leader'] = app.extract_leader_for_topic(text, topic, i, topic_index)
+        topic['preparation'] = app.extract_preparation_for_topic(text, topic, i, topic_index)
+    return topics
+
+
+def stage_benchmarks(text, min_time=0.2):
+    """单份文本各阶段的耗时（毫秒）"""
+    results = {}
+    with quiet():
+        results['detect_meeting_type'] = measure(lambda: app.detect_meeting_type(text), min_time)
+        for field in FIELDS:
+            patterns = field_patterns()[field]
+            results[f'extract_field.{field}'] = measure(lambda: app.extract_field(text, patterns), min_time)
+        results['extract_attendees'] = measure(lambda: app.extract_attendees(text), min_time)
+        results['topic_index'] = measure(lambda: build_topic_index(text), min_time)
+        topic_index = build_topic_index(text)
+        results['extract_topics'] = measure(lambda: app.extract_topics(text, None, topic_index), min_time)
+        results['topic_details'] = measure(lambda: _topic_details(text, topic_index), min_time)
+        results['parse_meeting_info'] = measure(lambda: app.parse_meeting_info(text), min_time)
+
+        meeting_info = app.parse_meeting_info(text)
+        for renderer in RENDERERS:
+            generator = create_document_generator(renderer)
+            results[f'render.{renderer}'] = measure(
+                lambda: generator.create_meeting_document(meeting_info, io.BytesIO()), min_time
+            )
+    return results
+
+
+def run(sizes=('paragraph', 'page', 'long', 'huge'), min_time=0.2):
+    """在各规模语料上运行阶段基准，返回 {"stage[规模/写法]": 毫秒}"""
+    results = {}
+    for size, transcript in corpus(sizes):
+        for stage, ms in stage_benchmarks(transcript['text'], min_time).items():
+            results[f"{stage}[{size}/{transcript['style']}]"] = ms
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=['paragraph', 'page', 'long', 'huge'])
+    parser.add_argument('--min-time', type=float, default=0.2, help='每项至少累计运行的秒数')
+    args = parser.parse_args()
+    print_results(run(args.sizes, args.min_time))
+
+
+if __name__ == '__main__':
+    main()
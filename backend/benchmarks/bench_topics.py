@@ -0,0 +1,131 @@
+"""议题数扩展基准：议题数从 10 增长到 1000 时每份文档的渲染耗时与内存峰值
+
+用法::
+
+    cd backend
+    python -m benchmarks.bench_topics [--topics 10 100 1000] [--renderers template legacy] [--check]
+
+``legacy`` 是逐个 table.cell() / merge() 构建内容表格的旧写法（基于 template 渲染器），
+用于对比；其耗时随议题数平方增长（400 个议题约需十几秒），默认只测到 ``--legacy-max`` 个议题。
+
+``peak KB`` 是 tracemalloc 统计的单次渲染期间 Python 对象的峰值分配；lxml 元素树由 libxml2
+在 C 层分配，不在其中，其规模可参考 ``xml KB``（未压缩的 document.xml 大小）。
+``--check`` 先校验按行构建与旧写法输出的 document.xml 逐字节一致。
+"""
+import argparse
+import io
+import sys
+import time
+import tracemalloc
+import zipfile
+
+from docx.enum.table import WD_TABLE_ALIGNMENT
+
+from benchmarks.bench_render import sample_meeting_info
+from word_generator import TemplateWordMeetingGenerator, create_document_generator
+
+RENDERERS = ['classic', 'template', 'ooxml', 'legacy']
+TOPIC_COUNTS = [10, 50, 100, 200, 500, 1000]
+
+
+class LegacyContentTableGenerator(TemplateWordMeetingGenerator):
+    """内容表格按单元格构建的旧写法：每行 table.cell() + merge()"""
+
+    def _create_content_table(self, meeting_info):
+        topics = meeting_info.get('topics', [])
+        num_rows = 2 + len(topics)
+        table = self.document.add_table(rows=num_rows, cols=2)
+        table.alignment = WD_TABLE_ALIGNMENT.LEFT
+        table.cell(0, 0).merge(table.cell(0, 1))
+        header_paragraph = table.cell(0, 0).paragraphs[0]
+        self._format_run(header_paragraph.add_run("会议内容记录"), 'header')
+        self._format_paragraph(header_paragraph, 'header')
+        for i, topic in enumerate(topics, 1):
+            topic_cell = table.cell(i, 0)
+            topic_cell.merge(table.cell(i, 1))
+            topic_para = topic_cell.paragraphs[0]
+            self._format_run(topic_para.add_run(f"议题{i}：{topic.get('topic', '')}"), 'topic')
+            self._format_paragraph(topic_para, 'topic')
+            for text in (f"负责人：{topic.get('leader', '未指定')}", f"会前准备：{topic.get('preparation', '无')}"):
+                paragraph = topic_cell.add_paragraph()
+                self._format_paragraph(paragraph, 'detail')
+                self._format_run(paragraph.add_run(text), 'body')
+        if meeting_info.get('preparation_items', '') and num_rows > 2:
+            prep_cell = table.cell(num_rows - 1, 0)
+            prep_cell.merge(table.cell(num_rows - 1, 1))
+            prep_run = prep_cell.paragraphs[0].add_run(f"会前准备事项：{meeting_info.get('preparation_items')}")
+            self._format_run(prep_run, 'body')
+
+
+def create_generator(renderer):
+    if renderer == 'legacy':
+        return LegacyContentTableGenerator()
+    return create_document_generator(renderer)
+
+
+def document_xml(generator, meeting_info):
+    buffer = io.BytesIO()
+    generator.create_meeting_document(meeting_info, buffer)
+    with zipfile.ZipFile(buffer) as archive:
+        return archive.read('word/document.xml')
+
+
+def measure_render(renderer, meeting_info, min_time):
+    """返回 (每份毫秒, Python 内存峰值 KB, document.xml KB, 文档 KB)"""
+    generator = create_generator(renderer)
+    buffer = io.BytesIO()
+    # 预热：模板解析等一次性开销不计入
+    generator.create_meeting_document(meeting_info, buffer)
+    size = len(buffer.getvalue())
+    with zipfile.ZipFile(buffer) as archive:
+        xml_size = archive.getinfo('word/document.xml').file_size
+
+    count = 0
+    start = time.perf_counter()
+    while count == 0 or time.perf_counter() - start < min_time:
+        generator.create_meeting_document(meeting_info, io.BytesIO())
+        count += 1
+    elapsed_ms = (time.perf_counter() - start) * 1000 / count
+
+    tracemalloc.start()
+    generator.create_meeting_document(meeting_info, io.BytesIO())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 1024, xml_size / 1024, size / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--topics', type=int, nargs='+', default=TOPIC_COUNTS)
+    parser.add_argument('--renderers', nargs='+', choices=RENDERERS, default=RENDERERS)
+    parser.add_argument('--min-time', type=float, default=0.5, help='每项至少累计运行的秒数')
+    parser.add_argument('--legacy-max', type=int, default=200, help='legacy 最多测到的议题数')
+    parser.add_argument('--check', action='store_true', help='校验按行构建与旧写法输出一致')
+    args = parser.parse_args()
+
+    if args.check:
+        for topic_count in (0, 1, 10, 50):
+            for preparation_items in ('', '会议资料'):
+                meeting_info = sample_meeting_info(topic_count)
+                meeting_info['preparation_items'] = preparation_items
+                expected = document_xml(LegacyContentTableGenerator(), meeting_info)
+                if document_xml(create_document_generator('template'), meeting_info) != expected:
+                    print(f"❌ 输出不一致（{topic_count} 个议题）")
+                    sys.exit(1)
+        print("✅ 按行构建与旧写法输出一致")
+
+    print(f"{'renderer':>10}{'topics':>8}{'ms/doc':>12}{'µs/topic':>11}{'peak KB':>11}{'xml KB':>9}{'doc KB':>9}")
+    for renderer in args.renderers:
+        for topic_count in args.topics:
+            if renderer == 'legacy' and topic_count > args.legacy_max:
+                print(f"{renderer:>10}{topic_count:>8}{'-':>12}")
+                continue
+            elapsed_ms, peak_kb, xml_kb, size_kb = measure_render(
+                renderer, sample_meeting_info(topic_count), args.min_time
+            )
+            print(f"{renderer:>10}{topic_count:>8}{elapsed_ms:>12.2f}{elapsed_ms * 1000 / topic_count:>11.1f}"
+                  f"{peak_kb:>11.0f}{xml_kb:>9.1f}{size_kb:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
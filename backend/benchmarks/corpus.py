@@ -0,0 +1,194 @@
+"""合成中文会议记录语料（固定随机种子，结果可复现）
+
+生成的文本覆盖解析器关心的各种写法：带标签的结构化信息或口语化描述、
+中文 / 阿拉伯数字编号的议题、"XX你准备下..." / "由XX负责" 的负责人表述、
+带部门前缀的参会人员名单；长度从一段话到数 MB 不等。
+"""
+import random
+
+# 预设的文本规模（字符数）
+SIZES = {
+    'paragraph': 300,
+    'page': 3_000,
+    'long': 30_000,
+    'huge': 300_000,
+    'xl': 3_000_000,
+}
+
+NAMES = ['李明', '张娜', '王磊', '赵晓雨', '刘洋', '陈静', '杨帆', '周婷', '吴昊', '郑爽',
+         '孙悦', '马超', '黄蕾', '林峰', '何敏', '高远']
+DEPARTMENTS = ['市场部', '技术部', '产品部', '财务部', '人事部', '运营部']
+LOCATIONS = ['公司三楼的大会议室', '五楼小会议室', '二号楼报告厅', '线上腾讯会议']
+DURATIONS = ['一个小时', '两个小时', '半个小时', '三个小时', '90分钟']
+TIMES = ['下周三下午三点', '明天上午十点', '周五下午两点', '下周一早上九点']
+
+# 各会议类型的议题素材（含 dictionaries/meeting_types.json 中的关键词）
+SUBJECTS = {
+    '技术会议': ['数据库架构调整', '接口性能优化', '代码评审流程', '部署流水线改造', '测试覆盖率提升'],
+    '商务会议': ['客户合作方案', '市场推广预算', '销售策略调整', '营销活动复盘', '财务预算分配'],
+    '项目会议': ['项目里程碑回顾', '任务分工调整', '进度延期风险', '资源协调安排', '责任人确认'],
+    '团队会议': ['团队周会总结', '部门培训计划', '经验分享交流', '季度工作回顾', '新人培训讨论'],
+}
+# 换一种说法的议题素材：不含词典关键词，关键词规则识别不出（用于会议类型分类器的准确率对比）
+PARAPHRASED_SUBJECTS = {
+    '技术会议': ['服务器扩容方案', '接口联调安排', '线上故障复盘', '页面加载卡顿排查', '新版本上线回滚预案'],
+    '商务会议': ['大单报价与回款', '渠道代理商政策', '年度采购合同条款', '展会参展费用', '重点经销商续约'],
+    '项目会议': ['排期表对齐', '交付节点确认', '上线时间表梳理', '人手调配计划', '阶段验收安排'],
+    '团队会议': ['新同事入职介绍', '季度团建安排', '内部经验心得', '值班轮换制度', '本周工作复盘'],
+}
+PREPARATIONS = ['相关数据', '方案初稿', '进度报告', '预算表', '演示材料', '测试报告']
+FILLERS = [
+    '大家围绕这个问题展开了比较充分的讨论，提出了不少想法',
+    '有同事补充了上个季度的情况，整体进展比预期慢一些',
+    '讨论中也提到了几个风险点，后续跟进时需要重点关注',
+    '这部分内容和其他部门关系比较密切，后面需要再拉通对齐',
+    '现场简单过了一遍时间表，个别节点可能还要再调整',
+    '也有人提出不同意见，建议先小范围试点再全面铺开',
+]
+
+CN_DIGITS = '零一二三四五六七八九'
+MAX_TOPICS = 999
+
+
+def to_chinese_number(n):
+    """1 ~ 999 转中文数字（与 topic_index.chinese_to_int 互逆，不使用"零"）"""
+    hundreds, rest = divmod(n, 100)
+    tens, ones = divmod(rest, 10)
+    text = f"{CN_DIGITS[hundreds]}百" if hundreds else ''
+    if tens:
+        text += ('' if tens == 1 and not hundreds else CN_DIGITS[tens]) + '十'
+    if ones:
+        text += CN_DIGITS[ones]
+    return text
+
+
+def generate_transcript(topic_count=3, filler_sentences=1, seed=0, style=None, paraphrased=False):
+    """
+    生成一份会议记录
+
+    :param topic_count: 议题数（最多 999）
+    :param filler_sentences: 每个议题后附加的闲聊句数，用于加长文本
+    :param style: structured（带"会议主题："等标签）或 narrative（口语化），默认随机
+    :param paraphrased: 议题使用 PARAPHRASED_SUBJECTS（不含会议类型关键词）
+    :return: dict，text 为文本，其余字段为预期的解析结果
+    """
+    rng = random.Random(seed)
+    style = style or rng.choice(['structured', 'narrative'])
+    topic_count = max(1, min(topic_count, MAX_TOPICS))
+    subjects = PARAPHRASED_SUBJECTS if paraphrased else SUBJECTS
+    meeting_type = rng.choice(list(subjects))
+    people = rng.sample(NAMES, 6)
+    host = people[0]
+    location = rng.choice(LOCATIONS)
+    duration = rng.choice(DURATIONS)
+    theme = f"{rng.choice(subjects[meeting_type])}专题会"
+    # 议题编号：同一份文本只用一种编号方式；议题标记最多 4 个汉字，超过 99 个议题时用阿拉伯数字
+    chinese_numbering = topic_count <= 99 and (style == 'narrative' or rng.random() < 0.5)
+
+    parts = []
+    if style == 'structured':
+        parts.append(
+            f"会议主题：{theme}\n主持人：{host}\n会议地点：{location}\n"
+            f"参会人员：{'、'.join(people)}。\n会议时长：{duration}"
+        )
+        attendees = list(people)
+    else:
+        departments = rng.sample(DEPARTMENTS, 2)
+        attendees = [f"{departments[0]}的{people[0]}", people[1], people[2],
+                     f"{departments[1]}的{people[3]}", people[4], f"实习生{people[5]}"]
+        parts.append(
+            f"{rng.choice(TIMES)}，我想在{location}开个会，参会的有"
+            f"{departments[0]}的{people[0]}、{people[1]}、{people[2]}，"
+            f"{departments[1]}的{people[3]}、{people[4]}，还有新来的实习生{people[5]}。"
+            f"会议主要说{to_chinese_number(topic_count)}件事，"
+        )
+        theme = None
+
+    topics = []
+    for i in range(1, topic_count + 1):
+        subject = f"{rng.choice(subjects[meeting_type])}第{i}项"
+        leader = rng.choice(people)
+        marker = f"{to_chinese_number(i)}是" if chinese_numbering else f"{i}. "
+        if rng.random() < 0.5:
+            preparation = rng.choice(PREPARATIONS)
+            sentence = f"{marker}讨论{subject}，{leader}你准备下{preparation}；"
+        else:
+            preparation = '无'
+            sentence = f"{marker}讨论{subject}，由{leader}负责；"
+        topics.append({'topic': f"讨论{subject}", 'leader': leader, 'preparation': preparation})
+        filler = ''.join(f"{rng.choice(FILLERS)}。" for _ in range(filler_sentences))
+        parts.append(sentence + filler)
+
+    if style == 'narrative':
+        parts.append(f"对了，会议大概开{duration}，记得提前把会议资料发到群里。")
+
+    return {
+        'text': '\n'.join(parts) if style == 'structured' else ''.join(parts),
+        'style': style,
+        'meeting_type': meeting_type,
+        'theme': theme,
+        'host': host if style == 'structured' else None,
+        'location': location,
+        'duration': duration,
+        'attendees': attendees,
+        'topics': topics,
+    }
+
+
+def transcript_of_size(target_chars, seed=0, style=None):
+    """生成长度约为 target_chars 的会议记录（议题数随长度增加，超出编号上限后加长闲聊）"""
+    topic_count = max(1, min(target_chars // 250, MAX_TOPICS))
+    transcript = generate_transcript(topic_count, filler_sentences=0, seed=seed, style=style)
+    base = len(transcript['text'])
+    # 每句闲聊约 25 个字符
+    filler_sentences = max(0, (target_chars - base) // (25 * topic_count))
+    if filler_sentences:
+        transcript = generate_transcript(topic_count, filler_sentences, seed=seed, style=style)
+    return transcript
+
+
+def corpus(sizes=('paragraph', 'page', 'long'), per_size=2, seed=0):
+    """按预设规模生成一组会议记录（结构化与口语化交替），返回 [(规模名, 会议记录)]"""
+    items = []
+    for name in sizes:
+        for i in range(per_size):
+            style = 'structured' if i % 2 == 0 else 'narrative'
+            items.append((name, transcript_of_size(SIZES[name], seed=seed * 1000 + i, style=style)))
+    return items
+
+
+def labeled_transcripts(count, seed=0, paraphrased_ratio=0.5):
+    """
+    生成带会议类型标注的短会议记录（1~5 个议题），用于训练与评估会议类型分类器
+
+    :param paraphrased_ratio: 使用 PARAPHRASED_SUBJECTS 的比例
+    :return: [(文本, 会议类型, 是否换了说法)]
+    """
+    rng = random.Random(seed)
+    items = []
+    for _ in range(count):
+        paraphrased = rng.random() < paraphrased_ratio
+        transcript = generate_transcript(rng.randint(1, 5), rng.randint(0, 2), seed=rng.randrange(1 << 30),
+                                         paraphrased=paraphrased)
+        items.append((transcript['text'], transcript['meeting_type'], paraphrased))
+    return items
+
+
+# 病态输入：(前缀, 重复单元, 后缀)。回溯正则在这些输入上的耗时随长度平方（location_whitespace 为立方）增长
+PATHOLOGICAL = {
+    'theme_no_newline': ('', '会议主题：x', ''),
+    'host_no_newline': ('', '主持人：x', ''),
+    'attendees_no_end': ('', '参会：张三', ''),
+    'location_spaces': ('', '在 ', ''),
+    'location_whitespace': ('在', ' ', 'x'),
+    'duration_no_hours': ('', '大约', ''),
+    'about_no_meeting': ('', '关于', ''),
+    'preparation_no_end': ('一、预算审核，李明你准备', '李明准备x', '\r'),
+    'model_output_no_separator': ('', 'x', ''),
+}
+
+
+def pathological_input(name, target_chars):
+    """生成长度约为 target_chars 的病态输入（见 PATHOLOGICAL）"""
+    prefix, unit, suffix = PATHOLOGICAL[name]
+    return prefix + unit * max(1, (target_chars - len(prefix) - len(suffix)) // len(unit)) + suffix
@@ -0,0 +1,78 @@
+"""基准测试的计时与基线比较工具"""
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def measure(fn, min_time=0.2, min_repeat=3, max_repeat=200):
+    """
+    重复调用 fn，返回单次耗时的中位数（毫秒）
+
+    至少调用 min_repeat 次，累计耗时达到 min_time 秒或达到 max_repeat 次后停止。
+    """
+    timings = []
+    total = 0.0
+    while len(timings) < min_repeat or (total < min_time and len(timings) < max_repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed)
+        total += elapsed
+    return statistics.median(timings) * 1000
+
+
+@contextlib.contextmanager
+def quiet():
+    """屏蔽被测代码的调试输出（parse_meeting_info 等会打印日志）"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def print_results(results, file=sys.stdout):
+    width = max((len(name) for name in results), default=10)
+    for name, ms in results.items():
+        print(f"{name:<{width}}  {ms:>12.3f} ms", file=file)
+
+
+def save_baseline(results, path=DEFAULT_BASELINE):
+    data = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        },
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def load_baseline(path=DEFAULT_BASELINE):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['results']
+
+
+def compare(results, baseline, threshold=0.25, min_delta_ms=0.05):
+    """
+    与基线比较
+
+    耗时超过基线 (1 + threshold) 倍、且绝对差值超过 min_delta_ms（过滤微秒级抖动）时视为退化。
+
+    :return: [(名称, 基线毫秒, 当前毫秒, 比值, 是否退化)]，只包含两边都有的项
+    """
+    rows = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        ratio = current / base if base else float('inf')
+        regressed = current > base * (1 + threshold) and current - base > min_delta_ms
+        rows.append((name, base, current, ratio, regressed))
+    return rows
@@ -0,0 +1,140 @@
+"""本地 Ollama 桩服务，用于离线测量延迟与吞吐
+
+HTTP 服务（兼容 /api/generate、/api/version、/api/tags，支持 stream）::
+
+    python -m benchmarks.ollama_stub serve --port 11434 --latency 0.05
+
+``response_text=None`` 时为回显模式：把提示词中的会议内容原样返回，
+只保留最后 ``context_chars`` 个字符（模拟超出上下文窗口时被截断），
+推理耗时随提示词长度增加（``per_char_latency``）。
+
+命令行模式（模拟 ``ollama run <model>``，配合 OLLAMA_COMMAND 使用）::
+
+    OLLAMA_COMMAND="python -m benchmarks.ollama_stub" python app.py
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_RESPONSE = """会议主题：季度产品推广方案
+主持人：李明
+会议地点：三楼大会议室
+参会人员：李明、张娜、王磊
+会议时长：两个小时
+一是讨论推广预算，李明你准备下投放数据；二是同步研发进度，王磊负责这块。"""
+
+# 回显模式下，提示词中该标记之后的内容视为会议内容
+ECHO_MARKER = '会议内容：'
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload, status=200):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/api/version':
+            self._send_json({'version': 'stub'})
+        elif self.path == '/api/tags':
+            self._send_json({'models': [{'name': 'llama3:latest'}]})
+        else:
+            self._send_json({'error': 'not found'}, status=404)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        if self.path != '/api/generate':
+            self._send_json({'error': 'not found'}, status=404)
+            return
+
+        server = self.server
+        server.request_count += 1
+        prompt = request.get('prompt', '')
+        if server.context_chars:
+            prompt = prompt[-server.context_chars:]
+        text = server.response_text
+        if text is None:
+            text = prompt.split(ECHO_MARKER, 1)[-1]
+        latency = server.latency + server.per_char_latency * len(prompt)
+        if not request.get('stream', True):
+            time.sleep(latency)
+            self._send_json({'model': request.get('model'), 'response': text, 'done': True})
+            return
+
+        # 流式响应：NDJSON，分块传输
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        tokens = [text[i:i + 4] for i in range(0, len(text), 4)] or ['']
+        delay = latency / len(tokens)
+        for i, token in enumerate(tokens):
+            time.sleep(delay)
+            line = json.dumps({'response': token, 'done': i == len(tokens) - 1}, ensure_ascii=False) + '\n'
+            data = line.encode('utf-8')
+            self.wfile.write(f'{len(data):X}\r\n'.encode('ascii') + data + b'\r\n')
+            self.wfile.flush()
+        self.wfile.write(b'0\r\n\r\n')
+
+
+def start_stub_server(port=0, latency=0.0, response_text=DEFAULT_RESPONSE,
+                      per_char_latency=0.0, context_chars=0):
+    """在后台线程启动桩服务，返回 server（``server.server_address`` 为实际地址）"""
+    server = ThreadingHTTPServer(('127.0.0.1', port), _StubHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.response_text = response_text
+    server.per_char_latency = per_char_latency
+    server.context_chars = context_chars
+    server.request_count = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def _run_cli(latency):
+    prompt = sys.stdin.buffer.read()
+    time.sleep(latency)
+    sys.stdout.write(DEFAULT_RESPONSE if prompt else '')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='本地 Ollama 桩服务')
+    sub = parser.add_subparsers(dest='command', required=True)
+    serve = sub.add_parser('serve')
+    serve.add_argument('--port', type=int, default=11434)
+    serve.add_argument('--latency', type=float, default=0.05)
+    run = sub.add_parser('run')
+    run.add_argument('model')
+    run.add_argument('--latency', type=float,
+                     default=float(os.environ.get('OLLAMA_STUB_LATENCY', 0.05)))
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        _run_cli(args.latency)
+        return
+    server = start_stub_server(args.port, args.latency)
+    print(f"Ollama 桩服务已启动: http://127.0.0.1:{server.server_address[1]}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""基准套件：运行阶段基准与端到端基准，并与保存的基线比较
+
+    cd backend
+    python -m benchmarks.suite --save                 # 记录基线（默认 benchmarks/baseline.json）
+    python -m benchmarks.suite [--threshold 0.25]     # 与基线比较，出现退化时退出码为 1
+
+基线与机器相关，请在同一台机器上记录和比较。
+"""
+import argparse
+import sys
+
+from benchmarks import bench_e2e, bench_stages
+from benchmarks.corpus import SIZES
+from benchmarks.harness import DEFAULT_BASELINE, compare, load_baseline, print_results, save_baseline
+
+SUITES = {
+    'stages': bench_stages.run,
+    'e2e': bench_e2e.run,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=['paragraph', 'page', 'long', 'huge'])
+    parser.add_argument('--only', nargs='+', choices=list(SUITES), default=list(SUITES))
+    parser.add_argument('--min-time', type=float, default=0.2, help='每项至少累计运行的秒数')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save', action='store_true', help='把本次结果保存为基线')
+    parser.add_argument('--threshold', type=float, default=0.25, help='允许的相对退化比例')
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.only:
+        results.update(SUITES[name](args.sizes, args.min_time))
+
+    if args.save:
+        print_results(results)
+        save_baseline(results, args.baseline)
+        print(f"\n基线已保存: {args.baseline}")
+        return 0
+
+    try:
+        baseline = load_baseline(args.baseline)
+    except FileNotFoundError:
+        print_results(results)
+        print(f"\n未找到基线 {args.baseline}，先用 --save 记录")
+        return 0
+
+    rows = compare(results, baseline, args.threshold)
+    width = max((len(row[0]) for row in rows), default=10)
+    print(f"{'benchmark':<{width}}  {'baseline ms':>12}  {'current ms':>12}  {'ratio':>7}")
+    for name, base, current, ratio, regressed in rows:
+        flag = '  << 退化' if regressed else ''
+        print(f"{name:<{width}}  {base:>12.3f}  {current:>12.3f}  {ratio:>7.2f}{flag}")
+
+    regressions = [row for row in rows if row[4]]
+    if regressions:
+        print(f"\n{len(regressions)} 项比基线慢 {args.threshold:.0%} 以上")
+        return 1
+    print(f"\n全部 {len(rows)} 项在阈值 {args.threshold:.0%} 以内")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
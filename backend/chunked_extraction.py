@@ -0,0 +1,154 @@
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import regex_patterns as rp
+from result_store import BASIC_FIELDS, empty_meeting_info
+
+SCALAR_FIELDS = [field for field in BASIC_FIELDS if field != 'attendees']
+
+
+def split_transcript(text, max_chars):
+    """
+    按句末与议题边界把长文本切成不超过 max_chars 的块
+
+    优先在议题编号（一是 / 二、 ...）之前切分，且只在块已过半时才这样做，
+    避免产生过碎的块；其次在句末切分；单句过长时才硬切。
+    """
+    if max_chars <= 0 or len(text) <= max_chars:
+        return [text] if text.strip() else []
+
+    topic_starts = sorted({match.start() for match in rp.TOPIC_MARKER.finditer(text)})
+    sentence_ends = sorted({match.end() for match in rp.SENTENCE_END.finditer(text)})
+
+    chunks = []
+    start = 0
+    while start < len(text):
+        limit = start + max_chars
+        if limit >= len(text):
+            cut = len(text)
+        else:
+            half = start + max_chars // 2
+            cut = _last_between(topic_starts, half, limit) \
+                or _last_between(sentence_ends, start + 1, limit) \
+                or limit
+        chunk = text[start:cut]
+        if chunk.strip():
+            chunks.append(chunk)
+        start = cut
+    return chunks
+
+
+def _last_between(positions, low, high):
+    """有序位置列表中位于 [low, high] 区间的最后一个位置"""
+    index = bisect_right(positions, high)
+    if index and positions[index - 1] >= low:
+        return positions[index - 1]
+    return None
+
+
+def iter_chunk_outputs(chunks, llm, build_prompt, max_in_flight=2):
+    """
+    并发调用模型处理各块，同时在途的请求不超过 max_in_flight
+
+    :param llm: 调用模型的函数，接收提示词返回输出文本
+    :return: 按完成顺序产出 (块序号, 模型输出) 的生成器
+    """
+    with ThreadPoolExecutor(max_workers=max(1, max_in_flight)) as pool:
+        futures = {pool.submit(llm, build_prompt(chunk)): index
+                   for index, chunk in enumerate(chunks)}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _split_attendees(attendees):
+    if not attendees or attendees == '未指定':
+        return []
+    return [person.strip() for person in attendees.split('，') if person.strip()]
+
+
+def merge_chunk_results(results, chunks):
+    """
+    合并各块的解析结果
+
+    - 参会人员：按出现顺序取并集并去重
+    - 议题：按块顺序排列，忽略标点后相同的议题只保留一次（补全缺失的负责人 / 会前准备）
+    - 主题、主持人等单值字段：按置信度选取——每个块报告一次得 1 分，
+      值在该块原文中逐字出现再加 0.5 分（不是模型编造的），同分取最早的块
+
+    :param results: 各块的 parse_meeting_info 结果（与 chunks 一一对应）
+    :param chunks: 原文分块
+    """
+    merged = empty_meeting_info()
+
+    for field in SCALAR_FIELDS:
+        scores = Counter()
+        first_seen = {}
+        for index, (info, chunk) in enumerate(zip(results, chunks)):
+            value = info.get(field, '未指定')
+            if not value or value == '未指定':
+                continue
+            scores[value] += 1.5 if value in chunk else 1
+            first_seen.setdefault(value, index)
+        if scores:
+            merged[field] = max(scores, key=lambda value: (scores[value], -first_seen[value]))
+
+    attendees = []
+    for info in results:
+        attendees.extend(_split_attendees(info.get('attendees')))
+    if attendees:
+        merged['attendees'] = '，'.join(dict.fromkeys(attendees))
+
+    topics = {}
+    for info in results:
+        for topic in info.get('topics', []):
+            key = rp.TOPIC_NORMALIZE.sub('', topic.get('topic', ''))
+            if not key:
+                continue
+            existing = topics.get(key)
+            if existing is None:
+                topics[key] = dict(topic)
+                continue
+            if existing.get('leader', '未指定') == '未指定':
+                existing['leader'] = topic.get('leader', '未指定')
+            if existing.get('preparation', '无') == '无':
+                existing['preparation'] = topic.get('preparation', '无')
+    merged['topics'] = list(topics.values())
+
+    if merged['theme'] == '未指定' and merged['topics']:
+        merged['theme'] = merged['topics'][0]['topic'][:50]
+    return merged
+
+
+def stream_chunked(text, llm, parse, build_prompt, max_chars, max_in_flight=2):
+    """
+    分块提取：长文本切块后并发调用模型，再合并各块的解析结果
+
+    每完成一块产出 (块序号, 块数, 模型输出)；
+    生成器的返回值是 (合并后的会议信息, 各块模型输出拼接的原始文本)。
+
+    :param llm: 调用模型的函数（提示词 -> 输出文本）
+    :param parse: 解析模型输出的函数（如 parse_meeting_info）
+    :param build_prompt: 构造提示词的函数（块文本 -> 提示词）
+    """
+    chunks = split_transcript(text, max_chars)
+    outputs = [''] * len(chunks)
+    for index, output in iter_chunk_outputs(chunks, llm, build_prompt, max_in_flight):
+        outputs[index] = output
+        yield index, len(chunks), output
+    results = [parse(output) for output in outputs]
+    return merge_chunk_results(results, chunks), '\n\n'.join(outputs)
+
+
+def extract_chunked(text, llm, parse, build_prompt, max_chars, max_in_flight=2):
+    """分块提取，等待所有块完成，返回 (合并后的会议信息, 原始文本)"""
+    progress = stream_chunked(text, llm, parse, build_prompt, max_chars, max_in_flight)
+    while True:
+        try:
+            next(progress)
+        except StopIteration as done:
+            return done.value
@@ -0,0 +1,173 @@
+import os
+
+
+def _env_str(name, default):
+    return os.environ.get(name, default)
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_bool(name, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# ---- Ollama ----
+# 调用方式：http（HTTP API + 连接池）或 subprocess（ollama run 命令行）
+OLLAMA_BACKEND = _env_str('OLLAMA_BACKEND', 'http')
+# HTTP 不可用时是否退回命令行方式
+OLLAMA_SUBPROCESS_FALLBACK = _env_bool('OLLAMA_SUBPROCESS_FALLBACK', True)
+OLLAMA_HOST = _env_str('OLLAMA_HOST', 'http://127.0.0.1:11434')
+OLLAMA_COMMAND = _env_str('OLLAMA_COMMAND', 'ollama')
+OLLAMA_MODEL = _env_str('OLLAMA_MODEL', 'llama3')
+OLLAMA_CONNECT_TIMEOUT = _env_float('OLLAMA_CONNECT_TIMEOUT', 3.0)
+OLLAMA_READ_TIMEOUT = _env_float('OLLAMA_READ_TIMEOUT', 120.0)
+# 模型在 Ollama 中的常驻时间，避免每次调用重新加载
+OLLAMA_KEEP_ALIVE = _env_str('OLLAMA_KEEP_ALIVE', '30m')
+# 空闲 keep-alive 连接的最大保留数
+OLLAMA_POOL_SIZE = _env_int('OLLAMA_POOL_SIZE', 8)
+
+# ---- LLM 响应缓存 ----
+LLM_CACHE_ENABLED = _env_bool('LLM_CACHE_ENABLED', True)
+LLM_CACHE_MAX_ENTRIES = _env_int('LLM_CACHE_MAX_ENTRIES', 256)
+# 缓存有效期（秒），0 表示不过期
+LLM_CACHE_TTL = _env_float('LLM_CACHE_TTL', 7 * 24 * 3600)
+# 磁盘层（SQLite）路径，留空则只使用内存层
+LLM_CACHE_DB_PATH = _env_str('LLM_CACHE_DB_PATH', '')
+LLM_CACHE_DB_MAX_ENTRIES = _env_int('LLM_CACHE_DB_MAX_ENTRIES', 10000)
+
+# ---- 提取结果存储（/extract -> /generate 复用） ----
+EXTRACTION_STORE_MAX_ENTRIES = _env_int('EXTRACTION_STORE_MAX_ENTRIES', 512)
+EXTRACTION_STORE_TTL = _env_float('EXTRACTION_STORE_TTL', 3600)
+
+# ---- 文档输出 ----
+# 默认在内存中渲染并直接返回；开启后同时保存到输出目录
+DOCUMENT_PERSIST = _env_bool('DOCUMENT_PERSIST', False)
+DOCUMENT_OUTPUT_DIR = _env_str(
+    'DOCUMENT_OUTPUT_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'output')
+)
+# 保留策略：最多保留的文件数 / 最长保留时间（秒），0 表示不限制
+DOCUMENT_RETENTION_MAX_FILES = _env_int('DOCUMENT_RETENTION_MAX_FILES', 200)
+DOCUMENT_RETENTION_MAX_AGE = _env_float('DOCUMENT_RETENTION_MAX_AGE', 7 * 24 * 3600)
+# 文档渲染器：template（预置样式模板，默认）或 classic（逐个 run 设置格式）
+DOCUMENT_RENDERER = _env_str('DOCUMENT_RENDERER', 'template')
+# 自定义基础模板（.docx，需包含 word_generator.TEMPLATE_STYLES 中的样式），留空使用内置模板
+DOCX_TEMPLATE_PATH = _env_str('DOCX_TEMPLATE_PATH', '')
+
+# ---- 文档缓存（按会议信息内容缓存渲染结果） ----
+DOCUMENT_CACHE_ENABLED = _env_bool('DOCUMENT_CACHE_ENABLED', True)
+# 内存层总大小上限（字节）
+DOCUMENT_CACHE_MAX_BYTES = _env_int('DOCUMENT_CACHE_MAX_BYTES', 64 * 1024 * 1024)
+# 磁盘层目录，留空则只使用内存层；多个工作进程可共享同一目录
+DOCUMENT_CACHE_DIR = _env_str('DOCUMENT_CACHE_DIR', '')
+DOCUMENT_CACHE_DISK_MAX_BYTES = _env_int('DOCUMENT_CACHE_DISK_MAX_BYTES', 512 * 1024 * 1024)
+
+# ---- 直接解析 ----
+# 字段提取方式：linear（线性时间扫描器，病态输入下耗时仍与长度成正比）或 regex（原始回溯正则）
+PARSE_MODE = _env_str('PARSE_MODE', 'linear')
+# 单次请求的会议文本长度上限（字符），超过时返回 413；0 表示不限制
+PARSE_MAX_CHARS = _env_int('PARSE_MAX_CHARS', 1000000)
+# 单次直接解析的时间上限（秒），超过时返回 422；0 表示不限制
+PARSE_TIME_LIMIT = _env_float('PARSE_TIME_LIMIT', 10.0)
+
+# ---- 通讯录 ----
+# 编译后的通讯录索引（python roster.py compile roster.csv roster.idx），留空则不使用；文件更新后自动重新加载
+ROSTER_PATH = _env_str('ROSTER_PATH', '')
+
+# ---- 会议类型分类 ----
+# 离线训练的 n-gram 分类模型（python meeting_classifier.py train labeled.jsonl model.npz，需要 numpy），
+# 留空、文件不存在或未安装 numpy 时使用关键词规则；文件更新后自动重新加载
+MEETING_TYPE_MODEL = _env_str('MEETING_TYPE_MODEL', '')
+# 分类器最高置信度低于该值时退回关键词规则
+MEETING_TYPE_MIN_CONFIDENCE = _env_float('MEETING_TYPE_MIN_CONFIDENCE', 0.5)
+
+# ---- 批量生成 ----
+# 渲染进程数，0 表示使用 CPU 核数
+BATCH_WORKERS = _env_int('BATCH_WORKERS', 0)
+BATCH_MAX_ITEMS = _env_int('BATCH_MAX_ITEMS', 200)
+# 进程启动方式：spawn（默认，与多线程服务兼容）/ forkserver / fork
+BATCH_START_METHOD = _env_str('BATCH_START_METHOD', 'spawn')
+
+# ---- 异步任务队列 ----
+# 后台执行解析 / Ollama 后备 / 渲染的线程数
+JOB_WORKERS = _env_int('JOB_WORKERS', 4)
+# 最多排队的任务数，超过时提交返回 429
+JOB_MAX_QUEUE = _env_int('JOB_MAX_QUEUE', 100)
+# 已结束任务的结果保留时间（秒）
+JOB_RESULT_TTL = _env_float('JOB_RESULT_TTL', 600)
+# 长轮询（GET /jobs/<id>?wait=秒）的最长等待时间
+JOB_MAX_WAIT = _env_float('JOB_MAX_WAIT', 30)
+
+# ---- 模型调用准入控制 ----
+# 同时在途的模型调用数（命令行方式下即同时运行的 ollama 进程数），
+# 本机所有工作进程共享这一限额，与 SERVER_WORKERS 无关
+LLM_MAX_CONCURRENCY = _env_int('LLM_MAX_CONCURRENCY', 4)
+# 名额锁文件所在目录，留空使用系统临时目录下的 meeting-llm-slots；共用同一 Ollama 的实例应指向同一目录
+LLM_SLOT_DIR = _env_str('LLM_SLOT_DIR', '')
+# 每个进程等待名额的最大排队数，超过时立即拒绝
+LLM_MAX_QUEUE = _env_int('LLM_MAX_QUEUE', 16)
+# 排队等待的最长时间（秒），超过时拒绝
+LLM_QUEUE_TIMEOUT = _env_float('LLM_QUEUE_TIMEOUT', 30)
+# 过载时的处理：degrade（返回直接解析结果）或 reject（返回 429 与 Retry-After）
+LLM_OVERLOAD_POLICY = _env_str('LLM_OVERLOAD_POLICY', 'degrade')
+
+# ---- 实时转写会话（/sessions） ----
+# 最多同时保留的会话数 / 空闲多少秒后清除
+LIVE_SESSION_MAX = _env_int('LIVE_SESSION_MAX', 256)
+LIVE_SESSION_TTL = _env_float('LIVE_SESSION_TTL', 3600)
+# 单个会话的文本上限（字符）
+LIVE_SESSION_MAX_CHARS = _env_int('LIVE_SESSION_MAX_CHARS', 500000)
+# 未换行的文本超过该长度时按句末提交，不再每次重新解析
+LIVE_SESSION_LINE_CHARS = _env_int('LIVE_SESSION_LINE_CHARS', 2000)
+
+# ---- 长文本分块提取 ----
+# 文本超过该长度时分块并发调用模型，0（默认）表示始终整段提交。
+# 分块会丢失跨块的上下文（如前文介绍过的人名、后文才给出的主题），
+# 只建议在文本超出模型上下文时启用，并设为接近上下文上限的长度
+LLM_CHUNK_MAX_CHARS = _env_int('LLM_CHUNK_MAX_CHARS', 0)
+# 同时在途的分块请求数（与 Ollama 的 OLLAMA_NUM_PARALLEL 保持一致）
+LLM_CHUNK_CONCURRENCY = _env_int('LLM_CHUNK_CONCURRENCY', 2)
+
+# ---- 延迟预算（/extract 竞速模式） ----
+# 大于 0 时启用：直接解析不足的请求最多等待模型这么多秒，超时先返回直接解析结果
+EXTRACT_LATENCY_BUDGET = _env_float('EXTRACT_LATENCY_BUDGET', 0)
+# 临界输入是否在直接解析的同时提前调用模型
+SPECULATION_ENABLED = _env_bool('SPECULATION_ENABLED', True)
+# 字段线索词少于该种类数时视为临界输入
+SPECULATION_MIN_CUES = _env_int('SPECULATION_MIN_CUES', 3)
+# 后台模型调用的线程数
+SPECULATION_WORKERS = _env_int('SPECULATION_WORKERS', 4)
+
+# ---- 日志 ----
+# DEBUG 时输出每次解析的详细过程（解析文本、议题、最终结果）；生产环境建议 INFO 或 WARNING
+LOG_LEVEL = _env_str('LOG_LEVEL', 'INFO')
+
+# ---- 启动预热与生产服务（serve.py） ----
+# 启动时预热正则、关键词自动机和文档模板，完成前 /health/ready 返回 503
+WARMUP_ENABLED = _env_bool('WARMUP_ENABLED', True)
+# 启动后在后台建立 Ollama 连接并加载模型
+WARMUP_OLLAMA = _env_bool('WARMUP_OLLAMA', True)
+SERVER_BIND = _env_str('SERVER_BIND', '127.0.0.1:5000')
+# 工作进程数，0 表示使用 CPU 核数。默认 1：提取结果（extraction_id）、异步任务（/jobs）、
+# 实时转写会话（/sessions）、文档缓存内存层与指标都保存在进程内存中，多个工作进程共享同一
+# 监听端口，同一客户端的后续请求会落到别的进程上。需要扩展时启动多个单进程实例，由负载均衡器按客户端粘滞
+SERVER_WORKERS = _env_int('SERVER_WORKERS', 1)
+# 每个工作进程的线程数（等待 Ollama、SSE 和长轮询的请求占用线程而非进程）
+SERVER_THREADS = _env_int('SERVER_THREADS', 8)
+# 工作进程无响应多少秒后被重启
+SERVER_TIMEOUT = _env_int('SERVER_TIMEOUT', 60)
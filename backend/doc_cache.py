@@ -0,0 +1,220 @@
+import hashlib
+import importlib
+import logging
+import os
+import tempfile
+import threading
+from importlib import metadata
+
+import config
+from memory_cache import MemoryLRUCache
+from result_store import meeting_info_digest
+
+logger = logging.getLogger(__name__)
+
+# 渲染结果取决于这些模块的代码，任一文件变化后旧的缓存键全部失效
+RENDERER_MODULES = ('word_generator', 'ooxml_renderer')
+
+_fingerprint_lock = threading.Lock()
+_renderer_fingerprint = None
+_template_versions = {}
+
+
+def renderer_fingerprint():
+    """渲染代码的指纹：渲染模块源文件与 python-docx 版本的哈希（每个进程计算一次）"""
+    global _renderer_fingerprint
+    if _renderer_fingerprint is None:
+        with _fingerprint_lock:
+            if _renderer_fingerprint is None:
+                digest = hashlib.sha256()
+                for name in RENDERER_MODULES:
+                    with open(importlib.import_module(name).__file__, 'rb') as f:
+                        digest.update(f.read())
+                try:
+                    digest.update(metadata.version('python-docx').encode())
+                except metadata.PackageNotFoundError:
+                    pass
+                _renderer_fingerprint = digest.hexdigest()
+    return _renderer_fingerprint
+
+
+def template_version(template_path=None):
+    """模板版本：内置模板由渲染代码决定；自定义模板为渲染器实际使用的模板内容的哈希"""
+    if not template_path:
+        return 'builtin'
+    version = _template_versions.get(template_path)
+    if version is None:
+        from word_generator import get_base_template
+        version = hashlib.sha256(get_base_template(template_path)).hexdigest()
+        _template_versions[template_path] = version
+    return version
+
+
+def document_cache_key(meeting_info, renderer, template_path=None):
+    """
+    渲染结果的内容地址：会议信息的规范化哈希 + 渲染器 + 模板版本 + 渲染代码指纹
+
+    同时作为 /generate 的 ETag；会议信息、渲染器、模板或代码任一变化，键随之变化。
+    """
+    digest = hashlib.sha256()
+    for part in (renderer_fingerprint(), renderer or '', template_version(template_path),
+                 meeting_info_digest(meeting_info)):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:32]
+
+
+class DiskDocumentTier:
+    """磁盘层：每份文档一个文件（文件名即缓存键），总大小超过上限时按最近访问时间淘汰
+
+    文件原子写入，多个工作进程可以共享同一目录。
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._bytes = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.docx")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # 刷新访问时间，淘汰时按修改时间排序
+            return data
+        except OSError:
+            return None
+
+    def set(self, key, data):
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("文档缓存写入失败: %s", e)
+            return
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = self._scan_usage()
+            else:
+                self._bytes += len(data)
+            if self.max_bytes and self._bytes > self.max_bytes:
+                self._prune()
+
+    def _entries(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith('.docx'):
+                    try:
+                        stat = os.stat(os.path.join(root, name))
+                    except OSError:
+                        continue
+                    yield os.path.join(root, name), stat.st_mtime, stat.st_size
+
+    def _scan_usage(self):
+        return sum(size for _, _, size in self._entries())
+
+    def _prune(self):
+        """删除最久未访问的文档，直到总大小降到上限的 90%"""
+        entries = sorted(self._entries(), key=lambda entry: entry[1], reverse=True)
+        budget = self.max_bytes * 0.9
+        total = 0
+        for path, _, size in entries:
+            if total + size <= budget:
+                total += size
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                total += size
+        self._bytes = total
+
+    def clear(self):
+        with self._lock:
+            for path, _, _ in list(self._entries()):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._bytes = 0
+
+
+class DocumentCache:
+    """渲染结果缓存：内存 LRU（按字节数限制）+ 可选磁盘层
+
+    键为 document_cache_key 的内容地址，重复生成同一份会议纪要（重新下载、分享、重试）
+    时直接返回渲染好的 DOCX 字节。
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, directory=None, disk_max_bytes=512 * 1024 * 1024):
+        self.memory = MemoryLRUCache(max_entries=None, max_bytes=max_bytes)
+        self.disk = DiskDocumentTier(directory, disk_max_bytes) if directory else None
+        self._lock = threading.Lock()
+        self.counters = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0}
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def get(self, key):
+        data = self.memory.get(key)
+        if data is not None:
+            self._count('memory_hits')
+            return data
+        if self.disk is not None:
+            data = self.disk.get(key)
+            if data is not None:
+                self.memory.set(key, data)
+                self._count('disk_hits')
+                return data
+        self._count('misses')
+        return None
+
+    def set(self, key, data):
+        self.memory.set(key, data)
+        if self.disk is not None:
+            self.disk.set(key, data)
+        self._count('stores')
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters)
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = round((lookups - stats['misses']) / lookups, 4) if lookups else 0.0
+        stats['memory_entries'] = len(self.memory)
+        stats['memory_bytes'] = self.memory.total_bytes
+        return stats
+
+
+_cache_lock = threading.Lock()
+_cache = None
+
+
+def get_document_cache():
+    """获取进程内共享的渲染结果缓存；未启用时返回 None"""
+    global _cache
+    if not config.DOCUMENT_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = DocumentCache(
+                    max_bytes=config.DOCUMENT_CACHE_MAX_BYTES,
+                    directory=config.DOCUMENT_CACHE_DIR or None,
+                    disk_max_bytes=config.DOCUMENT_CACHE_DISK_MAX_BYTES
+                )
+    return _cache
@@ -0,0 +1,63 @@
+import os
+import threading
+import time
+import uuid
+
+import config
+
+_prune_lock = threading.Lock()
+
+
+def unique_document_name(prefix='meeting'):
+    """生成不会冲突的文档文件名（时间戳 + 随机后缀）"""
+    return f"{prefix}_{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}.docx"
+
+
+def persist_document(data, output_dir=None):
+    """
+    将渲染好的文档字节写入输出目录（原子写入），并按保留策略清理旧文件
+    
+    :param data: DOCX 文件内容
+    :param output_dir: 输出目录，默认 config.DOCUMENT_OUTPUT_DIR
+    :return: 文件路径
+    """
+    output_dir = output_dir or config.DOCUMENT_OUTPUT_DIR
+    os.makedirs(output_dir, exist_ok=True)
+    file_path = os.path.join(output_dir, unique_document_name())
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, file_path)
+    prune_output_dir(output_dir)
+    return file_path
+
+
+def prune_output_dir(output_dir=None, max_files=None, max_age=None):
+    """
+    清理输出目录：删除超过保留时间的文档，并只保留最新的 max_files 个
+    
+    :return: 删除的文件数
+    """
+    output_dir = output_dir or config.DOCUMENT_OUTPUT_DIR
+    max_files = config.DOCUMENT_RETENTION_MAX_FILES if max_files is None else max_files
+    max_age = config.DOCUMENT_RETENTION_MAX_AGE if max_age is None else max_age
+
+    with _prune_lock:
+        try:
+            entries = [entry for entry in os.scandir(output_dir)
+                       if entry.is_file() and entry.name.endswith('.docx')]
+        except FileNotFoundError:
+            return 0
+
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        now = time.time()
+        removed = 0
+        for i, entry in enumerate(entries):
+            expired = max_age and now - entry.stat().st_mtime > max_age
+            if expired or (max_files and i >= max_files):
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
@@ -0,0 +1,174 @@
+import logging
+import queue
+import threading
+import time
+import uuid
+
+import config
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+
+
+class JobQueueFull(Exception):
+    """排队任务数已达上限"""
+
+
+class Job:
+    """一个后台任务：状态、当前阶段、结果与（生成任务的）文档字节"""
+
+    def __init__(self, kind, target):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = JOB_QUEUED
+        self.stage = None
+        self.result = None
+        self.document = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._target = target
+        self._done = threading.Event()
+
+    @property
+    def finished(self):
+        return self._done.is_set()
+
+    def set_stage(self, stage):
+        """由任务函数调用，报告当前所处阶段（parse / llm / render）"""
+        self.stage = stage
+
+    def wait(self, timeout=None):
+        """等待任务结束（长轮询），返回是否已结束"""
+        return self._done.wait(timeout)
+
+    def run(self):
+        self.status = JOB_RUNNING
+        self.started_at = time.time()
+        try:
+            self._target(self)
+            self.status = JOB_DONE
+        except Exception as e:
+            logger.exception("任务 %s 失败: %s", self.id, e)
+            self.error = str(e)
+            self.status = JOB_FAILED
+        finally:
+            self.finished_at = time.time()
+            self._done.set()
+
+    def to_dict(self):
+        info = {
+            'job_id': self.id,
+            'type': self.kind,
+            'status': self.status,
+            'stage': self.stage,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+        if self.status == JOB_DONE and self.result is not None:
+            info['result'] = self.result
+        if self.error:
+            info['error'] = self.error
+        return info
+
+
+class JobQueue:
+    """进程内任务队列（无需外部消息中间件）
+
+    固定数量的后台线程依次执行任务；排队数超过 max_queue 时拒绝提交，
+    已结束的任务在 result_ttl 秒后连同结果一起清除。
+    """
+
+    def __init__(self, workers=4, max_queue=100, result_ttl=600):
+        self.workers = max(1, workers)
+        self.result_ttl = result_ttl
+        self._pending = queue.Queue(maxsize=max(1, max_queue))
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def _ensure_workers(self):
+        if self._threads:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f'job-worker-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _worker(self):
+        while True:
+            job = self._pending.get()
+            try:
+                job.run()
+            finally:
+                self._pending.task_done()
+
+    def _purge_expired(self):
+        if not self.result_ttl:
+            return
+        deadline = time.time() - self.result_ttl
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished and job.finished_at < deadline]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def submit(self, kind, target):
+        """
+        提交任务
+
+        :param kind: 任务类型（extract / generate）
+        :param target: 任务函数，接收 Job，把结果写入 job.result / job.document
+        :raises JobQueueFull: 排队任务数已达上限
+        """
+        job = Job(kind, target)
+        with self._lock:
+            self._purge_expired()
+            self._ensure_workers()
+            try:
+                self._pending.put_nowait(job)
+            except queue.Full:
+                raise JobQueueFull(f"排队任务已达上限（{self._pending.maxsize}）")
+            self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            self._purge_expired()
+            return self._jobs.get(job_id)
+
+    def stats(self):
+        with self._lock:
+            self._purge_expired()
+            counts = {}
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+            return {
+                'workers': self.workers,
+                'queue_depth': self._pending.qsize(),
+                'max_queue': self._pending.maxsize,
+                'jobs': counts
+            }
+
+
+_queue_lock = threading.Lock()
+_job_queue = None
+
+
+def get_job_queue():
+    """获取进程内共享的任务队列"""
+    global _job_queue
+    if _job_queue is None:
+        with _queue_lock:
+            if _job_queue is None:
+                _job_queue = JobQueue(
+                    workers=config.JOB_WORKERS,
+                    max_queue=config.JOB_MAX_QUEUE,
+                    result_ttl=config.JOB_RESULT_TTL
+                )
+    return _job_queue
@@ -0,0 +1,204 @@
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# 词典目录：内置 meeting_types.json，另可放入行业词典（同格式的 *.json）
+DICTIONARY_DIR = os.environ.get(
+    'MEETING_DICTIONARY_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dictionaries')
+)
+BUILTIN_DICTIONARY = 'meeting_types.json'
+
+# 关键词数达到该值才使用自动机；词典较小时逐词 ``in`` 查找（C 实现的子串搜索）更快
+AUTOMATON_MIN_KEYWORDS = 150
+# 词典文件的变化检查间隔（秒）：间隔内直接返回缓存的匹配器，不重新 glob / stat
+DICTIONARY_CHECK_INTERVAL = 2.0
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 多关键词匹配自动机
+
+    一次扫描文本即可得到所有类别的关键词命中情况，耗时与词典规模无关。
+    计数语义与 ``keyword in text`` 相同：每个关键词出现即计 1 次，不重复计数。
+
+    自动机逐字符在 Python 中转移，单个字符的开销远高于 C 实现的子串搜索；关键词少于
+    ``min_keywords`` 时不构建自动机，逐词 ``in`` 查找（内置 45 个词时约快 3 倍）。
+    """
+
+    def __init__(self, categories, min_keywords=AUTOMATON_MIN_KEYWORDS):
+        """
+        :param categories: {类别: [关键词, ...]}，类别顺序即平局时的优先顺序
+        :param min_keywords: 关键词数达到该值才使用自动机
+        """
+        self.categories = list(categories)
+        self.keywords = []
+        self.keyword_categories = []
+
+        keyword_ids = {}
+        for category_id, category in enumerate(self.categories):
+            for keyword in categories[category]:
+                if not keyword:
+                    continue
+                if keyword not in keyword_ids:
+                    keyword_ids[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+                    self.keyword_categories.append([])
+                self.keyword_categories[keyword_ids[keyword]].append(category_id)
+
+        self.use_automaton = len(self.keywords) >= min_keywords
+        # 逐词查找时续扫需要保留的上次文本末尾长度（跨越片段边界的关键词）
+        self._overlap = max(map(len, self.keywords), default=1) - 1
+        # 各类别的关键词（整段统计时逐类别求和，不经过命中集合）
+        self._category_keywords = [
+            tuple(keyword for keyword_id, keyword in enumerate(self.keywords)
+                  if category_id in self.keyword_categories[keyword_id])
+            for category_id in range(len(self.categories))
+        ]
+        if self.use_automaton:
+            self._build()
+
+    def _build(self):
+        goto = [{}]
+        outputs = [()]
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append(())
+                state = next_state
+            outputs[state] = outputs[state] + (keyword_id,)
+
+        # 广度优先构建失配指针，并把失配链上的输出合并到当前状态
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def scan(self, text, state=None, found=None):
+        """
+        扫描文本，返回 (命中的关键词编号集合, 结束状态)
+
+        传入上次的 ``state`` 与 ``found`` 可以对追加的文本继续扫描；状态对调用方不透明，
+        首次扫描传 None（自动机为状态编号，逐词查找为上次文本的末尾）。
+        """
+        found = set() if found is None else found
+        if not self.use_automaton:
+            return self._scan_substrings(text, state or '', found)
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        root = goto[0]
+        state = state or 0
+
+        for char in text:
+            if not state and char not in root:
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found, state
+
+    def _scan_substrings(self, text, tail, found):
+        """逐词 ``in`` 查找；tail 为上次文本末尾，覆盖跨越片段边界的关键词"""
+        window = tail + text if tail else text
+        for keyword_id, keyword in enumerate(self.keywords):
+            if keyword_id not in found and keyword in window:
+                found.add(keyword_id)
+        return found, window[max(len(window) - self._overlap, 0):] if self._overlap else ''
+
+    def count_from_hits(self, found):
+        """由命中的关键词编号统计各类别命中数（按类别顺序）"""
+        counts = [0] * len(self.categories)
+        for keyword_id in found:
+            for category_id in self.keyword_categories[keyword_id]:
+                counts[category_id] += 1
+        return dict(zip(self.categories, counts))
+
+    def count_categories(self, text):
+        """统计各类别命中的关键词数量"""
+        if not self.use_automaton:
+            return {category: sum(keyword in text for keyword in keywords)
+                    for category, keywords in zip(self.categories, self._category_keywords)}
+        found, _ = self.scan(text)
+        return self.count_from_hits(found)
+
+
+def _dictionary_files(directory):
+    builtin = os.path.join(directory, BUILTIN_DICTIONARY)
+    extra = sorted(path for path in glob.glob(os.path.join(directory, '*.json')) if path != builtin)
+    return ([builtin] if os.path.exists(builtin) else []) + extra
+
+
+def load_dictionaries(paths):
+    """加载并合并词典文件，类别按首次出现的顺序排列"""
+    categories = {}
+    for path in paths:
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("加载会议类型词典失败: %s, %s", path, e)
+            continue
+        for category, keywords in data.items():
+            categories.setdefault(category, [])
+            categories[category].extend(keywords)
+    return categories
+
+
+_matcher_lock = threading.Lock()
+_matcher_cache = {'directory': None, 'checked': 0.0, 'signature': None, 'matcher': None}
+
+
+def get_meeting_type_matcher(directory=None):
+    """
+    获取（缓存的）会议类型匹配器，词典文件变化时自动重建
+
+    每 DICTIONARY_CHECK_INTERVAL 秒最多检查一次词典目录，其余调用直接返回缓存。
+    """
+    directory = directory or DICTIONARY_DIR
+    matcher = _matcher_cache['matcher']
+    if (matcher is not None and _matcher_cache['directory'] == directory and
+            time.monotonic() - _matcher_cache['checked'] < DICTIONARY_CHECK_INTERVAL):
+        return matcher
+
+    paths = _dictionary_files(directory)
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        signature.append((path, stat.st_mtime_ns, stat.st_size))
+    signature = tuple(signature)
+
+    with _matcher_lock:
+        if _matcher_cache['signature'] != signature or _matcher_cache['matcher'] is None:
+            _matcher_cache['matcher'] = KeywordAutomaton(load_dictionaries(paths))
+            _matcher_cache['signature'] = signature
+        _matcher_cache['directory'] = directory
+        _matcher_cache['checked'] = time.monotonic()
+        return _matcher_cache['matcher']
@@ -0,0 +1,344 @@
+"""线性时间的字段扫描器
+
+regex_patterns 中的字段模式形如 "线索词 + 空白 + 取值 + 结束标记"，用回溯正则匹配时，
+每个线索词出现处都要向后扫描到结束标记或行尾才能判定失败：线索词反复出现而没有结束标记时
+耗时随文本长度平方增长，取值两侧都有 \\s* 的地点模式甚至是立方。
+
+FieldScanner 与对应的正则结果完全一致（匹配起点、取值、终点），但 "下一个结束标记 /
+下一个取值外字符" 等位置查询按位置缓存，每个字符只被扫描常数次，总耗时与文本长度成正比。
+扫描器提供与 re.Pattern 相同的 search(text, pos, endpos) 接口，可直接替换字段模式。
+
+config.PARSE_MODE 为 linear（默认）时直接解析与实时转写会话使用这里的扫描器，
+为 regex 时使用 regex_patterns 中的原始正则。
+"""
+import re
+from functools import lru_cache
+
+import config
+import regex_patterns as rp
+
+MODE_LINEAR = 'linear'
+MODE_REGEX = 'regex'
+
+_SPACE = re.compile(r'\s*')
+_WHITESPACE = re.compile(r'\s')
+
+
+class ScanMatch:
+    """扫描结果，接口与 re.Match 的常用部分一致"""
+
+    __slots__ = ('string', '_start', '_end', '_group_start', '_group_end')
+
+    def __init__(self, string, start, end, group_start, group_end):
+        self.string = string
+        self._start = start
+        self._end = end
+        self._group_start = group_start
+        self._group_end = group_end
+
+    def start(self):
+        return self._start
+
+    def end(self):
+        return self._end
+
+    def span(self):
+        return self._start, self._end
+
+    def group(self, index=0):
+        if index == 0:
+            return self.string[self._start:self._end]
+        if index == 1:
+            return self.string[self._group_start:self._group_end]
+        raise IndexError('no such group')
+
+
+class _NextMatch:
+    """查询 pos 之后某个短模式第一次出现的位置（没有时为 endpos）
+
+    缓存上一次的查询区间 [from, at)：区间内没有出现，at 处有出现。
+    向后的查询落在区间内时直接返回，向前的查询只需补扫 [pos, from)。
+    """
+
+    def __init__(self, regex, text, endpos, width):
+        self._regex = regex
+        self._text = text
+        self._endpos = endpos
+        self._width = width
+        self._from = endpos + 1
+        self._at = endpos
+
+    def __call__(self, pos):
+        if self._from <= pos <= self._at:
+            return self._at
+        if pos < self._from:
+            # 出现位置在 from 之前时，模式最多延伸到 from + width - 1
+            match = self._regex.search(self._text, pos, min(self._endpos, self._from + self._width - 1))
+            at = match.start() if match and match.start() < self._from else self._at
+        else:
+            match = self._regex.search(self._text, pos, self._endpos)
+            at = match.start() if match else self._endpos
+        self._from, self._at = pos, at
+        return at
+
+
+class _Scan:
+    """一次 search 调用内的位置查询缓存"""
+
+    def __init__(self, scanner, text, endpos):
+        self.text = text
+        self.endpos = endpos
+        self.excluded = _NextMatch(scanner._excluded, text, endpos, 1)
+        self.terminator = (_NextMatch(scanner._terminator, text, endpos, scanner.terminator_width)
+                           if scanner._terminator is not None else None)
+        self._space_start = (None, None)
+        self._last = (None, None, None)
+
+    def space_start(self, pos):
+        """pos 之前连续空白的起点"""
+        if self._space_start[0] != pos:
+            start = pos
+            while start > 0 and self.text[start - 1].isspace():
+                start -= 1
+            self._space_start = (pos, start)
+        return self._space_start[1]
+
+    def last_terminator(self, scanner, lo, hi):
+        """起点在 [lo, hi] 内的最后一个结束标记（贪婪取值用），没有时为 None"""
+        cached_hi, scanned_from, last = self._last
+        if cached_hi != hi:
+            scanned_from, last = hi + 1, None
+        if lo < scanned_from:
+            # 已扫描的 [scanned_from, hi] 中有结束标记时它就是最后一个，否则补扫 [lo, scanned_from)
+            if last is None:
+                region_end = min(self.endpos, scanned_from + scanner.terminator_width - 1)
+                for match in scanner._terminator_at.finditer(self.text, lo, region_end):
+                    if match.start() < scanned_from:
+                        last = match.start()
+            self._last = (hi, lo, last)
+        return last if last is not None and last >= lo else None
+
+
+class FieldScanner:
+    """
+    与字段正则等价的线性时间扫描器
+
+    对应的正则（pattern 属性）为::
+
+        线索词 [\\s*] (取值+ 或 取值+?) [\\s*] [结束标记]
+
+    方括号内的部分按参数可选。
+
+    :param cue: 线索词（正则，只包含字面量与定长的可选部分）
+    :param excluded: 取值中不允许出现的字符（字符类内容）；None 表示 "."（除换行外任意字符）
+    :param terminator: 取值之后的结束标记（正则）；None 表示取值贪婪地延伸到第一个不允许的字符
+    :param terminator_width: 结束标记的最大长度
+    :param lazy: 取值为非贪婪（+?）还是贪婪（+）
+    :param skip_space: 线索词之后是否有 \\s*
+    :param trailing_space: 取值与结束标记之间是否有 \\s*（仅非贪婪取值）
+    :param at_end: 文本末尾是否也可以作为结束标记（仅非贪婪取值）
+    :param cue_variants: 线索词有可选部分时，按正则的回溯顺序列出各种展开
+    """
+
+    def __init__(self, cue, excluded=None, terminator=None, terminator_width=1, lazy=True,
+                 skip_space=False, trailing_space=False, at_end=False, cue_variants=None):
+        if terminator is None and lazy:
+            raise ValueError('非贪婪取值需要结束标记')
+        if (trailing_space or at_end) and not lazy:
+            raise ValueError('trailing_space / at_end 只用于非贪婪取值')
+        self.terminator_width = terminator_width
+        self.lazy = lazy
+        self.skip_space = skip_space
+        self.trailing_space = trailing_space
+        self.at_end = at_end
+
+        value = '.' if excluded is None else f'[^{excluded}]'
+        parts = [cue, r'\s*' if skip_space else '', f"({value}{'+?' if lazy else '+'})"]
+        if trailing_space:
+            parts.append(r'\s*')
+        if terminator is not None:
+            parts.append(f'(?:{terminator}|$)' if at_end else terminator)
+        self.pattern = ''.join(parts)
+
+        self._regex = re.compile(self.pattern)
+        self._cue = re.compile(cue)
+        self._variants = tuple(re.compile(variant) for variant in (cue_variants or [cue]))
+        self._excluded = re.compile(r'\n' if excluded is None else f'[{excluded}]')
+        self._terminator = re.compile(terminator) if terminator is not None else None
+        self._terminator_at = re.compile(f'(?={terminator})') if terminator is not None else None
+
+    def __repr__(self):
+        return f'FieldScanner({self.pattern!r})'
+
+    def search(self, text, pos=0, endpos=None):
+        endpos = len(text) if endpos is None else min(endpos, len(text))
+        cue = self._cue.search(text, pos, endpos)
+        if cue is None:
+            return None
+        decided, match = self._quick_match(text, cue, endpos)
+        if match is not None:
+            return match
+        pos = cue.start() + 1 if decided else cue.start()
+        scan = None
+        while pos <= endpos:
+            cue = self._cue.search(text, pos, endpos)
+            if cue is None:
+                return None
+            if scan is None:
+                scan = _Scan(self, text, endpos)
+            match = self._match_at(scan, cue.start())
+            if match is not None:
+                return match
+            pos = cue.start() + 1
+        return None
+
+    def _quick_match(self, text, cue, endpos):
+        """
+        第一个线索词处直接用正则锚定匹配（常见输入只有一个线索词，省去位置缓存的开销）
+
+        只在线索词之后到第一个取值外字符之间没有空白时使用：此时两处 \\s* 都不会在取值内部回溯，
+        锚定匹配的耗时与这一段的长度成正比。返回 (是否已判定, 匹配)，未判定时由常规路径处理。
+        """
+        cue_end = cue.end()
+        excluded = self._excluded.search(text, cue_end, endpos)
+        run_end = excluded.start() if excluded else endpos
+        if run_end == cue_end or _WHITESPACE.search(text, cue_end, run_end):
+            return False, None
+        return True, self._regex.match(text, cue.start(), endpos)
+
+    def _match_at(self, scan, start):
+        """从 start 开始按正则的回溯顺序尝试：线索词的各种展开 -> 空白由长到短 -> 取值"""
+        text, endpos = scan.text, scan.endpos
+        for variant in self._variants:
+            cue = variant.match(text, start, endpos)
+            if cue is None:
+                continue
+            cue_end = cue.end()
+            space_end = _SPACE.match(text, cue_end, endpos).end() if self.skip_space else cue_end
+            for value_start in range(space_end, cue_end - 1, -1):
+                found = self._value_at(scan, value_start)
+                if found is not None:
+                    return ScanMatch(text, start, found[1], value_start, found[0])
+        return None
+
+    def _value_at(self, scan, value_start):
+        """取值从 value_start 开始时的 (取值终点, 匹配终点)，无法匹配时为 None"""
+        text, endpos = scan.text, scan.endpos
+        run_end = scan.excluded(value_start)
+        if run_end == value_start:
+            return None
+        if self._terminator is None:
+            return run_end, run_end
+        if not self.lazy:
+            stop = scan.last_terminator(self, value_start + 1, run_end)
+            if stop is None:
+                return None
+            return stop, self._terminator.match(text, stop, endpos).end()
+
+        # 非贪婪：取最近的结束标记（允许时还有文本末尾）
+        terminator = scan.terminator(value_start + 1)
+        stop = None
+        if terminator < endpos:
+            stop = max(value_start + 1, scan.space_start(terminator)) if self.trailing_space else terminator
+        if self.at_end:
+            end = endpos - 1 if text[endpos - 1] == '\n' and endpos - 1 > value_start else endpos
+            if stop is None or end < stop:
+                return (end, end) if end <= run_end else None
+        if stop is None or stop > run_end:
+            return None
+        return stop, self._terminator.match(text, terminator, endpos).end()
+
+
+def _line_field(cue):
+    """"会议主题：xxx" 一类字段的两个模式：到行尾（有换行）/ 到文本末尾"""
+    return (
+        FieldScanner(cue, terminator=r'[\n\r]', skip_space=True),
+        FieldScanner(cue, lazy=False, skip_space=True)
+    )
+
+
+_PHRASE_VALUE = r'，,。\n\r'
+_ATTENDEE_VALUE = r'。\n\r'
+_ATTENDEE_END = r'(?:。|会议)'
+
+THEME_SCANNERS = _line_field('会议主题[：:]') + (
+    FieldScanner('讨论', _PHRASE_VALUE, lazy=False),
+    FieldScanner('关于', _PHRASE_VALUE, '的会议', terminator_width=3, lazy=False)
+)
+
+HOST_SCANNERS = _line_field('主持人[：:]') + (
+    FieldScanner('由', _PHRASE_VALUE, '主持', terminator_width=2, lazy=False),
+)
+
+LOCATION_SCANNERS = (
+    FieldScanner('(?:在|于)', _PHRASE_VALUE, '(?:召开|举行|开)', terminator_width=2,
+                 skip_space=True, trailing_space=True),
+) + _line_field('会议地点[：:]')
+
+DURATION_SCANNERS = (
+    FieldScanner('会议大概开', _PHRASE_VALUE, lazy=False),
+) + _line_field('会议时长[：:]') + (
+    FieldScanner('大约', _PHRASE_VALUE, '小时', terminator_width=2, lazy=False),
+)
+
+ATTENDEE_SCANNERS = (
+    FieldScanner('参会(?:人员)?[：:]', _ATTENDEE_VALUE, _ATTENDEE_END, terminator_width=2,
+                 skip_space=True, cue_variants=['参会人员[：:]', '参会[：:]']),
+    FieldScanner('参会的有', _ATTENDEE_VALUE, _ATTENDEE_END, terminator_width=2),
+    FieldScanner('参加(?:人员)?包括', _ATTENDEE_VALUE, _ATTENDEE_END, terminator_width=2,
+                 cue_variants=['参加人员包括', '参加包括']),
+    FieldScanner('出席(?:人员)?[：:]', _ATTENDEE_VALUE, _ATTENDEE_END, terminator_width=2,
+                 skip_space=True, cue_variants=['出席人员[：:]', '出席[：:]'])
+)
+
+_FIELD_PATTERNS = {
+    MODE_REGEX: {
+        'theme': rp.THEME_PATTERNS,
+        'host': rp.HOST_PATTERNS,
+        'location': rp.LOCATION_PATTERNS,
+        'attendees': rp.ATTENDEE_PATTERNS,
+        'duration': rp.DURATION_PATTERNS
+    },
+    MODE_LINEAR: {
+        'theme': THEME_SCANNERS,
+        'host': HOST_SCANNERS,
+        'location': LOCATION_SCANNERS,
+        'attendees': ATTENDEE_SCANNERS,
+        'duration': DURATION_SCANNERS
+    }
+}
+
+
+def parse_mode():
+    return MODE_REGEX if config.PARSE_MODE == MODE_REGEX else MODE_LINEAR
+
+
+def field_patterns(mode=None):
+    """各字段的模式（按优先级）：{字段: 模式列表}"""
+    return _FIELD_PATTERNS[mode or parse_mode()]
+
+
+@lru_cache(maxsize=rp.LEADER_CACHE_SIZE)
+def _preparation_scanners(leader):
+    escaped = re.escape(leader)
+    return tuple(
+        FieldScanner(f'{escaped}[你您]?{verb}', r'，,。；;\n\r', '[，,。；;]', at_end=True,
+                     cue_variants=variants)
+        for verb, variants in (
+            ('准备下?', [f'{escaped}[你您]?准备下', f'{escaped}[你您]?准备']),
+            ('需准备', None)
+        )
+    )
+
+
+def preparation_patterns(leader, mode=None):
+    """会前准备模式（按负责人姓名缓存）"""
+    if (mode or parse_mode()) == MODE_REGEX:
+        return rp.preparation_patterns(leader)
+    return _preparation_scanners(leader)
+
+
+def strip_preamble(output):
+    """去掉模型输出中第一个 "---" 及其之前的内容（等价于替换 ``^.*?---``，不经过正则）"""
+    index = output.find('---')
+    return output[index + 3:] if index >= 0 else output
@@ -0,0 +1,392 @@
+import bisect
+import threading
+import uuid
+
+import config
+import regex_patterns as rp
+from keyword_matcher import get_meeting_type_matcher
+from linear_scan import field_patterns
+from meeting_classifier import get_meeting_classifier
+from memory_cache import MemoryLRUCache
+from result_store import BASIC_FIELDS
+from roster import get_roster
+from topic_index import chinese_to_int
+
+# 重新查找字段时向前回看的最大字符数（覆盖 "会议主题：" 与取值跨行的情况）
+LOOKBACK_CHARS = 200
+# 文本窗口在仍需解析的最早位置之前多保留的字符数：议题编号的回看（最多两个字）不会越过窗口，
+# 窗口起点也不会被当作文本开头（^）
+CONTEXT_CHARS = 8
+
+
+class SessionTooLarge(Exception):
+    """会话文本超过 LIVE_SESSION_MAX_CHARS"""
+
+
+class SessionOffsetMismatch(Exception):
+    """客户端声明的追加位置与会话当前长度不一致（重复或遗漏了片段）"""
+
+    def __init__(self, expected):
+        super().__init__(f"追加位置不一致，会话当前长度为 {expected}")
+        self.expected = expected
+
+
+def _best_match(patterns, text, pos, endpos, best, base=0):
+    """
+    在 text[pos:endpos] 中查找比 best 优先级更高的字段匹配
+
+    与 extract_field 的语义一致：排在前面的模式优先，同一模式取最早的匹配。
+    :param base: text 在会话全文中的起点，返回的匹配起点按全文计
+    :return: (模式序号, 匹配起点, 取值) 或原来的 best
+    """
+    limit = len(patterns) if best is None else best[0]
+    for index, pattern in enumerate(patterns[:limit]):
+        match = pattern.search(text, pos, endpos)
+        if match:
+            return index, base + match.start(), match.group(1).strip()
+    return best
+
+
+def _scan_markers(text, pos, endpos, base=0):
+    """查找 text[pos:endpos] 中的议题编号标记，按编号体系分组（位置加上 base，按全文计）"""
+    markers = {'cn': [], 'ar': []}
+    for match in rp.TOPIC_MARKER.finditer(text, pos, endpos):
+        if match.group('cn'):
+            family, number = 'cn', chinese_to_int(match.group('cn'))
+        else:
+            family, number = 'ar', int(match.group('ar'))
+        if number:
+            markers[family].append((number, base + match.start(), base + match.end()))
+    return markers
+
+
+class _ClosedSegments:
+    """一个编号体系中已结束的议题片段：之后已有提交的编号标记，片段范围与解析结果不再变化"""
+
+    def __init__(self):
+        self.count = 0        # 已结束的标记数（按出现顺序）
+        self.numbers = set()  # 已结束片段的编号（重复编号取第一次出现）
+        self.keys = []        # 有议题内容的片段编号，升序
+        self.topics = []      # 与 keys 对应的议题
+
+
+class LiveSession:
+    """实时转写会话：追加文本时只解析新增部分，随时给出当前的会议信息
+
+    文本按行提交：完整的行（以换行结尾）解析一次后不再重复扫描，
+    末尾未结束的行每次追加时重新解析，结果是临时的。
+    单行超过 LIVE_SESSION_LINE_CHARS 时在最后一个句末提交，避免无换行的转写结果反复重扫。
+
+    保存的解析状态：
+    - 会议类型：关键词匹配器的扫描状态与已命中的关键词（追加文本从上次的状态继续扫描）；
+      配置了分类模型时另有全文的 n-gram 计数（追加文本只统计新增的 n-gram）
+    - 主题、主持人等字段：目前优先级最高的匹配，新文本只需查找优先级更高的模式
+    - 议题：已提交的编号标记位置；之后已有提交标记的片段已经结束，解析一次后按编号有序保存，
+      每次追加只解析最后一个提交标记与未提交部分的片段（范围不变时使用缓存）
+    - 配置了通讯录时：已提交文本中提到的人员（没有参会人员表述时作为参会人员）
+
+    会话只保留之后的解析还需要的文本窗口（回看范围、尚未确定的议题片段与未提交部分），
+    已解析完的文本被丢弃，追加的耗时与会话总长度无关。保存的位置都按全文计。
+
+    结果与对全文调用 parse_meeting_info 一致（按句末提交的长行除外：字段取值截止到句末）。
+    """
+
+    def __init__(self, clean_attendees, leader_from_segment, preparation_from_segment, keyword_meeting_type):
+        """
+        :param clean_attendees: 参会人员原文 -> 人员名单（app.clean_attendees）
+        :param leader_from_segment: 议题片段 -> 负责人（app.leader_from_segment）
+        :param preparation_from_segment: (议题片段, 负责人) -> 会前准备（app.preparation_from_segment）
+        :param keyword_meeting_type: 各类别关键词命中数 -> 会议类型（app.keyword_meeting_type）
+        """
+        self.id = uuid.uuid4().hex
+        self.length = 0
+        # 文本窗口：全文中 [_base, length) 的部分
+        self._window = ''
+        self._base = 0
+        self.revision = 0
+        self.lock = threading.Lock()
+        self._clean_attendees = clean_attendees
+        self._leader_from_segment = leader_from_segment
+        self._preparation_from_segment = preparation_from_segment
+        self._keyword_meeting_type = keyword_meeting_type
+
+        # 各字段的模式（按优先级），与 app.parse_meeting_info 一致；会话内不随配置变化
+        self._patterns = field_patterns()
+        self._committed = 0
+        self._matcher = get_meeting_type_matcher()
+        self._keyword_state = None
+        self._keyword_hits = set()
+        # 会话内使用创建时的分类模型，模型文件更新不影响进行中的会话
+        self._classifier = get_meeting_classifier()
+        self._ngram_counts = self._classifier.ngram_counts('') if self._classifier is not None else None
+        # 新增的 n-gram 最多向前跨 max(orders) - 1 个字符，窗口需保留这部分
+        self._margin = max(CONTEXT_CHARS, max(self._classifier.orders)) if self._classifier is not None \
+            else CONTEXT_CHARS
+        self._fields = dict.fromkeys(self._patterns)
+        self._markers = {'cn': [], 'ar': []}
+        self._closed = {family: _ClosedSegments() for family in self._markers}
+        self._segment_cache = {}
+        self._attendee_cache = (None, '未指定')
+        self._people = {}
+        self.meeting_info = self._build(dict.fromkeys(self._patterns), {'cn': [], 'ar': []}, [])
+
+    def _lookback(self, pos):
+        """pos 所在行的行首（最多回看 LOOKBACK_CHARS 个字符）"""
+        # 只在回看范围内查找换行，没有换行的长文本不必回扫到开头
+        base = self._base
+        newline = self._window.rfind('\n', max(pos - LOOKBACK_CHARS - 1, base) - base, max(pos - 1, base) - base)
+        return max(newline + 1 + base if newline >= 0 else 0, pos - LOOKBACK_CHARS, 0)
+
+    def _commit_point(self):
+        """新的提交位置：最后一个换行之后；未结束的行过长时退到最后一个句末之后"""
+        text, base = self._window, self._base
+        newline = text.rfind('\n', self._committed - base) + 1
+        if newline:
+            return base + newline
+        if self.length - self._committed <= config.LIVE_SESSION_LINE_CHARS:
+            return self._committed
+        last = None
+        for last in rp.SENTENCE_END.finditer(text, self._committed - base):
+            pass
+        # 句末在文本末尾时可能还会延续（如 "。" 之后紧跟换行），等下次追加再提交
+        if last is None or base + last.end() == self.length:
+            return self._committed
+        return base + last.end()
+
+    def append(self, chunk, offset=None):
+        """
+        追加一段转写文本，返回当前的会议信息
+
+        :param offset: 可选，客户端认为的当前文本长度；与实际不符时拒绝，防止重试导致重复追加
+        :raises SessionOffsetMismatch: offset 与会话长度不一致
+        :raises SessionTooLarge: 追加后超过 LIVE_SESSION_MAX_CHARS
+        """
+        if offset is not None and offset != self.length:
+            raise SessionOffsetMismatch(self.length)
+        if self.length + len(chunk) > config.LIVE_SESSION_MAX_CHARS:
+            raise SessionTooLarge(f"会话文本超过 {config.LIVE_SESSION_MAX_CHARS} 个字符")
+        if not chunk:
+            return self.meeting_info
+
+        previous = self.length
+        self._window += chunk
+        self.length += len(chunk)
+        text, base = self._window, self._base
+        self._keyword_hits, self._keyword_state = self._matcher.scan(
+            chunk, self._keyword_state, self._keyword_hits
+        )
+        if self._classifier is not None:
+            # 只统计跨到新增部分的 n-gram，耗时与会话长度无关
+            tail_start = max(previous - max(self._classifier.orders) + 1, 0)
+            self._ngram_counts += self._classifier.ngram_counts(text[tail_start - base:], previous - tail_start)
+
+        # 已提交部分：只扫描新提交的行（从上一行行首开始，覆盖跨行的匹配）
+        committed = self._commit_point()
+        if committed > self._committed:
+            lookback = self._lookback(self._committed)
+            for field, patterns in self._patterns.items():
+                self._fields[field] = _best_match(patterns, text, lookback - base, committed - base,
+                                                  self._fields[field], base)
+            new_markers = _scan_markers(text, self._committed - base, committed - base, base)
+            for family in self._markers:
+                self._markers[family].extend(new_markers[family])
+            roster = get_roster()
+            if roster is not None:
+                self._people.update(dict.fromkeys(roster.people(text, self._committed - base, committed - base)))
+            self._committed = committed
+
+        # 未结束的行：临时结果，不写入状态
+        lookback = self._lookback(self._committed)
+        fields = {field: _best_match(patterns, text, lookback - base, len(text), self._fields[field], base)
+                  for field, patterns in self._patterns.items()}
+        tail_markers = _scan_markers(text, self._committed - base, len(text), base)
+        people = list(self._people)
+        roster = get_roster()
+        if roster is not None:
+            people = list(dict.fromkeys(people + roster.people(text, self._committed - base, len(text))))
+
+        self.meeting_info = self._build(fields, tail_markers, people)
+        self.revision += 1
+        self._trim_window()
+        return self.meeting_info
+
+    def _settled(self, marker):
+        """议题片段的解析结果已经确定：两个结束位置都已出现在已提交部分，之后的片段终点不会更早"""
+        cached = self._segment_cache.get(marker[1])
+        return (cached is not None and cached[1] is not None and cached[2] is not None
+                and cached[2] < self._committed)
+
+    def _trim_window(self):
+        """丢弃之后不再需要的文本：保留回看范围与第一个结果未确定的议题片段"""
+        keep = self._committed - LOOKBACK_CHARS - 1
+        # 已有提交的中文编号时只会使用中文编号，阿拉伯数字编号的片段不再需要
+        families = ('cn',) if self._markers['cn'] else ('cn', 'ar')
+        for family in families:
+            for marker in self._markers[family][self._closed[family].count:]:
+                if not self._settled(marker):
+                    keep = min(keep, marker[1])
+                    break
+        keep -= self._margin
+        # 丢弃的部分超过窗口一半时才复制，复制的总量与追加的总量成正比
+        if keep - self._base > len(self._window) // 2:
+            self._window = self._window[keep - self._base:]
+            self._base = keep
+
+    def _close_segments(self, family):
+        """结算之后已有提交标记的片段（每个标记只解析一次），按编号插入有序列表"""
+        markers = self._markers[family]
+        closed = self._closed[family]
+        while closed.count < len(markers) - 1:
+            marker = markers[closed.count]
+            end = markers[closed.count + 1][1]
+            closed.count += 1
+            if marker[0] in closed.numbers:
+                continue
+            closed.numbers.add(marker[0])
+            details = self._segment_details(marker, end)
+            self._segment_cache.pop(marker[1], None)
+            if details is not None:
+                index = bisect.bisect(closed.keys, marker[0])
+                closed.keys.insert(index, marker[0])
+                closed.topics.insert(index, dict(details))
+
+    def _topics(self, tail_markers):
+        """
+        当前的议题列表，与 TopicIndex 相同的分段规则：优先中文编号，重复编号取第一次出现，按编号排序
+
+        已结束的片段直接取有序列表，只解析最后一个提交标记与未提交部分标记的片段。
+        """
+        family = 'cn' if self._markers['cn'] or tail_markers['cn'] else 'ar'
+        self._close_segments(family)
+        closed = self._closed[family]
+
+        markers = self._markers[family][closed.count:] + tail_markers[family]
+        open_topics = {}
+        for i, marker in enumerate(markers):
+            if marker[0] in closed.numbers or marker[0] in open_topics:
+                continue
+            end = markers[i + 1][1] if i + 1 < len(markers) else self.length
+            open_topics[marker[0]] = self._segment_details(marker, end)
+        open_topics = sorted((number, dict(details)) for number, details in open_topics.items()
+                             if details is not None)
+
+        # 未结束的片段通常编号最大，直接接在后面；否则按编号插入
+        if not open_topics or not closed.keys or open_topics[0][0] > closed.keys[-1]:
+            return closed.topics + [details for _, details in open_topics]
+        keys, topics = list(closed.keys), list(closed.topics)
+        for number, details in open_topics:
+            index = bisect.bisect(keys, number)
+            keys.insert(index, number)
+            topics.insert(index, details)
+        return topics
+
+    def _segment_details(self, marker, end):
+        """
+        解析编号标记 marker 之后到 end 的议题片段（议题、负责人、会前准备），跳过编号之后的空白
+
+        议题止于第一个分隔标点，片段止于第一个句号或分号；结束位置已经出现且仍在片段内时，
+        结果不随片段延长而变化，直接使用缓存（按标记起点缓存，不再访问文本）。
+        """
+        cached = self._segment_cache.get(marker[1])
+        if cached is not None:
+            cached_end, topic_stop, segment_stop, details = cached
+            if (cached_end == end or
+                    (topic_stop is not None and segment_stop is not None and segment_stop < end)):
+                return details
+
+        text, base = self._window, self._base
+        body_start = marker[2]
+        while body_start < end and text[body_start - base].isspace():
+            body_start += 1
+        match = rp.TOPIC_END.search(text, body_start - base, end - base)
+        topic_stop = base + match.start() if match else None
+        match = rp.SEGMENT_END.search(text, body_start - base, end - base)
+        segment_stop = base + match.start() if match else None
+
+        topic = text[body_start - base:(end if topic_stop is None else topic_stop) - base].strip()
+        details = None
+        if topic:
+            segment = text[body_start - base:(end if segment_stop is None else segment_stop) - base]
+            leader = self._leader_from_segment(segment)
+            details = {
+                'topic': topic,
+                'leader': leader,
+                'preparation': self._preparation_from_segment(segment, leader)
+            }
+        self._segment_cache[marker[1]] = (end, topic_stop, segment_stop, details)
+        return details
+
+    def _build(self, fields, tail_markers, people):
+        values = {field: (best[2] if best else None) for field, best in fields.items()}
+
+        attendees_text = values['attendees']
+        if not attendees_text and people:
+            attendees = '，'.join(people)
+        else:
+            if self._attendee_cache[0] != attendees_text:
+                self._attendee_cache = (attendees_text, self._clean_attendees(attendees_text))
+            attendees = self._attendee_cache[1]
+
+        meeting_type = None
+        if self._classifier is not None:
+            probabilities = self._classifier.probabilities(self._ngram_counts[None, :])
+            meeting_type = self._classifier.labels(probabilities, config.MEETING_TYPE_MIN_CONFIDENCE)[0]
+        if meeting_type is None:
+            meeting_type = self._keyword_meeting_type(self._matcher.count_from_hits(self._keyword_hits))
+
+        meeting_info = {field: values[field] or '未指定' for field in BASIC_FIELDS}
+        meeting_info['attendees'] = attendees
+        meeting_info['meeting_type'] = meeting_type
+
+        topics = self._topics(tail_markers)
+        meeting_info['topics'] = topics
+
+        if meeting_info['theme'] == '未指定' and topics:
+            meeting_info['theme'] = topics[0]['topic'][:50]
+        return meeting_info
+
+    def to_dict(self):
+        return {
+            'session_id': self.id,
+            'length': self.length,
+            'revision': self.revision,
+            'data': self.meeting_info
+        }
+
+
+class LiveSessionStore:
+    """进程内的会话存储（有界 LRU；空闲超过 ttl 秒的会话被清除）"""
+
+    def __init__(self, max_sessions=256, ttl=3600):
+        self._cache = MemoryLRUCache(max_entries=max_sessions, ttl=ttl)
+
+    def add(self, session):
+        self._cache.set(session.id, session)
+        return session
+
+    def get(self, session_id):
+        return self._cache.get(session_id)
+
+    def touch(self, session):
+        """刷新空闲计时"""
+        self._cache.set(session.id, session)
+
+    def remove(self, session_id):
+        return self._cache.pop(session_id)
+
+
+_store_lock = threading.Lock()
+_store = None
+
+
+def get_session_store():
+    """获取进程内共享的会话存储"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = LiveSessionStore(
+                    max_sessions=config.LIVE_SESSION_MAX,
+                    ttl=config.LIVE_SESSION_TTL
+                )
+    return _store
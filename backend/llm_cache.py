@@ -0,0 +1,165 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+import config
+from memory_cache import MemoryLRUCache
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_prompt(prompt):
+    """规范化提示词：全角/半角统一（NFKC），折叠空白"""
+    prompt = unicodedata.normalize('NFKC', prompt or '')
+    return _WHITESPACE.sub(' ', prompt).strip()
+
+
+def cache_key(prompt, model):
+    """缓存键：模型名 + 规范化提示词的 SHA-256"""
+    digest = hashlib.sha256()
+    digest.update((model or '').encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(normalize_prompt(prompt).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class SQLiteCacheTier:
+    """磁盘缓存层（SQLite），条目数超限时按最近访问时间淘汰"""
+
+    def __init__(self, path, max_entries=10000, ttl=None):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS llm_cache ('
+            ' key TEXT PRIMARY KEY, model TEXT, response TEXT,'
+            ' created REAL, accessed REAL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed)')
+        self._conn.commit()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT response, created FROM llm_cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, created = row
+            if self.ttl and created + self.ttl < now:
+                self._conn.execute('DELETE FROM llm_cache WHERE key = ?', (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute('UPDATE llm_cache SET accessed = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+            return response
+
+    def set(self, key, model, response):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO llm_cache (key, model, response, created, accessed)'
+                ' VALUES (?, ?, ?, ?, ?)',
+                (key, model, response, now, now)
+            )
+            count = self._conn.execute('SELECT COUNT(*) FROM llm_cache').fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    'DELETE FROM llm_cache WHERE key IN'
+                    ' (SELECT key FROM llm_cache ORDER BY accessed LIMIT ?)',
+                    (count - self.max_entries,)
+                )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM llm_cache')
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class LLMResponseCache:
+    """LLM 响应缓存：内存 LRU + 可选 SQLite 磁盘层
+
+    以规范化提示词和模型名的哈希为键，重复提交相同（或仅空白不同）的文本时
+    直接返回缓存结果，磁盘层可跨进程重启保留。
+    """
+
+    def __init__(self, max_entries=256, ttl=None, db_path=None, db_max_entries=10000):
+        self.memory = MemoryLRUCache(max_entries=max_entries, ttl=ttl)
+        self.disk = SQLiteCacheTier(db_path, db_max_entries, ttl) if db_path else None
+        self._lock = threading.Lock()
+        self.counters = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0}
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def get(self, prompt, model):
+        key = cache_key(prompt, model)
+        response = self.memory.get(key)
+        if response is not None:
+            self._count('memory_hits')
+            return response
+        if self.disk is not None:
+            response = self.disk.get(key)
+            if response is not None:
+                self.memory.set(key, response)
+                self._count('disk_hits')
+                return response
+        self._count('misses')
+        return None
+
+    def set(self, prompt, model, response):
+        key = cache_key(prompt, model)
+        self.memory.set(key, response)
+        if self.disk is not None:
+            self.disk.set(key, model, response)
+        self._count('stores')
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters)
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = round((lookups - stats['misses']) / lookups, 4) if lookups else 0.0
+        stats['memory_entries'] = len(self.memory)
+        return stats
+
+
+_cache_lock = threading.Lock()
+_cache = None
+
+
+def get_llm_cache():
+    """获取进程内共享的 LLM 响应缓存；未启用时返回 None"""
+    global _cache
+    if not config.LLM_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMResponseCache(
+                    max_entries=config.LLM_CACHE_MAX_ENTRIES,
+                    ttl=config.LLM_CACHE_TTL or None,
+                    db_path=config.LLM_CACHE_DB_PATH or None,
+                    db_max_entries=config.LLM_CACHE_DB_MAX_ENTRIES
+                )
+    return _cache
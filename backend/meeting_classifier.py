@@ -0,0 +1,293 @@
+"""会议类型分类器：字符 n-gram 特征 + 离线训练的线性模型（需要 numpy）
+
+关键词规则只认词典里的原词，转写文本换个说法就只能判为 "通用会议"。分类器把文本的
+字符 1~3-gram 哈希到固定维数的计数向量，经 log(1+x) 与 L2 归一化后乘以权重矩阵，
+softmax 得到各类别的置信度。一批文本构成一个特征矩阵，一次矩阵乘法给出整批结果。
+
+模型从标注语料（JSONL，每行 {"text": ..., "label": ...}）离线训练，保存为 .npz，
+服务启动时加载一次，文件更新后自动重新加载::
+
+    cd backend
+    python meeting_classifier.py train labeled.jsonl meeting_types.npz
+    python meeting_classifier.py predict meeting_types.npz "下周把服务器扩容方案过一遍"
+
+未配置 MEETING_TYPE_MODEL、文件不存在或没有安装 numpy 时不使用分类器，沿用关键词规则。
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+
+import config
+
+try:
+    import numpy as np
+except ImportError:  # 可选依赖：没有 numpy 时只能使用关键词规则
+    np = None
+
+logger = logging.getLogger(__name__)
+
+MODEL_VERSION = 1
+DEFAULT_DIMS = 1 << 14
+DEFAULT_ORDERS = (1, 2, 3)
+
+_PRIME = 1000003
+_ORDER_SALT = 0x9E3779B97F4A7C15
+_UINT64_MASK = (1 << 64) - 1
+
+
+def _codes(text):
+    """文本（转小写）的 Unicode 码位数组"""
+    return np.frombuffer(text.lower().encode('utf-32-le'), dtype='<u4').astype(np.uint64)
+
+
+def _hash_ngrams(codes, order, first, count, dims):
+    """codes[first:first + count + order - 1] 中各 order-gram 的哈希桶编号"""
+    with np.errstate(over='ignore'):
+        hashes = np.full(count, (_ORDER_SALT * order) & _UINT64_MASK, dtype=np.uint64)
+        for offset in range(order):
+            hashes = hashes * np.uint64(_PRIME) + codes[first + offset:first + offset + count]
+        hashes ^= hashes >> np.uint64(29)
+    return (hashes % np.uint64(dims)).astype(np.int64)
+
+
+def ngram_indices(text, dims, orders=DEFAULT_ORDERS, start=0):
+    """
+    文本中各字符 n-gram 的哈希桶编号
+
+    只包含结束位置在 start 之后（至少含一个 text[start:] 中字符）的 n-gram，
+    因此 ngram_indices(a + b, start=len(a)) 与 ngram_indices(a) 的计数相加即为 a + b 的计数。
+    """
+    codes = _codes(text)
+    pieces = []
+    for order in orders:
+        first = max(start - order + 1, 0)
+        count = len(codes) - order + 1 - first
+        if count > 0:
+            pieces.append(_hash_ngrams(codes, order, first, count, dims))
+    return np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.int64)
+
+
+def batch_ngram_indices(texts, dims, orders=DEFAULT_ORDERS):
+    """
+    一批文本的 n-gram：(所属行号, 哈希桶编号) 两个数组
+
+    所有文本拼接后一次计算哈希，丢弃跨越文本边界的 n-gram，结果与逐个调用 ngram_indices 相同。
+    """
+    lowered = [text.lower() for text in texts]
+    codes = np.frombuffer(''.join(lowered).encode('utf-32-le'), dtype='<u4').astype(np.uint64)
+    owner = np.repeat(np.arange(len(texts), dtype=np.int64), [len(text) for text in lowered])
+    rows, indices = [], []
+    for order in orders:
+        count = len(codes) - order + 1
+        if count <= 0:
+            continue
+        within = owner[:count] == owner[order - 1:]
+        rows.append(owner[:count][within])
+        indices.append(_hash_ngrams(codes, order, 0, count, dims)[within])
+    if not rows:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    return np.concatenate(rows), np.concatenate(indices)
+
+
+class MeetingTypeClassifier:
+    """线性 n-gram 分类器（权重矩阵 dims × 类别数）"""
+
+    def __init__(self, categories, weights, bias, dims=DEFAULT_DIMS, orders=DEFAULT_ORDERS):
+        self.categories = list(categories)
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.bias = np.asarray(bias, dtype=np.float32)
+        self.dims = int(dims)
+        self.orders = tuple(int(order) for order in orders)
+        if self.weights.shape != (self.dims, len(self.categories)) or self.bias.shape != (len(self.categories),):
+            raise ValueError("分类模型的权重维数与类别数不一致")
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['version']) != MODEL_VERSION:
+                raise ValueError(f"不支持的分类模型版本: {int(data['version'])}")
+            return cls([str(c) for c in data['categories']], data['weights'], data['bias'],
+                       int(data['dims']), data['orders'].tolist())
+
+    def save(self, path):
+        """保存模型（先写临时文件再原子替换，运行中的服务不会读到半个文件）"""
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(tmp_path, version=np.int64(MODEL_VERSION), categories=np.array(self.categories),
+                 weights=self.weights, bias=self.bias, dims=np.int64(self.dims),
+                 orders=np.array(self.orders, dtype=np.int64))
+        os.replace(tmp_path, path)
+
+    def ngram_counts(self, text, start=0):
+        """单个文本的 n-gram 计数向量（见 ngram_indices 的 start）"""
+        return np.bincount(ngram_indices(text, self.dims, self.orders, start), minlength=self.dims)
+
+    def count_matrix(self, texts):
+        """一批文本的稠密计数矩阵（行数 × dims），用于训练"""
+        rows, indices = batch_ngram_indices(texts, self.dims, self.orders)
+        counts = np.bincount(rows * self.dims + indices, minlength=len(texts) * self.dims)
+        return counts.reshape(len(texts), self.dims)
+
+    def _softmax(self, scores, empty):
+        scores -= scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        scores[empty] = 0
+        return scores
+
+    def probabilities(self, counts):
+        """稠密计数矩阵 -> 各类别置信度（行数 × 类别数）；没有任何 n-gram 的行置信度全为 0"""
+        features = np.log1p(np.asarray(counts, dtype=np.float32))
+        norms = np.linalg.norm(features, axis=1, keepdims=True)
+        features /= np.maximum(norms, 1e-12)
+        return self._softmax(features @ self.weights + self.bias, norms[:, 0] == 0)
+
+    def predict_proba(self, texts):
+        """
+        一批文本的各类别置信度（行数 × 类别数），与 probabilities(count_matrix(texts)) 相同
+
+        特征矩阵按稀疏形式计算：(行, 桶) 去重计数、log(1+x) 与按行 L2 归一化后，
+        取出对应的权重行加权、按行求和，即稀疏矩阵与权重矩阵的乘积；耗时与 n-gram 总数成正比，与 dims 无关。
+        """
+        rows, indices = batch_ngram_indices(texts, self.dims, self.orders)
+        keys, counts = np.unique(rows * self.dims + indices, return_counts=True)
+        rows, indices = keys // self.dims, keys % self.dims
+        values = np.log1p(counts.astype(np.float32))
+        norms = np.sqrt(np.bincount(rows, values * values, minlength=len(texts)))
+        values /= norms[rows]
+
+        scores = np.zeros((len(texts), len(self.categories)), dtype=np.float32)
+        if len(keys):
+            # keys 已排序，同一行的特征连续排列
+            starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+            scores[rows[starts]] = np.add.reduceat(self.weights[indices] * values[:, None], starts, axis=0)
+        return self._softmax(scores + self.bias, norms == 0)
+
+    def labels(self, probabilities, min_confidence=0.0):
+        """置信度矩阵 -> 类别列表；最高置信度低于 min_confidence（或为 0）的为 None"""
+        best = probabilities.argmax(axis=1)
+        confidence = probabilities[np.arange(len(best)), best]
+        return [self.categories[b] if c > 0 and c >= min_confidence else None
+                for b, c in zip(best, confidence)]
+
+    def predict(self, texts, min_confidence=0.0):
+        """批量分类，返回类别列表（置信度不足的为 None，由调用方退回关键词规则）"""
+        return self.labels(self.predict_proba(list(texts)), min_confidence)
+
+
+def train_classifier(texts, labels, dims=DEFAULT_DIMS, orders=DEFAULT_ORDERS,
+                     epochs=300, learning_rate=5.0, l2=1e-4):
+    """
+    在标注文本上训练 softmax 回归（全量梯度下降）
+
+    特征矩阵整体放在内存中（样本数 × dims × 4 字节），语料很大时可调小 dims。
+    """
+    categories = list(dict.fromkeys(labels))
+    model = MeetingTypeClassifier(categories, np.zeros((dims, len(categories))), np.zeros(len(categories)),
+                                  dims, orders)
+    features = np.log1p(model.count_matrix(texts).astype(np.float32))
+    features /= np.maximum(np.linalg.norm(features, axis=1, keepdims=True), 1e-12)
+    targets = np.zeros((len(texts), len(categories)), dtype=np.float32)
+    targets[np.arange(len(texts)), [categories.index(label) for label in labels]] = 1
+
+    for _ in range(epochs):
+        scores = features @ model.weights + model.bias
+        scores -= scores.max(axis=1, keepdims=True)
+        probabilities = np.exp(scores)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        error = (probabilities - targets) / len(texts)
+        model.weights -= learning_rate * (features.T @ error + l2 * model.weights)
+        model.bias -= learning_rate * error.sum(axis=0)
+    return model
+
+
+def load_labeled_corpus(path):
+    """读取标注语料（JSONL，每行 {"text": ..., "label": ...}），返回 (文本列表, 类别列表)"""
+    texts, labels = [], []
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if not isinstance(record.get('text'), str) or not isinstance(record.get('label'), str):
+                raise ValueError(f"{path}:{line_number} 缺少字符串 text / label")
+            texts.append(record['text'])
+            labels.append(record['label'])
+    return texts, labels
+
+
+_classifier_lock = threading.Lock()
+_classifier_cache = {'signature': None, 'classifier': None}
+
+
+def get_meeting_classifier(path=None):
+    """
+    获取（缓存的）会议类型分类器；未配置 MEETING_TYPE_MODEL、文件不存在或没有 numpy 时返回 None
+
+    每次调用检查文件的修改时间与大小，模型重新训练（原子替换）后自动重新加载。
+    """
+    path = path or config.MEETING_TYPE_MODEL
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    signature = (path, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    if _classifier_cache['signature'] == signature:
+        return _classifier_cache['classifier']
+
+    with _classifier_lock:
+        if _classifier_cache['signature'] != signature:
+            classifier = None
+            if np is None:
+                logger.warning("已配置会议类型分类模型 %s，但未安装 numpy，使用关键词规则", path)
+            else:
+                try:
+                    classifier = MeetingTypeClassifier.load(path)
+                except (OSError, KeyError, ValueError) as e:
+                    logger.warning("加载会议类型分类模型失败: %s", e)
+                else:
+                    logger.info("已加载会议类型分类模型 %s（%d 个类别）", path, len(classifier.categories))
+            _classifier_cache['classifier'] = classifier
+            _classifier_cache['signature'] = signature
+        return _classifier_cache['classifier']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    train = commands.add_parser('train', help='在标注语料上训练分类模型')
+    train.add_argument('corpus', help='JSONL 标注语料（每行 {"text": ..., "label": ...}）')
+    train.add_argument('output')
+    train.add_argument('--dims', type=int, default=DEFAULT_DIMS, help='特征哈希维数')
+    train.add_argument('--epochs', type=int, default=300)
+    predict = commands.add_parser('predict', help='用模型对一段文本分类')
+    predict.add_argument('model')
+    predict.add_argument('text')
+    args = parser.parse_args()
+
+    if np is None:
+        sys.exit("会议类型分类器需要 numpy（pip install numpy）")
+
+    if args.command == 'train':
+        texts, labels = load_labeled_corpus(args.corpus)
+        model = train_classifier(texts, labels, dims=args.dims, epochs=args.epochs)
+        accuracy = sum(p == label for p, label in zip(model.predict(texts), labels)) / len(labels)
+        model.save(args.output)
+        print(f"已写入 {args.output}：{len(texts)} 条样本，{len(model.categories)} 个类别，"
+              f"训练集准确率 {accuracy:.1%}")
+        return 0
+
+    model = MeetingTypeClassifier.load(args.model)
+    for category, probability in sorted(zip(model.categories, model.predict_proba([args.text])[0]),
+                                        key=lambda item: -item[1]):
+        print(f"{probability:>7.1%}  {category}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class MemoryLRUCache:
+    """线程安全的内存 LRU 缓存，支持条目数上限、总大小上限与过期时间（TTL）"""
+
+    def __init__(self, max_entries=256, ttl=None, max_bytes=None, sizeof=len):
+        """
+        :param max_entries: 最大条目数，None 表示不限制
+        :param ttl: 过期时间（秒），None 表示不过期
+        :param max_bytes: 所有值的总大小上限，None 表示不限制；超过上限的单个值不缓存
+        :param sizeof: 计算值大小的函数（仅在设置 max_bytes 时使用）
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def _size(self, value):
+        return self._sizeof(value) if self.max_bytes is not None else 0
+
+    def _remove(self, key):
+        value, _ = self._data.pop(key)
+        self._bytes -= self._size(value)
+        return value
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expires = item
+            if expires is not None and expires < time.monotonic():
+                self._remove(key)
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        size = self._size(value)
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._data[key] = (value, expires)
+            self._bytes += size
+            while ((self.max_entries is not None and len(self._data) > self.max_entries)
+                   or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+                self._remove(next(iter(self._data)))
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            return self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    @property
+    def total_bytes(self):
+        """当前所有值的总大小（仅在设置 max_bytes 时统计）"""
+        return self._bytes
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
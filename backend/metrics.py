@@ -0,0 +1,225 @@
+import bisect
+import threading
+import time
+
+# 默认的耗时分桶（秒），覆盖从亚毫秒级的正则解析到上百秒的模型调用
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+def _format_labels(labelnames, values, extra=None):
+    pairs = list(zip(labelnames, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._labelset = frozenset(self.labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if labels.keys() != self._labelset:
+            raise ValueError(f"{self.name} 需要标签 {self.labelnames}，实际为 {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    """只增不减的计数器"""
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in items]
+
+
+class Histogram(_Metric):
+    """耗时分布（累积分桶 + 总和 + 次数）"""
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}
+
+    def observe(self, value, **labels):
+        self._observe(self._key(labels), value)
+
+    def _observe(self, key, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def time(self, **labels):
+        """计时上下文：退出时记录耗时（异常时同样记录）"""
+        return _Timer(self, self._key(labels))
+
+    def count(self, **labels):
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def _samples(self):
+        with self._lock:
+            items = sorted((key, ([*state[0]], state[1], state[2])) for key, state in self._values.items())
+        lines = []
+        for key, (bucket_counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), bucket_counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, ('le', _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class _Timer:
+    """Histogram.time 的上下文管理器（解析路径上每个阶段一次，避免生成器式上下文的开销）"""
+
+    __slots__ = ('_histogram', '_key', '_start')
+
+    def __init__(self, histogram, key):
+        self._histogram = histogram
+        self._key = key
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._histogram._observe(self._key, time.perf_counter() - self._start)
+        return False
+
+
+class Registry:
+    """指标注册表；collector 在导出时调用，用于暴露其它模块已有的统计（缓存命中、队列深度等）"""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector):
+        """
+        注册导出时调用的函数
+
+        collector 返回 [(指标名, 类型, 说明, [(标签字典, 值), ...]), ...]
+        """
+        with self._lock:
+            self._collectors.append(collector)
+        return collector
+
+    def render(self):
+        """导出 Prometheus 文本格式"""
+        blocks = [metric.render() for metric in self._metrics]
+        for collector in self._collectors:
+            try:
+                families = collector()
+            except Exception:
+                continue
+            for name, kind, documentation, samples in families:
+                lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(tuple(labels), tuple(labels.values()))} {_format_value(value)}")
+                blocks.append('\n'.join(lines))
+        return '\n'.join(blocks) + '\n'
+
+
+REGISTRY = Registry()
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    'meeting_stage_duration_seconds', '各处理阶段的耗时（秒）', ['stage']))
+REQUEST_SECONDS = REGISTRY.register(Histogram(
+    'meeting_http_request_duration_seconds', 'HTTP 请求处理耗时（秒）', ['endpoint']))
+REQUESTS = REGISTRY.register(Counter(
+    'meeting_http_requests_total', 'HTTP 请求数', ['endpoint', 'method', 'status']))
+EXTRACTIONS = REGISTRY.register(Counter(
+    'meeting_extractions_total', '信息提取次数（path=direct 为直接解析即足够，llm 为使用了 Ollama 后备）', ['path']))
+OLLAMA_CALLS = REGISTRY.register(Counter(
+    'meeting_ollama_calls_total', 'Ollama 调用次数（按结果：ok / cache_hit / timeout / error）', ['outcome']))
+DOCUMENTS = REGISTRY.register(Counter(
+    'meeting_documents_total', '生成的文档数', ['renderer']))
+LLM_QUEUE_WAIT_SECONDS = REGISTRY.register(Histogram(
+    'meeting_llm_queue_wait_seconds', '模型调用等待准入的时间（秒）'))
+LLM_ADMISSION_REJECTED = REGISTRY.register(Counter(
+    'meeting_llm_admission_rejected_total', '未获准入的模型调用数（reason=queue_full / timeout）', ['reason']))
+PARSE_LIMITED = REGISTRY.register(Counter(
+    'meeting_parse_limited_total', '超出直接解析限制的次数（reason=too_large / timeout）', ['reason']))
+
+
+_stage_keys = {}
+
+
+def _stage_key(stage):
+    key = _stage_keys.get(stage)
+    if key is None:
+        key = _stage_keys[stage] = STAGE_SECONDS._key({'stage': stage})
+    return key
+
+
+def stage_timer(stage):
+    """记录某个处理阶段耗时的上下文管理器"""
+    return _Timer(STAGE_SECONDS, _stage_key(stage))
+
+
+def timed_call(stage, fn, *args, **kwargs):
+    """调用 fn 并记录为某个阶段的耗时"""
+    start = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        STAGE_SECONDS._observe(_stage_key(stage), time.perf_counter() - start)
+
+
+def render_metrics():
+    return REGISTRY.render()
@@ -0,0 +1,322 @@
+import codecs
+import http.client
+import json
+import logging
+import os
+import queue
+import socket
+import subprocess
+import threading
+from urllib.parse import urlsplit
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class OllamaError(Exception):
+    """Ollama 调用失败"""
+
+
+class OllamaTimeout(OllamaError):
+    """Ollama 响应超时"""
+
+
+class OllamaUnavailable(OllamaError):
+    """无法连接 Ollama 服务"""
+
+
+class OllamaHTTPClient:
+    """Ollama HTTP API 客户端
+
+    复用 keep-alive 连接（连接池），并通过 ``keep_alive`` 让模型常驻内存，
+    避免每次调用都启动新进程、重新加载模型。
+    """
+
+    def __init__(self, host=None, connect_timeout=None, read_timeout=None,
+                 keep_alive=None, pool_size=None):
+        url = urlsplit(host or config.OLLAMA_HOST)
+        self.scheme = url.scheme or 'http'
+        self.host = url.hostname or '127.0.0.1'
+        self.port = url.port or (443 if self.scheme == 'https' else 11434)
+        self.connect_timeout = connect_timeout if connect_timeout is not None else config.OLLAMA_CONNECT_TIMEOUT
+        self.read_timeout = read_timeout if read_timeout is not None else config.OLLAMA_READ_TIMEOUT
+        self.keep_alive = keep_alive if keep_alive is not None else config.OLLAMA_KEEP_ALIVE
+        self._pool = queue.LifoQueue(maxsize=pool_size or config.OLLAMA_POOL_SIZE)
+
+    def _new_connection(self):
+        connection_class = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+        connection = connection_class(self.host, self.port, timeout=self.connect_timeout)
+        try:
+            connection.connect()
+        except socket.timeout as e:
+            raise OllamaUnavailable(f"连接 Ollama 超时: {e}") from e
+        except OSError as e:
+            raise OllamaUnavailable(f"无法连接 Ollama: {e}") from e
+        # 连接建立后改用读超时；关闭 Nagle 避免小请求与延迟确认叠加
+        connection.sock.settimeout(self.read_timeout)
+        connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return connection
+
+    def _acquire(self):
+        try:
+            return self._pool.get_nowait(), True
+        except queue.Empty:
+            return self._new_connection(), False
+
+    def _release(self, connection):
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def request(self, method, path, payload=None):
+        """发送请求并返回 (HTTPResponse, 连接)；调用方读完响应后需 ``_release`` 连接"""
+        body = json.dumps(payload).encode('utf-8') if payload is not None else None
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+
+        connection, reused = self._acquire()
+        while True:
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                return response, connection
+            except socket.timeout as e:
+                connection.close()
+                raise OllamaTimeout(f"Ollama 响应超时: {e}") from e
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                connection.close()
+                if not reused:
+                    raise OllamaUnavailable(f"Ollama 连接中断: {e}") from e
+                # 池中的空闲连接可能已被服务端关闭，换新连接重试一次
+                connection, reused = self._new_connection(), False
+            except OSError as e:
+                connection.close()
+                raise OllamaUnavailable(f"无法连接 Ollama: {e}") from e
+
+    def _read_json(self, response, connection):
+        try:
+            data = response.read()
+        except socket.timeout as e:
+            connection.close()
+            raise OllamaTimeout(f"Ollama 响应超时: {e}") from e
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+        if response.status != 200:
+            raise OllamaError(f"Ollama 返回错误 {response.status}: {data[:200].decode('utf-8', errors='ignore')}")
+        return json.loads(data.decode('utf-8'))
+
+    def generate(self, prompt, model=None, options=None):
+        """调用 /api/generate（非流式），返回模型输出文本"""
+        payload = {
+            'model': model or config.OLLAMA_MODEL,
+            'prompt': prompt,
+            'stream': False,
+            'keep_alive': self.keep_alive
+        }
+        if options:
+            payload['options'] = options
+        response, connection = self.request('POST', '/api/generate', payload)
+        return self._read_json(response, connection).get('response', '')
+
+    def generate_stream(self, prompt, model=None, options=None):
+        """
+        调用 /api/generate（流式），逐个产出模型生成的文本片段
+
+        响应为 NDJSON，每行一个片段；完整读完后连接放回连接池，
+        调用方中途关闭生成器时直接关闭连接。
+        """
+        payload = {
+            'model': model or config.OLLAMA_MODEL,
+            'prompt': prompt,
+            'stream': True,
+            'keep_alive': self.keep_alive
+        }
+        if options:
+            payload['options'] = options
+        response, connection = self.request('POST', '/api/generate', payload)
+        if response.status != 200:
+            self._read_json(response, connection)
+
+        finished = False
+        try:
+            while True:
+                try:
+                    line = response.readline()
+                except socket.timeout as e:
+                    raise OllamaTimeout(f"Ollama 响应超时: {e}") from e
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                chunk = json.loads(line.decode('utf-8'))
+                if chunk.get('error'):
+                    raise OllamaError(f"Ollama 返回错误: {chunk['error']}")
+                if chunk.get('response'):
+                    yield chunk['response']
+                if chunk.get('done'):
+                    break
+            # 读完分块结尾，连接才能复用
+            response.read()
+            finished = True
+        finally:
+            if finished and not response.will_close:
+                self._release(connection)
+            else:
+                connection.close()
+
+    def load_model(self, model=None):
+        """预加载模型：不带提示词的 /api/generate 只把模型载入内存（按 keep_alive 常驻），不生成内容"""
+        payload = {
+            'model': model or config.OLLAMA_MODEL,
+            'stream': False,
+            'keep_alive': self.keep_alive
+        }
+        response, connection = self.request('POST', '/api/generate', payload)
+        return self._read_json(response, connection)
+
+    def ping(self):
+        """检查 Ollama 服务是否可达"""
+        response, connection = self.request('GET', '/api/version')
+        return self._read_json(response, connection)
+
+    def close(self):
+        """关闭池中的所有空闲连接"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class OllamaSubprocessClient:
+    """通过 ``ollama run`` 命令行调用模型（每次调用启动一个进程）"""
+
+    def __init__(self, command=None, timeout=None):
+        self.command = (command or config.OLLAMA_COMMAND).split()
+        self.timeout = timeout if timeout is not None else config.OLLAMA_READ_TIMEOUT
+
+    def generate(self, prompt, model=None, options=None):
+        try:
+            result = subprocess.run(
+                self.command + ["run", model or config.OLLAMA_MODEL],
+                input=prompt.encode("utf-8"),
+                capture_output=True,
+                timeout=self.timeout
+            )
+        except subprocess.TimeoutExpired as e:
+            raise OllamaTimeout("Ollama 命令行响应超时") from e
+        except OSError as e:
+            raise OllamaUnavailable(f"无法启动 Ollama 命令行: {e}") from e
+        return result.stdout.decode("utf-8", errors="ignore")
+
+    def generate_stream(self, prompt, model=None, options=None):
+        """逐块读取 ``ollama run`` 的标准输出，边生成边产出"""
+        try:
+            process = subprocess.Popen(
+                self.command + ["run", model or config.OLLAMA_MODEL],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError as e:
+            raise OllamaUnavailable(f"无法启动 Ollama 命令行: {e}") from e
+
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(self.timeout, kill)
+        timer.daemon = True
+        timer.start()
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        try:
+            try:
+                process.stdin.write(prompt.encode("utf-8"))
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+            while True:
+                data = os.read(process.stdout.fileno(), 4096)
+                if not data:
+                    break
+                text = decoder.decode(data)
+                if text:
+                    yield text
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+            if timed_out.is_set():
+                raise OllamaTimeout("Ollama 命令行响应超时")
+        finally:
+            timer.cancel()
+            if process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            process.wait()
+
+    def close(self):
+        pass
+
+
+class FallbackOllamaClient:
+    """优先使用 HTTP 客户端，服务不可达时退回命令行客户端"""
+
+    def __init__(self, primary, fallback):
+        self.primary = primary
+        self.fallback = fallback
+
+    def generate(self, prompt, model=None, options=None):
+        try:
+            return self.primary.generate(prompt, model, options)
+        except OllamaUnavailable as e:
+            logger.warning("Ollama HTTP 不可用，改用命令行: %s", e)
+            return self.fallback.generate(prompt, model, options)
+
+    def generate_stream(self, prompt, model=None, options=None):
+        stream = self.primary.generate_stream(prompt, model, options)
+        try:
+            first = next(stream, None)
+        except OllamaUnavailable as e:
+            logger.warning("Ollama HTTP 不可用，改用命令行: %s", e)
+            yield from self.fallback.generate_stream(prompt, model, options)
+            return
+        if first is not None:
+            yield first
+            yield from stream
+
+    def load_model(self, model=None):
+        return self.primary.load_model(model)
+
+    def close(self):
+        self.primary.close()
+        self.fallback.close()
+
+
+def create_ollama_client(backend=None):
+    """按配置创建 Ollama 客户端"""
+    backend = backend or config.OLLAMA_BACKEND
+    if backend == 'subprocess':
+        return OllamaSubprocessClient()
+    client = OllamaHTTPClient()
+    if config.OLLAMA_SUBPROCESS_FALLBACK:
+        return FallbackOllamaClient(client, OllamaSubprocessClient())
+    return client
+
+
+_client_lock = threading.Lock()
+_client = None
+
+
+def get_ollama_client():
+    """获取进程内共享的 Ollama 客户端"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = create_ollama_client()
+    return _client
@@ -0,0 +1,203 @@
+import io
+import os
+import re
+import threading
+import zipfile
+from xml.sax.saxutils import escape
+
+from docx import Document
+
+from word_generator import TEMPLATE_STYLES, get_base_template
+
+DOCUMENT_PART = 'word/document.xml'
+
+# 与 WordMeetingGenerator 相同的单元格宽度（dxa，1 cm ≈ 567 dxa）
+BASIC_CELL_WIDTH = 4535        # Cm(8)
+ATTENDEE_TITLE_WIDTH = 2268    # Cm(4)
+ATTENDEE_CONTENT_WIDTH = 6803  # Cm(12)
+GRID_COL_WIDTH = 4320          # python-docx 默认两列表格的列宽
+
+_TBL_PR = (
+    '<w:tblPr><w:tblW w:type="auto" w:w="0"/><w:jc w:val="left"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+    ' w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+    f'<w:tblGrid><w:gridCol w:w="{GRID_COL_WIDTH}"/><w:gridCol w:w="{GRID_COL_WIDTH}"/></w:tblGrid>'
+)
+
+# XML 1.0 不允许的控制字符
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+_RUN_SPECIAL_CHARS = re.compile('([\t\n\r])')
+
+
+def _run(text):
+    """文字 run：制表符转为 <w:tab/>，换行转为 <w:br/>（与 python-docx 一致）"""
+    text = _INVALID_XML_CHARS.sub('', text)
+    if not text:
+        return '<w:r/>'
+    parts = []
+    for piece in _RUN_SPECIAL_CHARS.split(text):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece in ('\n', '\r'):
+            parts.append('<w:br/>')
+        elif piece:
+            space = ' xml:space="preserve"' if len(piece.strip()) < len(piece) else ''
+            parts.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    return f'<w:r>{"".join(parts)}</w:r>'
+
+
+def _paragraph(*runs, style_id=None):
+    ppr = f'<w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>' if style_id else ''
+    if not runs and not ppr:
+        return '<w:p/>'
+    return f'<w:p>{ppr}{"".join(runs)}</w:p>'
+
+
+def _cell(width, *paragraphs, span=None):
+    grid_span = f'<w:gridSpan w:val="{span}"/>' if span else ''
+    body = ''.join(paragraphs) or '<w:p/>'
+    return f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/>{grid_span}</w:tcPr>{body}</w:tc>'
+
+
+class _StaticParts:
+    """从基础模板中预先取出的静态部分"""
+
+    def __init__(self, template_path=None):
+        template = get_base_template(template_path)
+
+        # 除 document.xml 外的所有部件（样式、关系、内容类型等）预先压缩成 ZIP 前缀
+        prefix = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(template)) as source, \
+                zipfile.ZipFile(prefix, 'w', zipfile.ZIP_DEFLATED) as target:
+            for item in source.infolist():
+                if item.filename == DOCUMENT_PART:
+                    document_xml = source.read(item).decode('utf-8')
+                else:
+                    target.writestr(item, source.read(item), compress_type=zipfile.ZIP_DEFLATED)
+        self.zip_prefix = prefix.getvalue()
+
+        # document.xml 骨架：<w:body> 之前的声明与分节属性 sectPr
+        body_start = document_xml.index('<w:body>') + len('<w:body>')
+        sect_start = document_xml.index('<w:sectPr')
+        self.head = document_xml[:body_start]
+        self.tail = document_xml[sect_start:]
+
+        styles = Document(io.BytesIO(template)).styles
+        self.style_ids = {kind: styles[name].style_id
+                          for kind, (name, _, _) in TEMPLATE_STYLES.items()}
+
+
+_static_lock = threading.Lock()
+_static_parts = {}
+
+
+def get_static_parts(template_path=None):
+    """获取（缓存的）静态部件"""
+    parts = _static_parts.get(template_path)
+    if parts is None:
+        with _static_lock:
+            parts = _static_parts.get(template_path)
+            if parts is None:
+                parts = _static_parts[template_path] = _StaticParts(template_path)
+    return parts
+
+
+class OoxmlMeetingRenderer:
+    """直接输出 OOXML 的会议记录渲染器
+
+    与 TemplateWordMeetingGenerator 版式一致，但不经过 python-docx 对象模型：
+    document.xml 由预先计算的骨架加转义后的片段流式写出，
+    其余静态部件以压缩好的字节缓存，每次只追加 document.xml。
+    """
+
+    def __init__(self, template_path=None):
+        self.template_path = template_path
+
+    def create_meeting_document(self, meeting_info, output):
+        """
+        创建会议记录文档（表格形式）
+
+        :param meeting_info: 会议信息字典
+        :param output: 输出文件路径，或可写的文件对象（如 BytesIO）
+        :return: 传入的 output
+        """
+        static = get_static_parts(self.template_path)
+        buffer = io.BytesIO(static.zip_prefix)
+        buffer.seek(0, io.SEEK_END)
+        with zipfile.ZipFile(buffer, 'a', zipfile.ZIP_DEFLATED) as archive:
+            with archive.open(DOCUMENT_PART, 'w') as part:
+                for fragment in self._document_fragments(meeting_info, static):
+                    part.write(fragment.encode('utf-8'))
+
+        if isinstance(output, (str, os.PathLike)):
+            os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+            with open(output, 'wb') as f:
+                f.write(buffer.getvalue())
+        else:
+            output.write(buffer.getvalue())
+        return output
+
+    def _document_fragments(self, meeting_info, static):
+        style_ids = static.style_ids
+        yield static.head
+
+        # 标题
+        yield _paragraph(_run('会议记录'), style_id=style_ids['title'])
+        yield _paragraph()
+
+        # 会议基本信息表格
+        yield '<w:tbl>' + _TBL_PR
+        yield '<w:tr>' + _cell(
+            BASIC_CELL_WIDTH * 2,
+            _paragraph(_run('会议主题：'), _run(meeting_info.get('theme', '未指定'))),
+            span=2
+        ) + '</w:tr>'
+        yield '<w:tr>' + _cell(
+            BASIC_CELL_WIDTH,
+            _paragraph(_run('主持人：'), _run(meeting_info.get('host', '未指定')))
+        ) + _cell(BASIC_CELL_WIDTH) + '</w:tr>'
+        yield '<w:tr>' + _cell(
+            BASIC_CELL_WIDTH,
+            _paragraph(_run('会议地点：'), _run(meeting_info.get('location', '未指定')))
+        ) + _cell(
+            BASIC_CELL_WIDTH,
+            _paragraph(_run('会议时长：'), _run(meeting_info.get('duration', '未指定')))
+        ) + '</w:tr></w:tbl>'
+        yield _paragraph()
+
+        # 参会人员表格
+        yield '<w:tbl>' + _TBL_PR + '<w:tr>'
+        yield _cell(ATTENDEE_TITLE_WIDTH, _paragraph(_run('参会人员：')))
+        yield _cell(ATTENDEE_CONTENT_WIDTH, _paragraph(_run(meeting_info.get('attendees', '未指定'))))
+        yield '</w:tr></w:tbl>'
+        yield _paragraph()
+
+        # 会议内容记录表格
+        full_width = GRID_COL_WIDTH * 2
+        yield '<w:tbl>' + _TBL_PR
+        yield '<w:tr>' + _cell(
+            full_width, _paragraph(_run('会议内容记录'), style_id=style_ids['header']), span=2
+        ) + '</w:tr>'
+
+        topics = meeting_info.get('topics', [])
+        for i, topic in enumerate(topics, 1):
+            yield '<w:tr>' + _cell(
+                full_width,
+                _paragraph(_run(f"议题{i}：{topic.get('topic', '')}"), style_id=style_ids['topic']),
+                _paragraph(_run(f"负责人：{topic.get('leader', '未指定')}"), style_id=style_ids['detail']),
+                _paragraph(_run(f"会前准备：{topic.get('preparation', '无')}"), style_id=style_ids['detail']),
+                span=2
+            ) + '</w:tr>'
+
+        # 最后一行：会前准备事项（如果有），否则为空行
+        if meeting_info.get('preparation_items', '') and topics:
+            yield '<w:tr>' + _cell(
+                full_width,
+                _paragraph(_run(f"会前准备事项：{meeting_info.get('preparation_items')}")),
+                span=2
+            ) + '</w:tr>'
+        else:
+            yield '<w:tr>' + _cell(GRID_COL_WIDTH) + _cell(GRID_COL_WIDTH) + '</w:tr>'
+        yield '</w:tbl>'
+
+        yield static.tail
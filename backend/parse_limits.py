@@ -0,0 +1,47 @@
+import time
+
+import config
+import metrics
+
+
+class ParseLimitExceeded(Exception):
+    """直接解析超出单次请求的限制"""
+
+
+class InputTooLarge(ParseLimitExceeded, ValueError):
+    """会议文本超过 PARSE_MAX_CHARS"""
+
+
+class ParseTimeout(ParseLimitExceeded):
+    """直接解析超过 PARSE_TIME_LIMIT"""
+
+
+def check_input_size(text):
+    """
+    检查会议文本长度
+
+    :raises InputTooLarge: 超过 config.PARSE_MAX_CHARS（0 表示不限制）
+    """
+    if config.PARSE_MAX_CHARS and len(text) > config.PARSE_MAX_CHARS:
+        metrics.PARSE_LIMITED.inc(reason='too_large')
+        raise InputTooLarge(f"会议文本超过 {config.PARSE_MAX_CHARS} 个字符（当前 {len(text)}）")
+
+
+class ParseDeadline:
+    """解析的时间上限：各阶段之间检查，超时后不再继续
+
+    检查只发生在阶段之间，单个阶段无法被打断；linear 模式下每个阶段的耗时与文本长度成正比，
+    regex 模式下病态输入可能在单个正则内耗时过长，超时要等该正则返回后才能发现。
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.start = time.perf_counter()
+
+    def check(self, stage):
+        """
+        :raises ParseTimeout: 已超过时间上限（seconds 为 0 时不限制）
+        """
+        if self.seconds and time.perf_counter() - self.start > self.seconds:
+            metrics.PARSE_LIMITED.inc(reason='timeout')
+            raise ParseTimeout(f"解析超过 {self.seconds:g} 秒（停止于 {stage}）")
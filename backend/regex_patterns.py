@@ -0,0 +1,168 @@
+import logging
+import re
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# 中文数字（议题编号）
+CHINESE_NUMS = ['一', '二', '三', '四', '五', '六', '七', '八', '九', '十']
+CHINESE_DIGITS = {num: i for i, num in enumerate(CHINESE_NUMS[:9], 1)}
+
+# 参数化正则的缓存上限
+PATTERN_CACHE_SIZE = 512
+LEADER_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern, flags=0):
+    """编译并缓存正则表达式（字符串模式的统一入口）"""
+    return re.compile(pattern, flags)
+
+
+def _compile_all(patterns, flags=0):
+    return tuple(re.compile(pattern, flags) for pattern in patterns)
+
+
+class RegexHelper:
+    """正则表达式辅助类
+
+    所有方法既接受预编译的 ``re.Pattern``（或 linear_scan.FieldScanner 等接口相同的对象），
+    也接受字符串模式；字符串模式会经过 ``compile_pattern`` 的 LRU 缓存编译。
+    """
+    @staticmethod
+    def _resolve(pattern, flags):
+        if not isinstance(pattern, str):
+            return pattern
+        return compile_pattern(pattern, flags)
+
+    @staticmethod
+    def safe_search(pattern, text, flags=0):
+        try:
+            return RegexHelper._resolve(pattern, flags).search(text)
+        except re.error as e:
+            logger.error("正则表达式错误: %s, %s", pattern, e)
+            return None
+
+    @staticmethod
+    def safe_sub(pattern, repl, text, flags=0):
+        try:
+            return RegexHelper._resolve(pattern, flags).sub(repl, text)
+        except re.error as e:
+            logger.error("正则表达式替换错误: %s", e)
+            return text
+
+    @staticmethod
+    def safe_split(pattern, text, maxsplit=0, flags=0):
+        try:
+            return RegexHelper._resolve(pattern, flags).split(text, maxsplit=maxsplit)
+        except re.error as e:
+            logger.error("正则表达式分割错误: %s", e)
+            return [text]
+
+    @staticmethod
+    def safe_findall(pattern, text, flags=0):
+        try:
+            return RegexHelper._resolve(pattern, flags).findall(text)
+        except re.error as e:
+            logger.error("正则表达式查找错误: %s", e)
+            return []
+
+
+# ---- 静态模式：导入时一次性编译 ----
+
+HOST_PATTERNS = _compile_all([
+    r'主持人[：:]\s*(.+?)[\n\r]',
+    r'主持人[：:]\s*(.+)',
+    r'由([^，,。\n\r]+)主持'
+])
+
+LOCATION_PATTERNS = _compile_all([
+    r'(?:在|于)\s*([^，,。\n\r]+?)\s*(?:召开|举行|开)',
+    r'会议地点[：:]\s*(.+?)[\n\r]',
+    r'会议地点[：:]\s*(.+)'
+])
+
+DURATION_PATTERNS = _compile_all([
+    r'会议大概开([^，,。\n\r]+)',
+    r'会议时长[：:]\s*(.+?)[\n\r]',
+    r'会议时长[：:]\s*(.+)',
+    r'大约([^，,。\n\r]+)小时'
+])
+
+THEME_PATTERNS = _compile_all([
+    r'会议主题[：:]\s*(.+?)[\n\r]',
+    r'会议主题[：:]\s*(.+)',
+    r'讨论([^，,。\n\r]+)',
+    r'关于([^，,。\n\r]+)的会议'
+])
+
+ATTENDEE_PATTERNS = _compile_all([
+    r'参会(?:人员)?[：:]\s*([^。\n\r]+?)(?:。|会议)',
+    r'参会的有([^。\n\r]+?)(?:。|会议)',
+    r'参加(?:人员)?包括([^。\n\r]+?)(?:。|会议)',
+    r'出席(?:人员)?[：:]\s*([^。\n\r]+?)(?:。|会议)'
+])
+
+ATTENDEE_SPLIT = re.compile(r'[，,、]')
+ATTENDEE_NOISE = _compile_all([r'还有新来的', r'还有', r'以及'])
+
+# 议题编号标记："一是" / "十二、" / "3." 等，只在文本开头、空白、标点或 "议题" / "事项" / "第" 之后生效
+# （"议题一是预算" 是编号，"张三、李四" 不是）
+TOPIC_MARKER = re.compile(
+    r'(?:^|(?<=[\s，,。；;：:、（(第])|(?<=议题)|(?<=事项))'
+    r'(?:(?P<cn>[一二三四五六七八九十百]{1,4})(?:是|、|\.)'
+    r'|(?P<ar>\d{1,3})(?:、|\.(?!\d)|．|\)|）))'
+)
+# 议题内容结束于第一个分隔标点
+TOPIC_END = re.compile(r'[，,；。\n\r]')
+# 议题片段（负责人 / 会前准备的查找范围）结束于句号或分号
+SEGMENT_END = re.compile(r'[。；;]')
+# 长文本分块时可切分的句末位置
+SENTENCE_END = re.compile(r'[。！？!?；;\n]+')
+# 字段线索词：延迟预算模式下粗略判断直接解析是否可能不足
+FIELD_CUES = re.compile(r'主题|主持|地点|会议室|参会|参加|出席|时长|小时|议题|一是|负责|准备')
+# 合并分块结果时比较议题，忽略空白与标点
+TOPIC_NORMALIZE = re.compile(r'[\s，,。；;：:、！!？?]+')
+
+LEADER_PATTERNS = _compile_all([
+    # 匹配 "XX你准备" 或 "XX负责"
+    r'([^，,。；;\n\r]{2,4})(?:你|您)(?:准备|负责|牵头)',
+    # 匹配 "XX负责这块"
+    r'([^，,。；;\n\r]{2,4})负责(?:这块|该议题)',
+    # 匹配 "由XX负责"
+    r'由([^，,。；;\n\r]{2,4})负责'
+])
+
+# 通讯录中的人名之后紧跟这些词时视为议题负责人
+LEADER_CUE = re.compile(r'[你您]?(?:准备|负责|牵头|主讲|汇报)')
+
+LEADER_CLEANUP = re.compile(r'[你您]|负责|牵头|主讲|汇报|^由|特别是.*|，.*')
+
+PREPARATION_CLEANUP = re.compile(r'；.*|二是.*|三是.*')
+PREPARATION_TRAILING_PUNCT = re.compile(r'[，,；;.。]$')
+
+
+# ---- 参数化模式：按负责人缓存 ----
+
+@lru_cache(maxsize=LEADER_CACHE_SIZE)
+def preparation_patterns(leader):
+    """会前准备模式（按负责人姓名缓存）"""
+    escaped = re.escape(leader)
+    return _compile_all([
+        rf'{escaped}[你您]?准备下?([^，,。；;\n\r]+?)(?:[，,。；;]|$)',
+        rf'{escaped}[你您]?需准备([^，,。；;\n\r]+?)(?:[，,。；;]|$)'
+    ])
+
+
+def cache_info():
+    """返回各参数化缓存的命中统计"""
+    return {
+        'compile_pattern': compile_pattern.cache_info(),
+        'preparation_patterns': preparation_patterns.cache_info(),
+    }
+
+
+def clear_caches():
+    """清空参数化模式缓存（基准测试冷启动用）"""
+    compile_pattern.cache_clear()
+    preparation_patterns.cache_clear()
@@ -0,0 +1,102 @@
+import hashlib
+import json
+import threading
+
+import config
+from memory_cache import MemoryLRUCache
+
+BASIC_FIELDS = ['theme', 'host', 'location', 'attendees', 'duration']
+
+
+def empty_meeting_info():
+    """未解析出任何信息时的会议信息"""
+    return {
+        'theme': '未指定',
+        'host': '未指定',
+        'location': '未指定',
+        'attendees': '未指定',
+        'duration': '未指定',
+        'topics': [],
+        'meeting_type': '通用会议'
+    }
+
+
+def normalize_meeting_info(data):
+    """
+    校验并规范化客户端提交的 meeting_info
+
+    :param data: 结构化会议信息（来自 /extract 的 data 字段）
+    :return: 字段齐全的会议信息字典
+    :raises ValueError: 结构不合法
+    """
+    if not isinstance(data, dict):
+        raise ValueError("meeting_info 必须是对象")
+
+    meeting_info = empty_meeting_info()
+    for field in BASIC_FIELDS + ['meeting_type']:
+        value = data.get(field)
+        if value is None or value == '':
+            continue
+        if not isinstance(value, str):
+            raise ValueError(f"meeting_info.{field} 必须是字符串")
+        meeting_info[field] = value
+
+    topics = data.get('topics') or []
+    if not isinstance(topics, list):
+        raise ValueError("meeting_info.topics 必须是数组")
+    for topic in topics:
+        if not isinstance(topic, dict) or not isinstance(topic.get('topic', ''), str):
+            raise ValueError("meeting_info.topics 的每一项必须包含字符串 topic")
+        meeting_info['topics'].append({
+            'topic': topic.get('topic', ''),
+            'leader': str(topic.get('leader') or '未指定'),
+            'preparation': str(topic.get('preparation') or '无')
+        })
+
+    if data.get('preparation_items'):
+        meeting_info['preparation_items'] = str(data['preparation_items'])
+    return meeting_info
+
+
+def meeting_info_digest(meeting_info):
+    """会议信息的内容哈希（规范化 JSON 的 SHA-256）"""
+    canonical = json.dumps(meeting_info, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ExtractionStore:
+    """/extract 结果的服务端存储（有界 LRU + 过期时间）
+
+    提取 ID 即结果内容的哈希，同时作为 ETag 返回给客户端；
+    /generate 可凭 ID 直接渲染用户确认过的结果，无需再次解析。
+    """
+
+    def __init__(self, max_entries=512, ttl=3600):
+        self._cache = MemoryLRUCache(max_entries=max_entries, ttl=ttl)
+
+    def save(self, meeting_info):
+        extraction_id = meeting_info_digest(meeting_info)[:32]
+        self._cache.set(extraction_id, meeting_info)
+        return extraction_id
+
+    def get(self, extraction_id):
+        if not isinstance(extraction_id, str):
+            return None
+        return self._cache.get(extraction_id.strip('"'))
+
+
+_store_lock = threading.Lock()
+_store = None
+
+
+def get_extraction_store():
+    """获取进程内共享的提取结果存储"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ExtractionStore(
+                    max_entries=config.EXTRACTION_STORE_MAX_ENTRIES,
+                    ttl=config.EXTRACTION_STORE_TTL
+                )
+    return _store
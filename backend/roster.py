@@ -0,0 +1,393 @@
+"""组织通讯录索引：在会议记录中识别已知的人员与部门
+
+通讯录（CSV：name,department,aliases）离线编译为紧凑的 Aho-Corasick 自动机文件，
+服务运行时以 mmap 方式只读打开：不需要解析、多进程共享同一份页面缓存，
+文件更新后按修改时间自动重新映射::
+
+    cd backend
+    python roster.py compile roster.csv roster.idx
+    python roster.py lookup roster.idx "请张伟和市场部小王准备材料"
+
+CSV 示例（aliases 用 | 分隔；只有 department 的行表示部门）::
+
+    name,department,aliases
+    王强,市场部,小王|强哥
+    张伟,技术部,
+    ,法务部,
+"""
+import argparse
+import array
+import bisect
+import csv
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections import deque, namedtuple
+
+import config
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'MRST'
+VERSION = 1
+# 魔数、版本、字节序标记、状态数、边数、条目数、字符串区字节数（本机字节序，与后面的数组一致）
+HEADER = struct.Struct('=4sIIIIII')
+BYTE_ORDER_MARK = 0x01020304
+
+KIND_PERSON = 0
+KIND_DEPARTMENT = 1
+
+# 单字的名字几乎在任何文本中都会命中，编译时忽略
+MIN_KEY_CHARS = 2
+# 检查索引文件是否更新的最小间隔（秒），其余调用直接返回缓存的索引
+ROSTER_CHECK_INTERVAL = 1.0
+
+RosterMatch = namedtuple('RosterMatch', 'start end kind name department')
+
+
+def load_roster_source(path):
+    """
+    读取通讯录 CSV
+
+    :return: [(匹配用的写法, 类型, 规范名称, 所属部门), ...]
+    """
+    keys = []
+    departments = []
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            name = (row.get('name') or '').strip()
+            department = (row.get('department') or '').strip()
+            if department:
+                departments.append(department)
+            if not name:
+                continue
+            aliases = [alias.strip() for alias in (row.get('aliases') or '').split('|')]
+            for key in [name] + aliases:
+                if key:
+                    keys.append((key, KIND_PERSON, name, department))
+    keys.extend((department, KIND_DEPARTMENT, department, department)
+                for department in dict.fromkeys(departments))
+    return keys
+
+
+def _resolve_entries(keys):
+    """合并同一写法的多个条目：同名不同部门的人员去掉部门，指向不同人员的别名视为有歧义并丢弃"""
+    resolved = {}
+    ambiguous = set()
+    for key, kind, name, department in keys:
+        if len(key) < MIN_KEY_CHARS or key in ambiguous:
+            continue
+        entry = (kind, name, department)
+        previous = resolved.get(key)
+        if previous is None or previous == entry:
+            resolved[key] = entry
+        elif previous[:2] == entry[:2]:
+            resolved[key] = (kind, name, '')
+        elif previous[0] == KIND_PERSON and kind == KIND_DEPARTMENT:
+            resolved[key] = entry
+        elif not (previous[0] == KIND_DEPARTMENT and kind == KIND_PERSON):
+            logger.warning("通讯录中 %s 对应多个人员，忽略该写法", key)
+            ambiguous.add(key)
+            del resolved[key]
+    return resolved
+
+
+def compile_roster(keys, output_path):
+    """
+    把通讯录编译为自动机文件（先写临时文件再原子替换，正在使用旧文件的进程不受影响）
+
+    文件内容依次为文件头与以下 uint32 数组：各状态出边的起始位置、出边字符（每个状态内按码位排序）、
+    出边目标、失配指针、输出条目（编号 + 1，0 表示无）、输出长度、输出链（失配链上下一个有输出的状态），
+    以及条目的类型、名称与部门在字符串区的偏移和长度；最后是 UTF-8 字符串区。
+
+    :param keys: load_roster_source 的返回值
+    :return: (状态数, 条目数)
+    """
+    resolved = _resolve_entries(keys)
+
+    entries = []
+    entry_ids = {}
+    goto = [{}]
+    output = [0]
+    output_len = [0]
+    for key in sorted(resolved):
+        entry = resolved[key]
+        if entry not in entry_ids:
+            entry_ids[entry] = len(entries)
+            entries.append(entry)
+        state = 0
+        for char in key:
+            next_state = goto[state].get(char)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][char] = next_state
+                goto.append({})
+                output.append(0)
+                output_len.append(0)
+            state = next_state
+        output[state] = entry_ids[entry] + 1
+        output_len[state] = len(key)
+
+    fail = [0] * len(goto)
+    dict_link = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, next_state in goto[state].items():
+            queue.append(next_state)
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            target = goto[fallback].get(char, 0)
+            fail[next_state] = target
+            dict_link[next_state] = target if output[target] else dict_link[target]
+
+    edge_offsets = array.array('I', [0])
+    edge_chars = array.array('I')
+    edge_targets = array.array('I')
+    for edges in goto:
+        for char in sorted(edges):
+            edge_chars.append(ord(char))
+            edge_targets.append(edges[char])
+        edge_offsets.append(len(edge_chars))
+
+    strings = bytearray()
+
+    def add_string(value):
+        data = value.encode('utf-8')
+        strings.extend(data)
+        return len(strings) - len(data), len(data)
+
+    kinds, name_offsets, name_lengths, department_offsets, department_lengths = (
+        array.array('I') for _ in range(5))
+    for kind, name, department in entries:
+        kinds.append(kind)
+        offset, length = add_string(name)
+        name_offsets.append(offset)
+        name_lengths.append(length)
+        offset, length = add_string(department)
+        department_offsets.append(offset)
+        department_lengths.append(length)
+
+    arrays = [edge_offsets, edge_chars, edge_targets, array.array('I', fail), array.array('I', output),
+              array.array('I', output_len), array.array('I', dict_link),
+              kinds, name_offsets, name_lengths, department_offsets, department_lengths]
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.roster-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, BYTE_ORDER_MARK, len(goto),
+                                len(edge_chars), len(entries), len(strings)))
+            for values in arrays:
+                values.tofile(f)
+            f.write(strings)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return len(goto), len(entries)
+
+
+class Roster:
+    """mmap 打开的通讯录自动机；只读，可在多线程间共享"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        magic, version, byte_order, n_states, n_edges, n_entries, strings_size = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"不是通讯录索引文件或版本不兼容: {path}")
+        if byte_order != BYTE_ORDER_MARK:
+            raise ValueError(f"通讯录索引的字节序与本机不同，请在本机重新编译: {path}")
+
+        offset = HEADER.size
+        arrays = []
+        for count in [n_states + 1, n_edges, n_edges] + [n_states] * 4 + [n_entries] * 5:
+            arrays.append(view[offset:offset + 4 * count].cast('I'))
+            offset += 4 * count
+        (self._edge_offsets, self._edge_chars, self._edge_targets, self._fail,
+         self._output, self._output_len, self._dict_link,
+         self._entry_kind, self._name_offset, self._name_length,
+         self._department_offset, self._department_length) = arrays
+        self._strings = view[offset:offset + strings_size]
+        self.size = n_entries
+
+        # 根状态的出边最多（每个姓氏 / 首字一条），单独放进字典，跳过无关字符
+        start, end = self._edge_offsets[0], self._edge_offsets[1]
+        self._root = {chr(self._edge_chars[i]): self._edge_targets[i] for i in range(start, end)}
+        self._entry_cache = {}
+
+    def _goto(self, state, code):
+        start, end = self._edge_offsets[state], self._edge_offsets[state + 1]
+        i = bisect.bisect_left(self._edge_chars, code, start, end)
+        if i < end and self._edge_chars[i] == code:
+            return self._edge_targets[i]
+        return 0
+
+    def _entry(self, entry_id):
+        entry = self._entry_cache.get(entry_id)
+        if entry is None:
+            strings = self._strings
+            name_start = self._name_offset[entry_id]
+            department_start = self._department_offset[entry_id]
+            entry = (self._entry_kind[entry_id],
+                     bytes(strings[name_start:name_start + self._name_length[entry_id]]).decode('utf-8'),
+                     bytes(strings[department_start:department_start + self._department_length[entry_id]]).decode('utf-8'))
+            self._entry_cache[entry_id] = entry
+        return entry
+
+    def _all_matches(self, text, pos, endpos):
+        """一次扫描产出所有（可能重叠的）匹配：(起点, 终点, 条目编号)"""
+        root = self._root
+        fail = self._fail
+        output = self._output
+        output_len = self._output_len
+        dict_link = self._dict_link
+        state = 0
+        for i in range(pos, endpos):
+            char = text[i]
+            if not state:
+                state = root.get(char, 0)
+                if not state:
+                    continue
+            else:
+                code = ord(char)
+                next_state = self._goto(state, code)
+                while not next_state:
+                    state = fail[state]
+                    if not state:
+                        next_state = root.get(char, 0)
+                        break
+                    next_state = self._goto(state, code)
+                state = next_state
+            match_state = state if output[state] else dict_link[state]
+            while match_state:
+                yield i + 1 - output_len[match_state], i + 1, output[match_state] - 1
+                match_state = dict_link[match_state]
+
+    def find(self, text, pos=0, endpos=None):
+        """
+        查找 text[pos:endpos] 中的人员与部门（最左最长、互不重叠）
+
+        :return: [RosterMatch, ...]，按出现位置排序
+        """
+        endpos = len(text) if endpos is None else min(endpos, len(text))
+        candidates = sorted(self._all_matches(text, pos, endpos), key=lambda m: (m[0], -m[1]))
+        matches = []
+        covered = pos
+        for start, end, entry_id in candidates:
+            if start < covered:
+                continue
+            kind, name, department = self._entry(entry_id)
+            matches.append(RosterMatch(start, end, kind, name, department))
+            covered = end
+        return matches
+
+    def people(self, text, pos=0, endpos=None):
+        """text 中提到的人员（规范名称，按首次出现排序、去重）"""
+        return list(dict.fromkeys(match.name for match in self.find(text, pos, endpos)
+                                  if match.kind == KIND_PERSON))
+
+    def normalize_attendee(self, person):
+        """
+        把参会名单中的一项规范化为通讯录中的名称
+
+        :return: [(名称, 部门前缀), ...]；名称用于去重，显示时为 部门前缀 + 名称
+        - 包含一个或多个已知人员：规范名称，同一项里提到部门时作为前缀（"市场部小王" -> ("王强", "市场部")），
+          漏写分隔符的多个人名会被拆开
+        - 只有部门：部门名称
+        - 未知人员（外部来宾等）：原样返回
+        """
+        matches = self.find(person)
+        people = [match for match in matches if match.kind == KIND_PERSON]
+        departments = [match.name for match in matches if match.kind == KIND_DEPARTMENT]
+        if not people:
+            name = departments[0] if departments and len(departments[0]) == len(person) else person
+            return [(name, '')]
+        prefix = departments[0] if len(departments) == 1 and len(people) == 1 else ''
+        return [(match.name, prefix) for match in people]
+
+    def close(self):
+        for view in (self._edge_offsets, self._edge_chars, self._edge_targets, self._fail, self._output,
+                     self._output_len, self._dict_link, self._entry_kind, self._name_offset,
+                     self._name_length, self._department_offset, self._department_length, self._strings):
+            view.release()
+        self._mmap.close()
+
+
+_roster_lock = threading.Lock()
+_roster_cache = {'path': None, 'checked': 0.0, 'signature': None, 'roster': None}
+
+
+def get_roster(path=None):
+    """
+    获取（缓存的）通讯录索引；未配置 ROSTER_PATH 或文件不存在时返回 None
+
+    每 ROSTER_CHECK_INTERVAL 秒最多检查一次文件的 inode、修改时间与大小，
+    重新编译（原子替换）后自动重新映射；旧的映射不主动关闭，仍在使用它的请求可以正常完成。
+    """
+    path = path or config.ROSTER_PATH
+    if not path:
+        return None
+    if (_roster_cache['path'] == path and
+            time.monotonic() - _roster_cache['checked'] < ROSTER_CHECK_INTERVAL):
+        return _roster_cache['roster']
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        signature = None
+    else:
+        signature = (path, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    with _roster_lock:
+        if _roster_cache['signature'] != signature or _roster_cache['path'] != path:
+            roster = None
+            if signature is not None:
+                try:
+                    roster = Roster(path)
+                except (OSError, ValueError) as e:
+                    logger.warning("加载通讯录索引失败: %s", e)
+                else:
+                    logger.info("已加载通讯录索引 %s（%d 个条目）", path, roster.size)
+            _roster_cache['roster'] = roster
+            _roster_cache['signature'] = signature
+        _roster_cache['path'] = path
+        _roster_cache['checked'] = time.monotonic()
+        return _roster_cache['roster']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    compile_command = commands.add_parser('compile', help='把通讯录 CSV 编译为索引文件')
+    compile_command.add_argument('source')
+    compile_command.add_argument('output')
+    lookup = commands.add_parser('lookup', help='用索引文件识别一段文本中的人员与部门')
+    lookup.add_argument('index')
+    lookup.add_argument('text')
+    args = parser.parse_args()
+
+    if args.command == 'compile':
+        states, entries = compile_roster(load_roster_source(args.source), args.output)
+        print(f"已写入 {args.output}：{entries} 个条目，{states} 个状态，"
+              f"{os.path.getsize(args.output) / 1024:.1f} KB")
+        return 0
+
+    roster = Roster(args.index)
+    for match in roster.find(args.text):
+        kind = '部门' if match.kind == KIND_DEPARTMENT else '人员'
+        print(f"{match.start:>6}  {args.text[match.start:match.end]}  ->  {kind} {match.name}"
+              + (f"（{match.department}）" if match.department and match.kind == KIND_PERSON else ''))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""生产环境启动：gunicorn 多进程 + preload
+
+    cd backend
+    python serve.py [--bind 0.0.0.0:5000] [--workers 1] [--threads 8]
+
+主进程先创建应用并完成本地预热（正则、关键词自动机、文档模板），再 fork 出工作进程，
+工作进程直接继承预热好的状态；Ollama 连接与模型加载在每个工作进程内于后台进行。
+
+默认只启动一个工作进程（见 config.SERVER_WORKERS）：提取结果、异步任务、实时转写会话等状态
+保存在进程内存中，多个工作进程之间不共享。
+"""
+import argparse
+import multiprocessing
+import sys
+
+import config
+
+
+def _post_fork(server, worker):
+    # 连接不能跨 fork 共享，每个工作进程自行建立 Ollama 连接
+    if config.WARMUP_ENABLED and config.WARMUP_OLLAMA:
+        from warmup import start_ollama_warmup
+        start_ollama_warmup()
+
+
+def build_options(bind=None, workers=None, threads=None, timeout=None):
+    """gunicorn 配置（参数为空时取 config 中的 SERVER_* 设置）"""
+    return {
+        'bind': bind or config.SERVER_BIND,
+        'workers': workers or config.SERVER_WORKERS or multiprocessing.cpu_count(),
+        'worker_class': 'gthread',
+        'threads': threads or config.SERVER_THREADS,
+        'timeout': timeout or config.SERVER_TIMEOUT,
+        'preload_app': True,
+        'post_fork': _post_fork,
+        'accesslog': '-',
+        'loglevel': config.LOG_LEVEL.lower()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bind', help=f'监听地址（默认 {config.SERVER_BIND}）')
+    parser.add_argument('--workers', type=int, help=f'工作进程数（默认 {config.SERVER_WORKERS}，0 表示 CPU 核数）')
+    parser.add_argument('--threads', type=int, help=f'每个进程的线程数（默认 {config.SERVER_THREADS}）')
+    parser.add_argument('--timeout', type=int, help=f'工作进程超时秒数（默认 {config.SERVER_TIMEOUT}）')
+    args = parser.parse_args()
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        sys.exit("未安装 gunicorn（pip install -r requirements.txt）；gunicorn 不支持 Windows，可改用 python app.py")
+
+    class MeetingApplication(BaseApplication):
+        def __init__(self, options):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from app import create_app
+            # 主进程只做本地预热，Ollama 留给 fork 之后的工作进程
+            return create_app(warm_ollama=False)
+
+    MeetingApplication(build_options(args.bind, args.workers, args.threads, args.timeout)).run()
+
+
+if __name__ == '__main__':
+    main()
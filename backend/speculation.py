@@ -0,0 +1,135 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import config
+import regex_patterns as rp
+from admission import AdmissionRejected
+
+logger = logging.getLogger(__name__)
+
+WINNER_REGEX = 'regex'
+WINNER_LLM = 'llm'
+
+
+def is_borderline(text):
+    """
+    粗略判断直接解析是否可能不足（用于决定是否提前启动模型调用）
+
+    只统计字段线索词（主题 / 主持 / 地点 / 一是 ...）出现的种类数，
+    比完整解析便宜得多；线索少于 config.SPECULATION_MIN_CUES 种时视为临界输入。
+    """
+    return len(set(rp.FIELD_CUES.findall(text))) < config.SPECULATION_MIN_CUES
+
+
+class _SpeculationPool:
+    """执行后台模型调用的线程池；在途任务数达到上限时不再投机启动"""
+
+    def __init__(self, workers):
+        self.workers = max(1, workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='speculation')
+        self._slots = threading.BoundedSemaphore(self.workers)
+
+    def try_submit(self, fn, *args):
+        """有空闲线程时提交任务并返回 Future，否则返回 None"""
+        if not self._slots.acquire(blocking=False):
+            return None
+        try:
+            future = self._executor.submit(fn, *args)
+        except RuntimeError:
+            self._slots.release()
+            return None
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+
+_pool_lock = threading.Lock()
+_pool = None
+
+
+def get_speculation_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = _SpeculationPool(config.SPECULATION_WORKERS)
+    return _pool
+
+
+def _elapsed_ms(start):
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def race_extraction(text, parse, is_sufficient, llm_extract, merge, budget, speculate=True):
+    """
+    在延迟预算内竞速直接解析与模型提取
+
+    - 临界输入（is_borderline）在直接解析的同时提前启动模型调用
+    - 直接解析足够时立即返回，未开始的模型调用被取消，已开始的在后台跑完并写入缓存
+    - 直接解析不足时等待模型结果，最多等到预算截止；超时则先返回直接解析结果，
+      迟到的模型结果同样写入缓存，相同请求再来时可直接命中
+    - 后台线程全忙时不调用模型，直接返回直接解析结果
+
+    - 模型调用未获准入（AdmissionRejected）时同样返回直接解析结果，不受 LLM_OVERLOAD_POLICY 影响
+
+    竞速信息中 llm_status 为 skipped / cancelled / background / pending / busy / rejected / failed / done。
+
+    :param parse: 直接解析函数（文本 -> 会议信息）
+    :param is_sufficient: 判断直接解析结果是否足够
+    :param llm_extract: 模型提取函数（文本 -> (会议信息, 模型输出)），内部负责缓存
+    :param merge: 合并函数（直接解析结果, 模型结果 -> 会议信息）
+    :param budget: 延迟预算（秒）
+    :return: (会议信息, 原始文本或模型输出, 竞速信息)
+    """
+    start = time.perf_counter()
+    deadline = start + budget
+    race = {'winner': WINNER_REGEX, 'budget_ms': round(budget * 1000, 1),
+            'speculative': False, 'llm_status': 'skipped',
+            'regex_ms': None, 'llm_ms': None, 'total_ms': None}
+
+    def timed_llm_extract():
+        llm_start = time.perf_counter()
+        try:
+            return llm_extract(text)
+        finally:
+            race['llm_ms'] = _elapsed_ms(llm_start)
+
+    pool = get_speculation_pool()
+    future = None
+    if speculate and is_borderline(text):
+        future = pool.try_submit(timed_llm_extract)
+        race['speculative'] = future is not None
+
+    direct_parsed_info = parse(text)
+    race['regex_ms'] = _elapsed_ms(start)
+
+    if is_sufficient(direct_parsed_info):
+        if future is not None:
+            race['llm_status'] = 'cancelled' if future.cancel() else 'background'
+        race['total_ms'] = _elapsed_ms(start)
+        return direct_parsed_info, text, race
+
+    if future is None:
+        future = pool.try_submit(timed_llm_extract)
+    if future is None:
+        # 后台线程全忙：不再等待模型，保证在预算内返回
+        race['llm_status'] = 'busy'
+        race['total_ms'] = _elapsed_ms(start)
+        return direct_parsed_info, text, race
+
+    try:
+        ollama_parsed_info, result = future.result(timeout=max(0.0, deadline - time.perf_counter()))
+    except Exception as e:
+        if isinstance(e, TimeoutError) and not future.done():
+            race['llm_status'] = 'pending'
+        elif isinstance(e, AdmissionRejected):
+            race['llm_status'] = 'rejected'
+        else:
+            logger.warning("使用Ollama提取失败: %s", e)
+            race['llm_status'] = 'failed'
+        race['total_ms'] = _elapsed_ms(start)
+        return direct_parsed_info, text, race
+
+    race.update(winner=WINNER_LLM, llm_status='done', total_ms=_elapsed_ms(start))
+    return merge(direct_parsed_info, ollama_parsed_info), result, race
@@ -0,0 +1,91 @@
+from regex_patterns import CHINESE_DIGITS, TOPIC_MARKER, TOPIC_END, SEGMENT_END
+
+
+def chinese_to_int(num):
+    """将中文数字（一 ~ 九百九十九）转换为整数，无法识别时返回 None"""
+    if not num:
+        return None
+    total = 0
+    current = 0
+    for char in num:
+        if char in CHINESE_DIGITS:
+            if current:
+                return None  # "一一" 之类的连续数字不是编号
+            current = CHINESE_DIGITS[char]
+        elif char == '十':
+            total += (current or 1) * 10
+            current = 0
+        elif char == '百':
+            if not current:
+                return None
+            total += current * 100
+            current = 0
+        else:
+            return None
+    return total + current
+
+
+class TopicIndex:
+    """议题分段索引
+
+    对全文做一次扫描，记录所有议题编号标记（一是 / 二、 / 3. ...）的位置，
+    每个议题对应一个片段 ``[body_start, end)``，其中 ``end`` 为下一个编号标记的
+    起点或文本末尾。负责人、会前准备只需在各自片段内查找，不再重复扫描全文。
+
+    同时出现中文编号与阿拉伯数字编号时，优先使用中文编号；
+    同一编号重复出现时以第一次出现为准，议题按编号排序。
+    """
+
+    def __init__(self, text):
+        self.text = text or ''
+        self.segments = self._build()
+
+    def _build(self):
+        markers = {'cn': [], 'ar': []}
+        for match in TOPIC_MARKER.finditer(self.text):
+            if match.group('cn'):
+                family, number = 'cn', chinese_to_int(match.group('cn'))
+            else:
+                family, number = 'ar', int(match.group('ar'))
+            if number:
+                markers[family].append((number, match.start(), match.end()))
+
+        family_markers = markers['cn'] or markers['ar']
+
+        segments = {}
+        for i, (number, start, body_start) in enumerate(family_markers):
+            end = family_markers[i + 1][1] if i + 1 < len(family_markers) else len(self.text)
+            if number in segments:
+                continue
+            # 跳过编号后的空白
+            while body_start < end and self.text[body_start].isspace():
+                body_start += 1
+            segments[number] = {
+                'number': number,
+                'start': start,
+                'body_start': body_start,
+                'end': end
+            }
+        return [segments[number] for number in sorted(segments)]
+
+    def __len__(self):
+        return len(self.segments)
+
+    def topic_text(self, i):
+        """议题内容：编号之后到第一个分隔标点为止"""
+        segment = self.segments[i]
+        match = TOPIC_END.search(self.text, segment['body_start'], segment['end'])
+        stop = match.start() if match else segment['end']
+        return self.text[segment['body_start']:stop].strip()
+
+    def segment_text(self, i):
+        """议题片段：编号之后到句号、分号或下一个议题为止"""
+        segment = self.segments[i]
+        match = SEGMENT_END.search(self.text, segment['body_start'], segment['end'])
+        stop = match.start() if match else segment['end']
+        return self.text[segment['body_start']:stop]
+
+
+def build_topic_index(text):
+    """构建议题分段索引"""
+    return TopicIndex(text)
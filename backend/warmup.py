@@ -0,0 +1,137 @@
+import io
+import logging
+import threading
+import time
+
+import config
+from keyword_matcher import get_meeting_type_matcher
+from meeting_classifier import get_meeting_classifier
+from ollama_client import get_ollama_client
+from word_generator import create_document_generator
+
+logger = logging.getLogger(__name__)
+
+STEP_PENDING = 'pending'
+STEP_DONE = 'done'
+STEP_FAILED = 'failed'
+STEP_SKIPPED = 'skipped'
+
+# 失败后不影响就绪的步骤
+OPTIONAL_STEPS = frozenset({'ollama'})
+
+# 预热用的示例会议记录：覆盖主题、主持人、地点、参会人员和议题等主要字段
+WARMUP_TEXT = (
+    "会议主题：季度工作推进会\n"
+    "主持人：张伟\n"
+    "会议地点：第一会议室\n"
+    "参会人员：张伟、李娜、王强\n"
+    "会议时长：60分钟\n"
+    "一、项目进度汇报\n李娜负责，需要准备进度报告和风险清单。\n"
+    "二、下季度计划\n王强负责，需要准备预算草案。\n"
+)
+
+
+class WarmupState:
+    """预热进度：各步骤的状态与耗时，供就绪检查使用"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._steps = {}
+        self.enabled = True
+
+    def begin(self, name):
+        with self._lock:
+            self._steps[name] = {'status': STEP_PENDING, 'duration_ms': None, 'error': None}
+
+    def finish(self, name, status, duration=None, error=None):
+        with self._lock:
+            self._steps[name] = {
+                'status': status,
+                'duration_ms': round(duration * 1000, 1) if duration is not None else None,
+                'error': error
+            }
+
+    @property
+    def ready(self):
+        return self.to_dict()['ready']
+
+    def to_dict(self):
+        with self._lock:
+            steps = {name: dict(step) for name, step in self._steps.items()}
+        # 所有步骤都已结束，且必需步骤没有失败（Ollama 不可用时请求仍可退回直接解析）
+        ready = all(step['status'] != STEP_PENDING and
+                    (step['status'] != STEP_FAILED or name in OPTIONAL_STEPS)
+                    for name, step in steps.items())
+        return {'enabled': self.enabled, 'ready': ready, 'steps': steps}
+
+
+_state = WarmupState()
+
+
+def get_warmup_state():
+    """获取本进程的预热状态"""
+    return _state
+
+
+def _run_step(name, fn):
+    _state.begin(name)
+    start = time.perf_counter()
+    try:
+        skipped = fn() is False
+    except Exception as e:
+        logger.warning("预热步骤 %s 失败: %s", name, e)
+        _state.finish(name, STEP_FAILED, time.perf_counter() - start, str(e))
+        return False
+    duration = time.perf_counter() - start
+    status = STEP_SKIPPED if skipped else STEP_DONE
+    _state.finish(name, status, duration)
+    logger.info("预热步骤 %s %s（%.1f ms）", name, status, duration * 1000)
+    return True
+
+
+def warm_up_local(parse):
+    """
+    预热不依赖外部服务的部分：正则与关键词自动机（及会议类型分类模型）、解析路径上的惰性缓存、文档模板与渲染器
+
+    这些状态在 preload 模式下由主进程构建一次，fork 出的工作进程直接继承。
+
+    :param parse: 会议文本解析函数（app.parse_meeting_info），用示例文本走一遍解析路径
+    """
+    meeting_info = {}
+
+    def patterns():
+        get_meeting_type_matcher()
+        get_meeting_classifier()
+        meeting_info.update(parse(WARMUP_TEXT))
+
+    def document():
+        generator = create_document_generator(config.DOCUMENT_RENDERER, config.DOCX_TEMPLATE_PATH or None)
+        generator.create_meeting_document(meeting_info or parse(WARMUP_TEXT), io.BytesIO())
+
+    _run_step('patterns', patterns)
+    _run_step('document', document)
+
+
+def warm_up_ollama():
+    """建立到 Ollama 的连接并把模型加载进内存；命令行方式没有可预热的连接，跳过"""
+    def ollama():
+        client = get_ollama_client()
+        load_model = getattr(client, 'load_model', None)
+        if load_model is None:
+            return False
+        load_model(config.OLLAMA_MODEL)
+
+    _run_step('ollama', ollama)
+
+
+def start_ollama_warmup():
+    """
+    在后台线程预热 Ollama，立即返回
+
+    模型加载可能需要数十秒，不阻塞进程启动；完成前就绪检查返回未就绪。
+    连接不能跨 fork 共享，preload 模式下须在工作进程内（post_fork 之后）调用。
+    """
+    _state.begin('ollama')
+    thread = threading.Thread(target=warm_up_ollama, name='ollama-warmup', daemon=True)
+    thread.start()
+    return thread
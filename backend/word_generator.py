@@ -3,13 +3,39 @@ from docx.shared import Inches, Pt, RGBColor, Cm
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT, WD_ALIGN_VERTICAL
+from docx.table import _Cell
+from docx.text.paragraph import Paragraph
+import copy
+import io
 import os
+import threading
+
+# 各类文字的格式：字体、字号、加粗、颜色
+RUN_FORMATS = {
+    'title': {'font': '微软雅黑', 'size': 24, 'bold': True, 'color': (31, 73, 125)},
+    'header': {'font': '微软雅黑', 'size': 14, 'bold': True, 'color': (59, 89, 152)},
+    'topic': {'font': '宋体', 'size': 12, 'bold': True},
+    'body': {'font': '宋体', 'size': 12},
+}
+
+# 预置模板中的命名样式（段落样式名, 对应的文字格式）
+TEMPLATE_STYLES = {
+    'title': ('会议记录标题', WD_ALIGN_PARAGRAPH.CENTER, None),
+    'header': ('会议内容表头', WD_ALIGN_PARAGRAPH.CENTER, None),
+    'topic': ('会议议题', None, None),
+    'detail': ('会议议题详情', None, Cm(1.0)),
+}
+
 
 class WordMeetingGenerator:
     def __init__(self):
         """初始化Word文档生成器"""
         self.document = None
     
+    def _new_document(self):
+        """创建空白文档（python-docx 默认模板）"""
+        return Document()
+    
     def _setup_document_styles(self):
         """设置文档样式"""
         # 获取样式集合
@@ -29,24 +55,45 @@ class WordMeetingGenerator:
         except KeyError:
             pass
     
-    def create_meeting_document(self, meeting_info, output_path):
+    def _format_run(self, run, kind):
+        """设置文字格式（逐个 run 设置字体属性）"""
+        run_format = RUN_FORMATS[kind]
+        run.font.name = run_format['font']
+        run.font.size = Pt(run_format['size'])
+        if run_format.get('bold'):
+            run.font.bold = True
+        if run_format.get('color'):
+            run.font.color.rgb = RGBColor(*run_format['color'])
+    
+    def _format_paragraph(self, paragraph, kind):
+        """设置段落格式（对齐、缩进）"""
+        if kind in ('title', 'header'):
+            paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        elif kind == 'detail':
+            paragraph.paragraph_format.left_indent = Cm(1.0)
+    
+    def _format_cell_runs(self, cell):
+        """设置单元格内所有文字为正文格式"""
+        for paragraph in cell.paragraphs:
+            for run in paragraph.runs:
+                self._format_run(run, 'body')
+    
+    def create_meeting_document(self, meeting_info, output):
         """
         创建会议记录文档（表格形式）
         
         :param meeting_info: 会议信息字典
-        :param output_path: 输出文件路径
+        :param output: 输出文件路径，或可写的文件对象（如 BytesIO）
+        :return: 传入的 output
         """
         # 每次创建文档时使用新的Document实例
-        self.document = Document()
+        self.document = self._new_document()
         self._setup_document_styles()
         # 设置文档标题
         title_para = self.document.add_paragraph()
         title_run = title_para.add_run("会议记录")
-        title_run.font.name = '微软雅黑'
-        title_run.font.size = Pt(24)
-        title_run.font.bold = True
-        title_run.font.color.rgb = RGBColor(31, 73, 125)
-        title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        self._format_run(title_run, 'title')
+        self._format_paragraph(title_para, 'title')
         
         # 添加空行
         self.document.add_paragraph()
@@ -57,11 +104,12 @@ class WordMeetingGenerator:
         # 创建会议内容记录表格
         self._create_content_table(meeting_info)
         
-        # 保存文档
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        self.document.save(output_path)
+        # 保存文档（文件对象直接写入，不落盘）
+        if isinstance(output, (str, os.PathLike)):
+            os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        self.document.save(output)
         
-        return output_path
+        return output
     
     def _create_basic_info_table(self, meeting_info):
         """
@@ -88,8 +136,7 @@ class WordMeetingGenerator:
         
         # 添加主题内容
         theme_run = theme_cell.paragraphs[0].add_run(meeting_info.get('theme', '未指定'))
-        theme_run.font.name = '宋体'
-        theme_run.font.size = Pt(12)
+        self._format_run(theme_run, 'body')
         
         # 设置主持人行
         host_cell = table.cell(1, 0)
@@ -97,8 +144,7 @@ class WordMeetingGenerator:
         
         # 添加主持人内容
         host_run = host_cell.paragraphs[0].add_run(meeting_info.get('host', '未指定'))
-        host_run.font.name = '宋体'
-        host_run.font.size = Pt(12)
+        self._format_run(host_run, 'body')
         
         # 会议地点行 - 确保使用正确的提取信息
         location_cell = table.cell(2, 0)
@@ -107,8 +153,7 @@ class WordMeetingGenerator:
         # 添加会议地点内容
         location_value = meeting_info.get('location', '未指定')
         location_run = location_cell.paragraphs[0].add_run(location_value)
-        location_run.font.name = '宋体'
-        location_run.font.size = Pt(12)
+        self._format_run(location_run, 'body')
         
         # 会议时长行 - 确保使用正确的提取信息
         duration_cell = table.cell(2, 1)
@@ -117,8 +162,7 @@ class WordMeetingGenerator:
         # 添加会议时长内容
         duration_value = meeting_info.get('duration', '未指定')
         duration_run = duration_cell.paragraphs[0].add_run(duration_value)
-        duration_run.font.name = '宋体'
-        duration_run.font.size = Pt(12)
+        self._format_run(duration_run, 'body')
         
         # 添加空行
         self.document.add_paragraph()
@@ -142,16 +186,10 @@ class WordMeetingGenerator:
         
         # 设置字体
         for cell in attendees_table.columns[0].cells:
-            for paragraph in cell.paragraphs:
-                for run in paragraph.runs:
-                    run.font.name = '宋体'
-                    run.font.size = Pt(12)
+            self._format_cell_runs(cell)
         
         for cell in attendees_table.columns[1].cells:
-            for paragraph in cell.paragraphs:
-                for run in paragraph.runs:
-                    run.font.name = '宋体'
-                    run.font.size = Pt(12)
+            self._format_cell_runs(cell)
         
         # 添加空行
         self.document.add_paragraph()
@@ -160,75 +198,77 @@ class WordMeetingGenerator:
         """
         创建会议内容记录表格
         
+        表格先只建表头与末行，议题行逐行复制插入在末行之前，不经过 table.cell() / merge()
+        （二者每次都要遍历整张表格）。第一个议题行按常规方式设置格式，之后的议题行复制
+        这一行、只替换三段文字，不再逐个创建段落与格式元素；耗时随议题数线性增长。
+        
         :param meeting_info: 会议信息字典
         """
         topics = meeting_info.get('topics', [])
         
-        # 计算需要的行数：表头 + 每个议题 + 会前准备事项
-        num_rows = 2 + len(topics)  # 1行表头 + 至少1行内容
-        
-        # 创建内容表格（2列：左侧为标签，右侧为内容）
-        table = self.document.add_table(rows=num_rows, cols=2)
+        # 创建内容表格（2列：左侧为标签，右侧为内容）：表头 + 末行（会前准备事项或空行）
+        table = self.document.add_table(rows=2, cols=2)
         table.alignment = WD_TABLE_ALIGNMENT.LEFT
+        header_tr, last_tr = table._tbl.tr_lst
         
-        # 设置表格宽度
-        table.cell(0, 0).merge(table.cell(0, 1))  # 合并表头
+        # 合并表头；合并后的空行即整行单元格的原型
+        table.cell(0, 0).merge(table.cell(0, 1))
+        merged_row = copy.deepcopy(header_tr)
         
         # 设置表头样式和内容
-        header_cell = table.cell(0, 0)
-        header_paragraph = header_cell.paragraphs[0]
+        header_paragraph = Paragraph(header_tr.tc_lst[0].p_lst[0], table)
         header_run = header_paragraph.add_run("会议内容记录")
-        header_run.font.name = '微软雅黑'
-        header_run.font.size = Pt(14)
-        header_run.font.bold = True
-        header_run.font.color.rgb = RGBColor(59, 89, 152)
-        header_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        self._format_run(header_run, 'header')
+        self._format_paragraph(header_paragraph, 'header')
         
-        # 设置议题内容
+        # 设置议题内容：每个议题一整行（议题、负责人、会前准备三个段落）
+        topic_row = None
         for i, topic in enumerate(topics, 1):
-            # 当前议题的行索引
-            topic_row_index = i
+            texts = (
+                f"议题{i}：{topic.get('topic', '')}",
+                f"负责人：{topic.get('leader', '未指定')}",
+                f"会前准备：{topic.get('preparation', '无')}"
+            )
+            if topic_row is None:
+                topic_cell = self._insert_merged_row(table, merged_row, last_tr)
+                self._fill_topic_cell(topic_cell, texts)
+                topic_row = topic_cell._tc.getparent()
+                continue
+            tr = copy.deepcopy(topic_row)
+            last_tr.addprevious(tr)
+            for p, text in zip(tr.tc_lst[0].p_lst, texts):
+                p.r_lst[0].text = text
+        
+        # 添加会前准备事项（如果有），合并最后一行；否则末行保留为两个空单元格
+        if meeting_info.get('preparation_items', '') and topics:
+            prep_cell = self._insert_merged_row(table, merged_row, last_tr)
+            table._tbl.remove(last_tr)
             
-            # 议题内容单元格
-            topic_cell = table.cell(topic_row_index, 0)
-            topic_cell.merge(table.cell(topic_row_index, 1))  # 合并整行
-            
-            # 创建议题内容段落
-            topic_para = topic_cell.paragraphs[0]
-            topic_run = topic_para.add_run(f"议题{i}：{topic.get('topic', '')}")
-            topic_run.font.name = '宋体'
-            topic_run.font.size = Pt(12)
-            topic_run.font.bold = True
-            
-            # 负责人信息（在同一单元格内添加新段落）- 移除英文标签，确保使用正确的提取信息
-            leader_value = topic.get('leader', '未指定')
-            leader_para = topic_cell.add_paragraph()
-            leader_para.paragraph_format.left_indent = Cm(1.0)
-            leader_run = leader_para.add_run(f"负责人：{leader_value}")
-            leader_run.font.name = '宋体'
-            leader_run.font.size = Pt(12)
-            
-            # 会前准备信息
-            preparation_value = topic.get('preparation', '无')
-            prep_para = topic_cell.add_paragraph()
-            prep_para.paragraph_format.left_indent = Cm(1.0)
-            prep_run = prep_para.add_run(f"会前准备：{preparation_value}")
-            prep_run.font.name = '宋体'
-            prep_run.font.size = Pt(12)
-        
-        # 添加会前准备事项（如果有）
-        if meeting_info.get('preparation_items', '') and num_rows > 2:
-            last_row_index = num_rows - 1
-            
-            # 合并最后一行
-            prep_cell = table.cell(last_row_index, 0)
-            prep_cell.merge(table.cell(last_row_index, 1))
-            
-            # 设置会前准备事项内容
             prep_para = prep_cell.paragraphs[0]
             prep_run = prep_para.add_run(f"会前准备事项：{meeting_info.get('preparation_items')}")
-            prep_run.font.name = '宋体'
-            prep_run.font.size = Pt(12)
+            self._format_run(prep_run, 'body')
+    
+    def _fill_topic_cell(self, topic_cell, texts):
+        """填写议题单元格：议题段落 + 负责人、会前准备两个详情段落（每段一个 run）"""
+        topic_text, leader_text, preparation_text = texts
+        topic_para = topic_cell.paragraphs[0]
+        topic_run = topic_para.add_run(topic_text)
+        self._format_run(topic_run, 'topic')
+        self._format_paragraph(topic_para, 'topic')
+        
+        # 负责人、会前准备信息（在同一单元格内添加新段落）
+        for text in (leader_text, preparation_text):
+            detail_para = topic_cell.add_paragraph()
+            self._format_paragraph(detail_para, 'detail')
+            detail_run = detail_para.add_run(text)
+            self._format_run(detail_run, 'body')
+    
+    @staticmethod
+    def _insert_merged_row(table, merged_row, before_tr):
+        """在 before_tr 之前插入一行整行合并的空单元格，返回该单元格"""
+        tr = copy.deepcopy(merged_row)
+        before_tr.addprevious(tr)
+        return _Cell(tr.tc_lst[0], table)
     
     def _add_section(self, title, content):
         """添加一个文档章节（备用方法，当前不使用）"""
@@ -247,4 +287,132 @@ class WordMeetingGenerator:
         content_run = content_para.add_run(content)
         content_run.font.name = '宋体'
         content_run.font.size = Pt(12)
-        content_para.paragraph_format.left_indent = Inches(0.25)
\ No newline at end of file
+        content_para.paragraph_format.left_indent = Inches(0.25)
+
+
+def build_base_template():
+    """
+    构建预置样式的基础模板（DOCX 字节）
+    
+    正文样式（Normal）即宋体 12 磅，标题、表头、议题、议题详情定义为命名段落样式，
+    渲染时只需引用样式，不再逐个 run 设置字体。
+    """
+    generator = WordMeetingGenerator()
+    generator.document = Document()
+    generator._setup_document_styles()
+    styles = generator.document.styles
+    
+    for kind, (name, alignment, left_indent) in TEMPLATE_STYLES.items():
+        style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = styles['Normal']
+        run_format = RUN_FORMATS.get(kind, RUN_FORMATS['body'])
+        style.font.name = run_format['font']
+        style.font.size = Pt(run_format['size'])
+        if run_format.get('bold'):
+            style.font.bold = True
+        if run_format.get('color'):
+            style.font.color.rgb = RGBColor(*run_format['color'])
+        if alignment is not None:
+            style.paragraph_format.alignment = alignment
+        if left_indent is not None:
+            style.paragraph_format.left_indent = left_indent
+    
+    buffer = io.BytesIO()
+    generator.document.save(buffer)
+    return buffer.getvalue()
+
+
+_template_lock = threading.Lock()
+# 内置模板的键为 None，自定义模板按绝对路径区分
+_template_bytes = {}
+
+
+def get_base_template(template_path=None):
+    """
+    获取基础模板（每个进程对每个模板只构建 / 读取一次）
+    
+    :param template_path: 自定义模板路径（需包含 TEMPLATE_STYLES 中的样式），为空时使用内置模板
+    """
+    key = os.path.abspath(template_path) if template_path else None
+    template = _template_bytes.get(key)
+    if template is None:
+        with _template_lock:
+            template = _template_bytes.get(key)
+            if template is None:
+                if key:
+                    with open(key, 'rb') as f:
+                        template = f.read()
+                else:
+                    template = build_base_template()
+                _template_bytes[key] = template
+    return template
+
+
+class TemplateWordMeetingGenerator(WordMeetingGenerator):
+    """基于预置样式模板的快速生成器
+    
+    每个线程只解析一次基础模板，之后每次渲染只重置正文（body），
+    样式已在模板中定义好，渲染时只填充内容并引用命名样式。
+    """
+    
+    _local = threading.local()
+    
+    def __init__(self, template_path=None):
+        super().__init__()
+        self.template_path = template_path
+        self._style_ids = {}
+    
+    def _new_document(self):
+        cached = getattr(self._local, 'documents', None)
+        if cached is None:
+            cached = self._local.documents = {}
+        
+        entry = cached.get(self.template_path)
+        if entry is None:
+            document = Document(io.BytesIO(get_base_template(self.template_path)))
+            body = document.element.body
+            pristine = [copy.deepcopy(child) for child in body]
+            style_ids = {kind: document.styles[name].style_id
+                         for kind, (name, _, _) in TEMPLATE_STYLES.items()}
+            entry = cached[self.template_path] = (document, pristine, style_ids)
+        
+        document, pristine, self._style_ids = entry
+        # 重置正文为模板初始内容（通常只有分节属性 sectPr）
+        # clear() 直接释放上一份文档的子树；逐个 remove() 要遍历整棵子树，议题多时很慢
+        body = document.element.body
+        body.clear()
+        for child in pristine:
+            body.append(copy.deepcopy(child))
+        return document
+    
+    def _setup_document_styles(self):
+        """样式已在模板中定义"""
+    
+    def _format_run(self, run, kind):
+        """文字格式由段落样式决定，正文沿用 Normal 样式"""
+    
+    def _format_paragraph(self, paragraph, kind):
+        style_id = self._style_ids.get(kind)
+        if style_id is not None:
+            # 直接写入样式 ID，避免 paragraph.style 每次按名称查找样式
+            paragraph._p.style = style_id
+    
+    def _format_cell_runs(self, cell):
+        """单元格文字沿用 Normal 样式"""
+
+
+def create_document_generator(renderer='template', template_path=None):
+    """
+    按名称创建文档生成器
+    
+    :param renderer: classic（逐个 run 设置格式）、template（预置样式模板）
+                     或 ooxml（直接输出 OOXML，见 ooxml_renderer）
+    """
+    if renderer == 'ooxml':
+        from ooxml_renderer import OoxmlMeetingRenderer
+        return OoxmlMeetingRenderer(template_path)
+    if renderer == 'classic':
+        return WordMeetingGenerator()
+    if renderer == 'template':
+        return TemplateWordMeetingGenerator(template_path)
+    raise ValueError(f"未知的文档渲染器: {renderer}")